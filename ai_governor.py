@@ -0,0 +1,179 @@
+"""
+Gemini Call Governor
+모든 Gemini 모델 호출의 지연 시간/토큰 사용량 기록 및 호출 예산 관리
+"""
+
+import threading
+import time
+from collections import deque
+from datetime import date
+
+import config
+from storage import load_json, save_json
+
+
+PRIORITY_INTERACTIVE = 0   # 사용자가 기다리는 호출 (AI 검색 제안 등)
+PRIORITY_BACKGROUND = 1    # 유휴 시간 작업 (분위기 태깅, 사전 생성 등)
+
+
+class AIBudgetExceeded(Exception):
+    """호출 예산 초과"""
+
+
+class GeminiGovernor:
+    """Gemini 호출 관리 클래스
+
+    분당/일일 호출 수를 제한하며, 백그라운드 호출은 예산의 일부만 사용할 수
+    있어 대화형 호출이 항상 우선한다. 일일 호출 수와 토큰 사용량은 파일로
+    저장되어 재시작 후에도 유지된다.
+    """
+
+    def __init__(self, per_minute=config.AI_CALLS_PER_MINUTE, per_day=config.AI_CALLS_PER_DAY,
+                 background_share=config.AI_BACKGROUND_BUDGET_SHARE):
+        self.per_minute = per_minute
+        self.per_day = per_day
+        self.background_share = background_share
+
+        self._lock = threading.Lock()
+        self.recent_calls = deque()  # monotonic timestamps within the last minute
+        self.latencies = {}          # kind -> deque of seconds
+        self.kind_stats = {}         # kind -> {'calls', 'errors', 'prompt_tokens', 'response_tokens'}
+        self.interactive_in_flight = 0
+
+        data = load_json(config.AI_USAGE_FILE, {})
+        data = data if isinstance(data, dict) else {}
+        self.usage = data if data.get('date') == date.today().isoformat() else self._empty_usage()
+
+    def _empty_usage(self):
+        """오늘 날짜의 빈 사용량 기록"""
+        return {
+            'date': date.today().isoformat(),
+            'calls': 0,
+            'background_calls': 0,
+            'prompt_tokens': 0,
+            'response_tokens': 0,
+        }
+
+    def _reserve(self, priority):
+        """예산 확인 및 호출 1회 예약 (초과 시 AIBudgetExceeded)"""
+        now = time.monotonic()
+
+        with self._lock:
+            if self.usage['date'] != date.today().isoformat():
+                self.usage = self._empty_usage()
+
+            while self.recent_calls and now - self.recent_calls[0] > 60:
+                self.recent_calls.popleft()
+
+            minute_limit = self.per_minute
+            day_limit = self.per_day
+            if priority == PRIORITY_BACKGROUND:
+                if self.interactive_in_flight:
+                    raise AIBudgetExceeded("interactive call in flight")
+                minute_limit = int(self.per_minute * self.background_share)
+                day_limit = int(self.per_day * self.background_share)
+                if self.usage['background_calls'] >= day_limit:
+                    raise AIBudgetExceeded("daily background budget exhausted")
+
+            if len(self.recent_calls) >= minute_limit:
+                raise AIBudgetExceeded("per-minute budget exhausted")
+            if self.usage['calls'] >= self.per_day:
+                raise AIBudgetExceeded("daily budget exhausted")
+
+            self.recent_calls.append(now)
+            self.usage['calls'] += 1
+            if priority == PRIORITY_BACKGROUND:
+                self.usage['background_calls'] += 1
+            else:
+                self.interactive_in_flight += 1
+
+    def generate(self, model, contents, kind, priority=PRIORITY_INTERACTIVE, **kwargs):
+        """
+        예산 확인 후 model.generate_content 호출
+
+        Args:
+            model: genai.GenerativeModel
+            contents: 프롬프트
+            kind (str): 호출 종류 (통계 분류용, 예: 'suggestions')
+            priority (int): PRIORITY_INTERACTIVE 또는 PRIORITY_BACKGROUND
+            **kwargs: generate_content에 전달할 인자
+
+        Returns:
+            generate_content 응답
+
+        Raises:
+            AIBudgetExceeded: 호출 예산 초과
+        """
+        self._reserve(priority)
+
+        start = time.monotonic()
+        response = None
+        try:
+            response = model.generate_content(contents, **kwargs)
+            return response
+        finally:
+            self._record(kind, priority, time.monotonic() - start, response)
+
+    def _record(self, kind, priority, elapsed, response):
+        """호출 결과 기록"""
+        usage = getattr(response, 'usage_metadata', None)
+        prompt_tokens = getattr(usage, 'prompt_token_count', 0) or 0
+        response_tokens = getattr(usage, 'candidates_token_count', 0) or 0
+
+        with self._lock:
+            if priority != PRIORITY_BACKGROUND:
+                self.interactive_in_flight -= 1
+
+            stats = self.kind_stats.setdefault(
+                kind, {'calls': 0, 'errors': 0, 'prompt_tokens': 0, 'response_tokens': 0}
+            )
+            stats['calls'] += 1
+            stats['prompt_tokens'] += prompt_tokens
+            stats['response_tokens'] += response_tokens
+            if response is None:
+                stats['errors'] += 1
+
+            self.latencies.setdefault(kind, deque(maxlen=200)).append(elapsed)
+
+            self.usage['prompt_tokens'] += prompt_tokens
+            self.usage['response_tokens'] += response_tokens
+            usage_snapshot = dict(self.usage)
+
+        save_json(config.AI_USAGE_FILE, usage_snapshot)
+
+        if config.DEBUG_MODE:
+            print(f"🤖 Gemini {kind}: {elapsed * 1000:.0f}ms, {prompt_tokens}+{response_tokens} tokens")
+
+    def stats(self):
+        """
+        호출 통계
+
+        Returns:
+            dict: 오늘 사용량, 호출 종류별 지연 시간 백분위수 및 토큰 수
+        """
+        with self._lock:
+            kinds = {}
+            for kind, stats in self.kind_stats.items():
+                latencies = sorted(self.latencies.get(kind, ()))
+                kinds[kind] = dict(
+                    stats,
+                    p50_ms=_percentile_ms(latencies, 50),
+                    p90_ms=_percentile_ms(latencies, 90),
+                    p99_ms=_percentile_ms(latencies, 99),
+                )
+
+            return {
+                'today': dict(self.usage),
+                'calls_last_minute': len(self.recent_calls),
+                'per_minute_limit': self.per_minute,
+                'per_day_limit': self.per_day,
+                'kinds': kinds,
+            }
+
+
+def _percentile_ms(sorted_values, percent):
+    """정렬된 값의 백분위수 (nearest-rank, 밀리초)"""
+    if not sorted_values:
+        return 0
+    rank = max(0, min(len(sorted_values) - 1, int(round(percent / 100.0 * len(sorted_values))) - 1))
+    return int(sorted_values[rank] * 1000)
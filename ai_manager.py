@@ -8,18 +8,57 @@ from PyQt6.QtCore import QObject, pyqtSignal
 import config
 import json
 import re
+import time
+from ai_governor import AIBudgetExceeded, GeminiGovernor, PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+from prompt_history import PromptHistory, normalize_prompt
+from suggestion_engine import SuggestionEngine
 
 
 class AIManager(QObject):
     """Gemini AI 관리 클래스"""
     
+    MOODS = ('happy', 'sad', 'energetic', 'calm', 'melancholic', 'upbeat')
+    ENERGY_LEVELS = ('low', 'medium', 'high')
+    
+    # Structured output schema for batch mood analysis
+    MOOD_BATCH_SCHEMA = {
+        'type': 'array',
+        'items': {
+            'type': 'object',
+            'properties': {
+                'index': {'type': 'integer'},
+                'mood': {'type': 'string', 'enum': list(MOODS)},
+                'energy': {'type': 'string', 'enum': list(ENERGY_LEVELS)},
+                'tags': {'type': 'array', 'items': {'type': 'string'}},
+            },
+            'required': ['index', 'mood', 'energy', 'tags'],
+        },
+    }
+    
     # Signals
     suggestion_ready = pyqtSignal(list)
     error_occurred = pyqtSignal(str)
     
+    # Structured output schema for batch playlist descriptions
+    DESCRIPTION_BATCH_SCHEMA = {
+        'type': 'array',
+        'items': {
+            'type': 'object',
+            'properties': {
+                'index': {'type': 'integer'},
+                'description': {'type': 'string'},
+            },
+            'required': ['index', 'description'],
+        },
+    }
+    
     def __init__(self):
         super().__init__()
         self.model = None
+        self.suggestion_engine = SuggestionEngine()
+        self.prompt_history = PromptHistory()
+        self.suggestion_cache = {}  # normalized prompt -> (expires_at, suggestions)
+        self.governor = GeminiGovernor()
         self.setup_ai()
         
     def setup_ai(self):
@@ -34,41 +73,89 @@ class AIManager(QObject):
             print(f"❌ {error_msg}")
             self.error_occurred.emit(error_msg)
     
-    def generate_music_suggestions(self, user_input):
+    def generate_music_suggestions(self, user_input, timeout=None, cache_ttl=config.AI_SUGGESTION_CACHE_TTL,
+                                   priority=PRIORITY_INTERACTIVE):
         """
         사용자 입력을 기반으로 음악 검색 제안 생성
         
         Args:
             user_input (str): 사용자 입력 (예: "비오는 날 듣기 좋은 음악")
+            timeout (float): 모델 호출 제한 시간 (초, None이면 무제한)
+            cache_ttl (int): 생성된 제안의 캐시 유지 시간 (초)
+            priority (int): 호출 우선순위 (ai_governor.PRIORITY_*)
             
         Returns:
             list: 4개의 검색 제안
+            
+        Raises:
+            AIBudgetExceeded: 백그라운드 호출의 예산 초과 (기본 제안으로 대체하지 않음)
         """
+        cached = self.get_cached_suggestions(user_input)
+        if cached:
+            print(f"⚡ Using cached AI suggestions for: '{user_input}'")
+            self.suggestion_ready.emit(cached)
+            return cached
+        
         if not self.model:
             print("❌ AI model not initialized")
-            return self._get_default_suggestions()
+            return self._get_default_suggestions(user_input)
         
         try:
             prompt = self._create_prompt(user_input)
             
             print(f"🤖 Generating AI suggestions for: '{user_input}'")
-            response = self.model.generate_content(prompt)
+            request_options = {'timeout': timeout} if timeout else None
+            response = self.governor.generate(
+                self.model, prompt, 'suggestions', priority, request_options=request_options
+            )
             
             suggestions = self._parse_suggestions(response.text)
             
             if suggestions and len(suggestions) >= 4:
                 print(f"✅ Generated {len(suggestions)} suggestions")
+                self.suggestion_cache[normalize_prompt(user_input)] = (time.time() + cache_ttl, suggestions)
                 self.suggestion_ready.emit(suggestions)
                 return suggestions
             else:
                 print("⚠️  Invalid AI response, using defaults")
-                return self._get_default_suggestions()
+                return self._get_default_suggestions(user_input)
                 
         except Exception as e:
+            if isinstance(e, AIBudgetExceeded) and priority == PRIORITY_BACKGROUND:
+                raise
             error_msg = f"AI suggestion generation failed: {e}"
             print(f"❌ {error_msg}")
             self.error_occurred.emit(error_msg)
-            return self._get_default_suggestions()
+            return self._get_default_suggestions(user_input)
+    
+    def get_cached_suggestions(self, user_input):
+        """캐시된 제안 반환 (없거나 만료되면 None)"""
+        entry = self.suggestion_cache.get(normalize_prompt(user_input))
+        if not entry:
+            return None
+        
+        expires_at, suggestions = entry
+        if expires_at < time.time():
+            self.suggestion_cache.pop(normalize_prompt(user_input), None)
+            return None
+        return suggestions
+    
+    def has_cached_suggestions(self, user_input):
+        """캐시된 제안이 있는지 확인"""
+        return self.get_cached_suggestions(user_input) is not None
+    
+    def record_prompt(self, user_input):
+        """사용자 프롬프트 기록 (시간대별 사전 생성 예측용)"""
+        self.prompt_history.record(user_input)
+    
+    def get_diagnostics(self):
+        """AI 호출 통계 (진단용)"""
+        return {
+            'model_ready': self.model is not None,
+            'governor': self.governor.stats(),
+            'cached_suggestions': len(self.suggestion_cache),
+            'prewarm_budget_left': self.prompt_history.remaining_budget(),
+        }
     
     def _create_prompt(self, user_input):
         """프롬프트 생성"""
@@ -126,14 +213,21 @@ Now generate 4 search queries for the user's input. Return ONLY the JSON array,
             print(f"❌ Error parsing suggestions: {e}")
             return None
     
-    def _get_default_suggestions(self):
-        """기본 제안 (AI 실패시)"""
-        defaults = [
-            "popular tracks",
-            "new releases",
-            "top hits 2024",
-            "trending now"
-        ]
+    def quick_suggestions(self, user_input):
+        """
+        로컬 규칙 기반 즉시 제안 (모델 응답 전 임시 표시용)
+        
+        Args:
+            user_input (str): 사용자 입력
+            
+        Returns:
+            list: 4개의 검색 제안
+        """
+        return self.suggestion_engine.suggest(user_input, count=config.MAX_AI_SUGGESTIONS)
+    
+    def _get_default_suggestions(self, user_input=None):
+        """기본 제안 (AI 실패시 로컬 규칙 기반 제안 사용)"""
+        defaults = self.quick_suggestions(user_input)
         self.suggestion_ready.emit(defaults)
         return defaults
     
@@ -169,13 +263,84 @@ Total tracks: {len(tracks)}
 Generate a 1-2 sentence description that captures the mood and style of this playlist.
 """
             
-            response = self.model.generate_content(prompt)
+            response = self.governor.generate(self.model, prompt, 'playlist_description')
             return response.text.strip()
             
         except Exception as e:
             print(f"❌ Failed to generate description: {e}")
             return f"A collection of {len(tracks)} tracks"
     
+    def generate_playlist_descriptions_batch(self, playlists):
+        """
+        여러 플레이리스트의 설명을 한 번의 프롬프트로 생성
+        
+        Args:
+            playlists (list): (playlist dict, 샘플 트랙 리스트) 튜플 리스트
+            
+        Returns:
+            dict: {playlist_id: 설명} (실패한 플레이리스트는 제외)
+        """
+        if not self.model or not playlists:
+            return {}
+        
+        blocks = []
+        ids = []
+        for playlist, tracks in playlists:
+            if not playlist or not playlist.get('id'):
+                continue
+            samples = []
+            for track in tracks[:5]:
+                if track:
+                    artist = (track.get('artists') or [{}])[0].get('name', 'Unknown')
+                    samples.append(f"{track.get('name', 'Unknown')} by {artist}")
+            ids.append(playlist['id'])
+            total = playlist.get('tracks', {}).get('total', len(tracks))
+            blocks.append(
+                f"{len(ids)}. {playlist.get('name', 'Untitled')} ({total} tracks): {', '.join(samples)}"
+            )
+        
+        if not ids:
+            return {}
+        
+        prompt = f"""Generate a short, engaging description for each music playlist below.
+
+Playlists (name, size and sample tracks):
+{chr(10).join(blocks)}
+
+For every playlist return an object with:
+- index: the playlist number from the list
+- description: 1-2 sentences capturing the mood and style of the playlist
+"""
+        
+        try:
+            print(f"🤖 Describing {len(ids)} playlists")
+            response = self.governor.generate(
+                self.model,
+                prompt,
+                'playlist_description_batch',
+                PRIORITY_BACKGROUND,
+                generation_config=genai.GenerationConfig(
+                    response_mime_type='application/json',
+                    response_schema=self.DESCRIPTION_BATCH_SCHEMA,
+                ),
+            )
+            items = self._extract_json(response.text)
+            
+        except Exception as e:
+            print(f"❌ Batch playlist description failed: {e}")
+            return {}
+        
+        results = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            index = item.get('index')
+            description = str(item.get('description', '')).strip()
+            if isinstance(index, int) and 1 <= index <= len(ids) and description:
+                results[ids[index - 1]] = description
+        
+        return results
+    
     def analyze_mood(self, track_name, artist_name):
         """
         트랙의 분위기 분석 (추가 기능)
@@ -206,10 +371,114 @@ Example output:
 Return ONLY the JSON object.
 """
             
-            response = self.model.generate_content(prompt)
-            result = json.loads(response.text.strip())
+            response = self.governor.generate(self.model, prompt, 'mood', PRIORITY_BACKGROUND)
+            result = self._extract_json(response.text)
+            if not isinstance(result, dict):
+                raise ValueError("response is not a JSON object")
             return result
             
         except Exception as e:
             print(f"❌ Mood analysis failed: {e}")
-            return {'mood': 'neutral', 'energy': 'medium', 'tags': []}
\ No newline at end of file
+            return {'mood': 'neutral', 'energy': 'medium', 'tags': []}
+    
+    def analyze_moods_batch(self, tracks):
+        """
+        여러 트랙의 분위기를 한 번의 프롬프트로 분석
+        
+        Args:
+            tracks (list): 트랙 딕셔너리 리스트 (id, name, artists 필요)
+            
+        Returns:
+            dict: {track_id: {'mood', 'energy', 'tags'}} (실패한 트랙은 제외)
+            
+        Raises:
+            AIBudgetExceeded: 호출 예산 초과 (백그라운드 작업이 멈추도록 전달)
+        """
+        if not self.model or not tracks:
+            return {}
+        
+        lines = []
+        ids = []
+        for track in tracks:
+            if not track or not track.get('id'):
+                continue
+            artists = track.get('artists') or [{}]
+            artist = artists[0].get('name', 'Unknown')
+            ids.append(track['id'])
+            lines.append(f"{len(ids)}. {track.get('name', 'Unknown')} - {artist}")
+        
+        if not ids:
+            return {}
+        
+        prompt = f"""Analyze the mood of each song below.
+
+Songs:
+{chr(10).join(lines)}
+
+For every song return an object with:
+- index: the song number from the list
+- mood: one of {", ".join(self.MOODS)}
+- energy: one of {", ".join(self.ENERGY_LEVELS)}
+- tags: 3-5 short lowercase descriptive tags
+"""
+        
+        try:
+            print(f"🤖 Analyzing mood for {len(ids)} tracks")
+            response = self.governor.generate(
+                self.model,
+                prompt,
+                'mood_batch',
+                PRIORITY_BACKGROUND,
+                generation_config=genai.GenerationConfig(
+                    response_mime_type='application/json',
+                    response_schema=self.MOOD_BATCH_SCHEMA,
+                ),
+            )
+            items = self._extract_json(response.text)
+            
+        except AIBudgetExceeded:
+            raise
+        except Exception as e:
+            print(f"❌ Batch mood analysis failed: {e}")
+            return {}
+        
+        results = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            
+            index = item.get('index')
+            if not isinstance(index, int) or not 1 <= index <= len(ids):
+                continue
+            
+            mood = str(item.get('mood', '')).lower()
+            energy = str(item.get('energy', '')).lower()
+            if mood not in self.MOODS or energy not in self.ENERGY_LEVELS:
+                continue
+            
+            tags = [str(tag).strip().lower() for tag in item.get('tags', []) if str(tag).strip()]
+            results[ids[index - 1]] = {'mood': mood, 'energy': energy, 'tags': tags[:5]}
+        
+        return results
+    
+    def _extract_json(self, response_text):
+        """
+        AI 응답에서 JSON 추출 (마크다운 코드 블록 허용)
+        
+        Raises:
+            ValueError: JSON을 찾지 못한 경우
+        """
+        text = response_text.strip()
+        text = re.sub(r'^```(?:json)?\s*', '', text)
+        text = re.sub(r'\s*```$', '', text)
+        
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+        
+        # Fall back to the outermost object/array in surrounding prose
+        match = re.search(r'(\{.*\}|\[.*\])', text, re.DOTALL)
+        if not match:
+            raise ValueError("no JSON found in AI response")
+        return json.loads(match.group(0))
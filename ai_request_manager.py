@@ -0,0 +1,152 @@
+"""
+AI Request Manager
+AI 검색 요청 수명 관리 (세대 추적, 동시 실행 제한, 타임아웃)
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+import config
+
+
+class AIRequestManager(QObject):
+    """AI 제안 요청 관리 클래스
+
+    새 프롬프트가 들어오면 이전 요청은 대체(superseded)되어 결과가 버려진다.
+    모델 호출은 스레드 풀로 동시 실행 수가 제한되며, 제한 시간 안에 응답이
+    없으면 기본 제안으로 대체한다.
+    """
+
+    # Signals
+    suggestions_ready = pyqtSignal(int, list)  # (generation, suggestions)
+    _call_finished = pyqtSignal(int, object, float)  # worker thread -> GUI thread
+
+    def __init__(self, ai_manager, max_concurrent=config.AI_MAX_CONCURRENT_CALLS, timeout_ms=config.AI_CALL_TIMEOUT):
+        super().__init__()
+        self.ai = ai_manager
+        self.timeout_ms = timeout_ms
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="ai-request")
+
+        self.generation = 0
+        self.pending = {}  # generation -> (future, timer, start time)
+
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.superseded = 0
+        self.timeouts = 0
+        self.latencies = []
+
+        self._call_finished.connect(self._handle_finished)
+
+    def request(self, prompt):
+        """
+        AI 제안 요청 (이전 요청은 대체됨)
+
+        Args:
+            prompt (str): 사용자 입력
+
+        Returns:
+            int: 요청 세대 번호 (suggestions_ready와 비교용)
+        """
+        self.supersede_all()
+        self.ai.record_prompt(prompt)
+
+        self.generation += 1
+        generation = self.generation
+
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda: self._handle_timeout(generation, prompt))
+
+        with self._lock:
+            self.queued += 1
+        future = self.executor.submit(self._run, generation, prompt)
+
+        self.pending[generation] = (future, timer, time.monotonic())
+        timer.start(self.timeout_ms)
+        return generation
+
+    def supersede_all(self):
+        """대기/진행 중인 요청을 모두 무효화"""
+        for generation in list(self.pending):
+            future, timer, _ = self.pending.pop(generation)
+            timer.stop()
+            if future.cancel():
+                # Never started; undo the queue accounting done at submit time
+                with self._lock:
+                    self.queued -= 1
+            self.superseded += 1
+
+    def _run(self, generation, prompt):
+        """스레드 풀에서 모델 호출"""
+        with self._lock:
+            self.queued -= 1
+            self.in_flight += 1
+
+        start = time.monotonic()
+        try:
+            suggestions = self.ai.generate_music_suggestions(prompt, timeout=self.timeout_ms / 1000.0)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        self._call_finished.emit(generation, suggestions, time.monotonic() - start)
+
+    def _handle_finished(self, generation, suggestions, elapsed):
+        """모델 응답 처리 (GUI 스레드)"""
+        self.completed += 1
+        self.latencies.append(elapsed)
+        del self.latencies[:-50]
+
+        if generation not in self.pending:
+            # Superseded or already answered by the timeout fallback
+            return
+
+        _, timer, _ = self.pending.pop(generation)
+        timer.stop()
+
+        if config.DEBUG_MODE:
+            print(f"🤖 AI request #{generation} answered in {elapsed * 1000:.0f}ms")
+        self.suggestions_ready.emit(generation, suggestions or [])
+
+    def _handle_timeout(self, generation, prompt):
+        """제한 시간 초과 시 기본 제안으로 대체"""
+        if generation not in self.pending:
+            return
+
+        self.pending.pop(generation)
+        self.timeouts += 1
+        print(f"⏱️  AI request #{generation} timed out, using fallback suggestions")
+        self.suggestions_ready.emit(generation, self.ai._get_default_suggestions(prompt))
+
+    def stats(self):
+        """
+        요청 통계
+
+        Returns:
+            dict: 대기열 깊이, 진행 중 호출 수, 지연 시간 등
+        """
+        latencies = sorted(self.latencies)
+        with self._lock:
+            queued = self.queued
+            in_flight = self.in_flight
+
+        return {
+            'queue_depth': queued,
+            'in_flight': in_flight,
+            'completed': self.completed,
+            'superseded': self.superseded,
+            'timeouts': self.timeouts,
+            'latency_avg_ms': int(sum(latencies) / len(latencies) * 1000) if latencies else 0,
+            'latency_max_ms': int(latencies[-1] * 1000) if latencies else 0,
+        }
+
+    def shutdown(self):
+        """스레드 풀 종료"""
+        self.supersede_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
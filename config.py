@@ -72,15 +72,106 @@ GRADIENT_NIGHTFALL = (
 PLAYBACK_UPDATE_INTERVAL = 1000  # 1 second
 UI_REFRESH_INTERVAL = 100        # 0.1 second
 
+# Market passed to catalog/library requests; setting it makes Spotify drop the
+# per-item available_markets arrays (~180 country codes each) from responses
+SPOTIFY_MARKET = os.getenv('SPOTIFY_MARKET', 'KR')
+
+# Optimistic player view
+PLAYER_PENDING_TIMEOUT = 5000    # milliseconds to wait for the API to confirm a started track
+
+# Upcoming-track prefetch (Spotify queue)
+QUEUE_REFRESH_INTERVAL = 15000   # milliseconds between queue refreshes
+QUEUE_PREFETCH_COUNT = 3         # upcoming tracks warmed ahead of time
+
 # Limits
 MAX_SEARCH_RESULTS = 20
 MAX_AI_SUGGESTIONS = 4
 MAX_PLAYLISTS = 50
 MAX_TRACKS = 100
 
+# AI request limits
+AI_MAX_CONCURRENT_CALLS = 2
+AI_CALL_TIMEOUT = 8000           # milliseconds before falling back to defaults
+
+# Gemini call budgets (shared by all model calls)
+AI_CALLS_PER_MINUTE = 10
+AI_CALLS_PER_DAY = 500
+AI_BACKGROUND_BUDGET_SHARE = 0.5     # fraction of each budget background jobs may use
+AI_USAGE_FILE = 'ai_usage.json'
+
+# AI suggestion cache and idle-time prewarming
+AI_SUGGESTION_CACHE_TTL = 1800       # seconds a generated suggestion stays cached
+AI_PROMPT_HISTORY_FILE = 'prompt_history.json'
+AI_PROMPT_HISTORY_SIZE = 200         # prompts kept for time-of-day prediction
+AI_PREWARM_HOURS_AHEAD = 3           # predict prompts for the coming hours
+AI_PREWARM_MIN_COUNT = 2             # occurrences needed before a prompt is prewarmed
+AI_PREWARM_DAILY_BUDGET = 10         # model calls per day spent on prewarming
+AI_PREWARM_CACHE_TTL = 3 * 3600      # prewarmed answers must survive until the predicted hour
+
+# Playlist descriptions
+DESCRIPTION_STORE_FILE = 'playlist_descriptions.json'
+DESCRIPTION_BATCH_SIZE = 10          # playlists per Gemini prompt
+DESCRIPTION_SAMPLE_TRACKS = 5        # tracks sampled per playlist
+
+# Windowed playlist loading (very large playlists)
+PLAYLIST_PAGE_SIZE = 100             # tracks per playlist_tracks request (API maximum)
+PLAYLIST_WINDOW_THRESHOLD = 500      # playlists larger than this load page-by-page
+PLAYLIST_WINDOW_MAX_PAGES = 6        # pages kept in memory before LRU eviction
+PLAYLIST_WINDOW_PREFETCH = 1         # pages prefetched ahead in the scroll direction
+
+# Artist detail page
+ARTIST_ALBUMS_LIMIT = 100            # albums/singles fetched per artist (paginated by 50)
+ARTIST_DETAIL_CACHE_TTL = 600        # seconds the composite artist page stays cached
+
+# Detail prefetch (library lists warm the detail screen ahead of a tap)
+DETAIL_TRACKS_CACHE_TTL = 600        # seconds a loaded playlist/album track table stays cached
+DETAIL_PREFETCH_TOP_N = 3            # leading list items prefetched after a list is shown
+DETAIL_PREFETCH_MAX_TRACKS = 300     # larger playlists are only loaded when opened
+DETAIL_PREFETCH_REQUESTS_PER_MINUTE = 12  # API request budget for speculative loads
+DETAIL_PREFETCH_RETRY_INTERVAL = 10000    # ms before retrying once the budget is spent
+
+# Ad-hoc playback lists (search/AI results, sorted views)
+PLAYBACK_URI_WINDOW = 50             # URIs sent in one start_playback request
+PLAYBACK_TOPUP_THRESHOLD = 3         # queue more when this close to the window end
+PLAYBACK_TOPUP_SIZE = 5              # URIs queued per top-up
+
+# Shared task pool (screen loads and background jobs)
+TASK_POOL_WORKERS = os.cpu_count() or 4
+TASK_POOL_BACKGROUND_WORKERS = 2     # pool threads background jobs may hold at once (rest stay free for screens)
+
+# UI snapshot (warm start)
+UI_SNAPSHOT_FILE = 'ui_snapshot.json.z'
+UI_SNAPSHOT_INTERVAL = 60000         # ms between periodic snapshots
+UI_SNAPSHOT_MAX_AGE = 7 * 24 * 3600  # seconds; older snapshots are ignored
+
 # Cache settings
 ENABLE_CACHE = True
 CACHE_DURATION = 300  # seconds (5 minutes)
+CACHE_MAX_ENTRIES = 500  # response cache cap (least recently used evicted first)
+ETAG_MAX_ENTRIES = 64    # revalidation bodies kept for If-None-Match requests
+
+# Local storage (persistent caches)
+CACHE_DIR = os.getenv('MUSIC_DAC_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.music_dac'))
+
+# Album artwork
+IMAGE_CACHE_DIR = os.path.join(CACHE_DIR, 'images')
+IMAGE_DISK_CACHE_BYTES = 64 * 1024 * 1024      # encoded files kept on disk
+IMAGE_MEMORY_CACHE_BYTES = 24 * 1024 * 1024    # decoded pixmaps (width * height * 4)
+IMAGE_LOADER_THREADS = 2
+IMAGE_DOWNLOAD_TIMEOUT = 10                    # seconds
+THUMBNAIL_SIZE = 56                            # list row thumbnails (pixels)
+THUMBNAIL_LOOKAHEAD = 6                        # rows prefetched in the scroll direction
+THUMBNAIL_ATLAS_GRID = 16                      # cells per atlas side (16 x 16 thumbnails)
+THUMBNAIL_ATLAS_PAGES = 2                      # atlases kept before reusing cells LRU-style
+
+# Idle detection (milliseconds)
+IDLE_THRESHOLD = 30000           # 30 seconds without input/playback commands
+IDLE_CHECK_INTERVAL = 5000       # 5 seconds
+
+# Mood tagging
+MOOD_STORE_FILE = 'mood_store.json'
+MOOD_BATCH_SIZE = 40             # tracks per Gemini prompt
+MOOD_LIBRARY_PAGE_SIZE = 50      # saved tracks fetched per idle run
 
 # Debug mode
 DEBUG_MODE = os.getenv('DEBUG_MODE', 'False').lower() == 'true'
@@ -0,0 +1,141 @@
+"""
+Description Store
+플레이리스트 AI 설명 캐시 (playlist ID + snapshot_id 기준) 및 유휴 시간 일괄 생성
+"""
+
+import threading
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+import config
+from storage import load_json, save_json
+
+
+class DescriptionStore:
+    """플레이리스트 설명 저장소 (JSON 파일로 영구 저장)
+
+    snapshot_id가 바뀐 플레이리스트(내용이 변경됨)는 오래된 것으로 간주한다.
+    """
+
+    def __init__(self, filename=config.DESCRIPTION_STORE_FILE):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._dirty = False
+        data = load_json(filename, {})
+        self.entries = data if isinstance(data, dict) else {}
+
+    def get(self, playlist_id, snapshot_id):
+        """
+        플레이리스트의 캐시된 설명
+
+        Args:
+            playlist_id (str): 플레이리스트 ID
+            snapshot_id (str): 현재 snapshot_id
+
+        Returns:
+            str: 설명 (없거나 플레이리스트가 바뀌었으면 None)
+        """
+        entry = self.entries.get(playlist_id)
+        if not entry or entry.get('snapshot_id') != snapshot_id:
+            return None
+        return entry.get('description')
+
+    def is_stale(self, playlist_id, snapshot_id):
+        """설명을 (재)생성해야 하는지 확인"""
+        return bool(playlist_id) and self.get(playlist_id, snapshot_id) is None
+
+    def put(self, playlist_id, snapshot_id, description):
+        """설명 저장"""
+        with self._lock:
+            self.entries[playlist_id] = {
+                'snapshot_id': snapshot_id,
+                'description': description,
+            }
+            self._dirty = True
+
+    def save(self):
+        """변경 사항이 있으면 파일로 저장"""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = dict(self.entries)
+            self._dirty = False
+
+        save_json(self.filename, snapshot)
+
+
+def describe_playlists_task(token, spotify, ai, store):
+    """
+    오래된 플레이리스트 설명 일괄 생성 작업 (공유 풀의 백그라운드 레인에서 실행)
+
+    Returns:
+        list: 설명이 생성된 플레이리스트 ID 목록 (취소된 작업의 결과는 전달되지 않음)
+    """
+    stale = [
+        p for p in spotify.get_user_playlists()
+        if p and store.is_stale(p.get('id'), p.get('snapshot_id'))
+    ]
+    stale = stale[:config.DESCRIPTION_BATCH_SIZE]
+
+    batch = []
+    for playlist in stale:
+        if token.cancelled():
+            return []
+        items = spotify.get_playlist_tracks(
+            playlist['id'], limit=config.DESCRIPTION_SAMPLE_TRACKS, projection='sample'
+        )
+        batch.append((playlist, [item['track'] for item in items if item.get('track')]))
+
+    results = ai.generate_playlist_descriptions_batch(batch)
+    for playlist, _ in batch:
+        if playlist['id'] in results:
+            store.put(playlist['id'], playlist.get('snapshot_id'), results[playlist['id']])
+
+    store.save()
+    return list(results)
+
+
+class PlaylistDescriber(QObject):
+    """유휴 시간에 플레이리스트 설명을 미리 생성하는 백그라운드 작업"""
+
+    # Signals
+    descriptions_updated = pyqtSignal(list)  # playlist IDs
+
+    CHANNEL = 'background.descriptions'
+
+    def __init__(self, spotify_manager, ai_manager, store, task_pool):
+        super().__init__()
+        self.spotify = spotify_manager
+        self.ai = ai_manager
+        self.store = store
+        self.tasks = task_pool
+        self.up_to_date = False
+
+    def run_once(self):
+        """오래된 설명 한 묶음 생성 (유휴 시그널에 연결)"""
+        if self.up_to_date or not self.ai.model or not self.spotify.sp:
+            return
+        if self.tasks.busy(self.CHANNEL):
+            return
+
+        self.tasks.submit(
+            self.CHANNEL, describe_playlists_task, self.spotify, self.ai, self.store,
+            on_result=self._handle_finished, background=True,
+        )
+
+    def request_refresh(self):
+        """변경된 플레이리스트 발견 시 다음 유휴 시간에 다시 확인"""
+        self.up_to_date = False
+
+    def _handle_finished(self, playlist_ids):
+        """생성 결과 처리"""
+        if playlist_ids:
+            print(f"📝 Generated {len(playlist_ids)} playlist descriptions")
+            self.descriptions_updated.emit(playlist_ids)
+        else:
+            # Nothing stale (or the model refused); check again next launch
+            self.up_to_date = True
+
+    def stop(self):
+        """실행 중인 작업 중단 요청 (TaskPool.shutdown이 종료를 기다림)"""
+        self.tasks.cancel(self.CHANNEL)
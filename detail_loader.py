@@ -0,0 +1,285 @@
+"""
+Detail Loader
+상세 화면 데이터 로딩 함수와 목록 화면 기반 예측 프리페치
+"""
+
+import math
+import time
+from collections import deque
+
+from PyQt6.QtCore import QObject, QTimer
+
+import config
+from track_table import TrackTable
+
+ARTIST_SECTIONS = ('top_tracks', 'albums', 'related')
+
+
+def track_cache_key(item_type, item_id, snapshot_id=None):
+    """상세 트랙 테이블 캐시 키 (플레이리스트는 snapshot_id가 바뀌면 다른 키)"""
+    if item_type == 'playlist':
+        return ('detail_tracks', item_type, item_id, snapshot_id)
+    return ('detail_tracks', item_type, item_id)
+
+
+def fetch_track_table(spotify, item_type, item_id, interrupted=None):
+    """
+    플레이리스트/앨범 트랙을 불러와 TrackTable 구성 (Worker 스레드에서 호출)
+
+    Args:
+        spotify: SpotifyManager
+        item_type (str): 'playlist' 또는 'album'
+        item_id (str): Spotify ID
+        interrupted (callable): True를 반환하면 페이지 사이에서 중단
+
+    Returns:
+        TrackTable: 트랙 테이블 (중단되면 그때까지의 부분 테이블 - 캐시하면 안 됨)
+
+    Raises:
+        Exception: 페이지 요청 실패 (빈 페이지를 목록 끝으로 오인해 잘린 테이블을 만들지 않도록)
+    """
+    interrupted = interrupted or (lambda: False)
+    tracks = []
+    added_at = None
+    entities = spotify.entities
+    if item_type == 'playlist':
+        # Playlists above the window threshold use WindowedTrackModel instead
+        added_at = []
+        page_size = config.PLAYLIST_PAGE_SIZE
+        offset = 0
+        while not interrupted():
+            results = spotify.get_playlist_tracks(item_id, limit=page_size, offset=offset, raise_errors=True)
+            for item in results or ():
+                track = entities.track(item) if item else None
+                if track is not None:
+                    tracks.append(track)
+                    added_at.append(item.get('added_at'))
+            if len(results) < page_size or offset + page_size >= config.PLAYLIST_WINDOW_THRESHOLD:
+                break
+            offset += page_size
+    elif item_type == 'album':
+        # Album track objects carry no album field; link them to the shared record
+        album = entities.albums.get(item_id)
+        total = album.total_tracks if album else 0
+        # Saved albums embed the first page; only fetch the pages after it
+        tracks = list(album.tracks) if album else []
+        while not interrupted() and not (tracks and len(tracks) >= total):
+            results = spotify.get_album_tracks(item_id, offset=len(tracks), raise_errors=True)
+            tracks.extend(entities.parse_many(entities.track, results, album=album))
+            if len(results) < 50:
+                break
+
+    return TrackTable(tracks, added_at)
+
+
+def fetch_artist_section(spotify, artist_id, section):
+    """
+    아티스트 상세 섹션 하나 로딩
+
+    Args:
+        spotify: SpotifyManager
+        artist_id (str): 아티스트 ID
+        section (str): ARTIST_SECTIONS 중 하나
+
+    Returns:
+        TrackTable (top_tracks) 또는 레코드 리스트 (albums, related)
+
+    Raises:
+        RuntimeError: 요청 실패 (빈 결과와 구분해 캐시하지 않도록)
+    """
+    entities = spotify.entities
+    if section == 'top_tracks':
+        results = spotify.get_artist_top_tracks(artist_id)
+    elif section == 'albums':
+        results = spotify.get_artist_albums(artist_id)
+    else:
+        results = spotify.get_related_artists(artist_id)
+    if results is None:
+        raise RuntimeError(f"Failed to load artist {section}")
+
+    if section == 'top_tracks':
+        return TrackTable(entities.parse_many(entities.track, results))
+    if section == 'albums':
+        return entities.parse_many(entities.album, results)
+    return entities.parse_many(entities.artist, results)
+
+
+def prefetch_detail_task(token, spotify, item_type, item):
+    """
+    상세 데이터 한 건을 미리 불러와 캐시에 넣는 작업 (공유 풀의 백그라운드 레인에서 실행)
+
+    Returns:
+        str: 항목 ID
+    """
+    if item_type == 'artist':
+        composite = {}
+        try:
+            for section in ARTIST_SECTIONS:
+                if token.cancelled():
+                    break
+                composite[section] = fetch_artist_section(spotify, item.id, section)
+        except RuntimeError as e:
+            # A composite with a failed section must not be cached; the screen refetches it
+            print(f"⚠️  Artist prefetch skipped: {e}")
+            composite = {}
+        if len(composite) == len(ARTIST_SECTIONS):
+            spotify.cache_put(('artist_detail', item.id), composite, config.ARTIST_DETAIL_CACHE_TTL)
+    else:
+        try:
+            table = fetch_track_table(spotify, item_type, item.id, token.cancelled)
+        except Exception as e:
+            # Incomplete fetch: cache nothing, the detail screen loads it on demand
+            print(f"⚠️  Track prefetch skipped: {e}")
+            table = TrackTable([])
+        if len(table) and not token.cancelled():
+            key = track_cache_key(item_type, item.id, getattr(item, 'snapshot_id', None))
+            spotify.cache_put(key, table, config.DETAIL_TRACKS_CACHE_TTL)
+
+    return item.id or ''
+
+
+class DetailPrefetcher(QObject):
+    """목록 화면의 상위 N개/포커스 항목 상세 데이터 예측 프리페치
+
+    공유 풀의 백그라운드 레인에서 한 번에 하나씩 실행하고, 분당 요청 수와 항목
+    크기 한도를 넘는 작업은 미룬다.
+    """
+
+    CHANNEL = 'background.detail'
+
+    def __init__(self, spotify_manager, image_cache, task_pool):
+        super().__init__()
+        self.spotify = spotify_manager
+        self.images = image_cache
+        self.tasks = task_pool
+        self.queue = []  # (item_type, item), most likely first
+        self.playing = ()  # album/artist of the playing track (keeps the weak records alive)
+        self.request_times = deque()
+        self.prefetched = 0
+
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.timeout.connect(self._start_next)
+
+        self.spotify.track_changed.connect(self.warm_track)
+
+    def schedule(self, item_type, items):
+        """
+        목록이 표시되면 상위 항목 예약 (기존 예약은 교체)
+
+        Args:
+            item_type (str): 'playlist', 'album', 'artist'
+            items (list): 화면 순서의 레코드 리스트
+        """
+        self.queue = [
+            (item_type, item) for item in items[:config.DETAIL_PREFETCH_TOP_N]
+            if self._needs(item_type, item)
+        ]
+        self._start_next()
+
+    def focus(self, item_type, item):
+        """다이얼/선택으로 포커스된 항목을 가장 먼저 불러오기"""
+        if item is None or not self._needs(item_type, item):
+            return
+        self.queue = [(item_type, item)] + [entry for entry in self.queue if entry[1] is not item]
+        self._start_next()
+
+    def warm_track(self, track):
+        """
+        재생 중인 트랙의 앨범 트랙과 대표 아티스트 상세를 목록 예약보다 먼저 불러오기
+        (플레이어의 "Go to album"/"Go to artist"가 바로 열리도록)
+
+        Args:
+            track (dict): 재생 중인 항목 JSON (에피소드는 무시)
+        """
+        if track.get('type', 'track') != 'track':
+            return
+        record = self.spotify.entities.track(track)
+        if record is None:
+            return
+
+        album = record.album
+        artist = record.artists[0] if record.artists else None
+        self.playing = (album, artist)
+
+        # Thumbnails the detail rows draw first (album tracks all show the album cover)
+        for images in (album.images if album else (), artist.images if artist else ()):
+            if images:
+                self.images.request(images, config.THUMBNAIL_SIZE, lambda pixmap: None)
+
+        wanted = [entry for entry in (('album', album), ('artist', artist)) if self._needs(*entry)]
+        if wanted:
+            playing = {id(item) for _, item in wanted}
+            self.queue = wanted + [entry for entry in self.queue if id(entry[1]) not in playing]
+            self._start_next()
+
+    def _needs(self, item_type, item):
+        """이미 캐시에 있거나 프리페치 대상이 아닌 항목 제외"""
+        if item is None or not item.id:
+            return False
+        if item_type == 'playlist':
+            if item.total_tracks > config.DETAIL_PREFETCH_MAX_TRACKS:
+                return False  # bandwidth budget: large playlists load on demand
+            key = track_cache_key('playlist', item.id, item.snapshot_id)
+        elif item_type == 'album':
+            if item.has_all_tracks:
+                return False  # embedded tracks already render without a request
+            key = track_cache_key('album', item.id)
+        else:
+            key = ('artist_detail', item.id)
+        return self.spotify.cache_get(key) is None
+
+    def _cost(self, item_type, item):
+        """예상 API 요청 수"""
+        if item_type == 'playlist':
+            return max(1, math.ceil(item.total_tracks / config.PLAYLIST_PAGE_SIZE))
+        if item_type == 'album':
+            return max(1, math.ceil((item.total_tracks - len(item.tracks)) / 50))
+        return len(ARTIST_SECTIONS) + 1  # albums may take a second page
+
+    def _within_budget(self, cost):
+        """최근 1분 요청 수가 예산 안인지 확인"""
+        now = time.monotonic()
+        while self.request_times and now - self.request_times[0] > 60:
+            self.request_times.popleft()
+        return len(self.request_times) + cost <= config.DETAIL_PREFETCH_REQUESTS_PER_MINUTE
+
+    def _start_next(self):
+        """다음 작업 시작 (한 번에 하나, 백그라운드 레인)"""
+        if not self.spotify.sp or self.tasks.busy(self.CHANNEL):
+            return
+
+        while self.queue:
+            item_type, item = self.queue[0]
+            if not self._needs(item_type, item):
+                self.queue.pop(0)
+                continue
+
+            cost = self._cost(item_type, item)
+            if not self._within_budget(cost):
+                self.retry_timer.start(config.DETAIL_PREFETCH_RETRY_INTERVAL)
+                return
+
+            self.queue.pop(0)
+            now = time.monotonic()
+            self.request_times.extend([now] * cost)
+            self.tasks.submit(
+                self.CHANNEL, prefetch_detail_task, self.spotify, item_type, item,
+                on_result=self._handle_finished, on_error=self._handle_finished, background=True,
+            )
+            return
+
+    def _handle_finished(self, result):
+        """작업 완료(또는 실패) 후 다음 작업"""
+        self.prefetched += 1
+        self._start_next()
+
+    def stats(self):
+        """프리페치 통계"""
+        return {'queued': len(self.queue), 'prefetched': self.prefetched}
+
+    def stop(self):
+        """대기 작업 취소 후 실행 중인 작업 중단"""
+        self.queue = []
+        self.retry_timer.stop()
+        self.tasks.cancel(self.CHANNEL)
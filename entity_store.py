@@ -0,0 +1,303 @@
+"""
+Entity Store
+Spotify 트랙/앨범/아티스트/플레이리스트 정규화 저장소
+
+원본 JSON에서 화면에 필요한 필드만 남긴 __slots__ 레코드로 변환하고,
+Spotify ID 기준 identity map으로 같은 객체를 모든 화면이 공유한다.
+available_markets, external_urls 등 무거운 필드는 파싱 단계에서 버린다.
+"""
+
+import sys
+import threading
+import weakref
+
+
+def _images(data):
+    """이미지 배열을 (url, width, height) 튜플로 압축"""
+    return tuple(
+        (img.get('url'), img.get('width') or 0, img.get('height') or 0)
+        for img in (data.get('images') or ())
+        if img and img.get('url')
+    )
+
+
+def _export_images(images):
+    """(url, width, height) 튜플을 이미지 배열 JSON으로 되돌리기"""
+    return [{'url': url, 'width': width, 'height': height} for url, width, height in images]
+
+
+def _intern(value):
+    """반복되는 문자열(ID, 이름) 공유"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Artist:
+    """아티스트 레코드"""
+
+    __slots__ = ('id', 'name', 'uri', 'genres', 'followers', 'popularity', 'images', '__weakref__')
+
+    def __init__(self, artist_id):
+        self.id = artist_id
+        self.name = 'Unknown'
+        self.uri = None
+        self.genres = ()
+        self.followers = 0
+        self.popularity = 0
+        self.images = ()
+
+    def update(self, data):
+        """원본 JSON의 값으로 갱신 (없는 필드는 유지)"""
+        self.name = _intern(data.get('name')) or self.name
+        self.uri = data.get('uri') or self.uri
+        if 'genres' in data:
+            self.genres = tuple(_intern(g) for g in data['genres'])
+        if data.get('followers'):
+            self.followers = data['followers'].get('total') or 0
+        self.popularity = data.get('popularity', self.popularity)
+        self.images = _images(data) or self.images
+
+
+class Album:
+    """앨범 레코드"""
+
+    __slots__ = (
+        'id', 'name', 'uri', 'artists', 'release_date', 'total_tracks', 'images', 'tracks', '__weakref__'
+    )
+
+    def __init__(self, album_id):
+        self.id = album_id
+        self.name = 'Unknown Album'
+        self.uri = None
+        self.artists = ()
+        self.release_date = ''
+        self.total_tracks = 0
+        self.images = ()
+        self.tracks = ()  # first page embedded in saved-album payloads
+
+    @property
+    def has_all_tracks(self):
+        """임베드된 트랙만으로 전체 목록이 되는지 확인"""
+        return bool(self.tracks) and len(self.tracks) >= self.total_tracks
+
+    @property
+    def artist_names(self):
+        """아티스트 이름 (쉼표 구분)"""
+        return ', '.join(a.name for a in self.artists) if self.artists else 'Unknown'
+
+
+class Track:
+    """트랙 레코드"""
+
+    __slots__ = ('id', 'name', 'uri', 'artists', 'album', 'duration_ms', 'popularity', 'track_number', '__weakref__')
+
+    def __init__(self, track_id):
+        self.id = track_id
+        self.name = 'Unknown'
+        self.uri = None
+        self.artists = ()
+        self.album = None
+        self.duration_ms = 0
+        self.popularity = 0
+        self.track_number = 0
+
+    @property
+    def artist_names(self):
+        """아티스트 이름 (쉼표 구분)"""
+        return ', '.join(a.name for a in self.artists) if self.artists else 'Unknown'
+
+    @property
+    def album_name(self):
+        """앨범 이름"""
+        return self.album.name if self.album else 'Unknown'
+
+
+class Playlist:
+    """플레이리스트 레코드"""
+
+    __slots__ = (
+        'id', 'name', 'uri', 'owner_id', 'owner_name', 'total_tracks', 'snapshot_id', 'images', '__weakref__'
+    )
+
+    def __init__(self, playlist_id):
+        self.id = playlist_id
+        self.name = 'Unknown Playlist'
+        self.uri = None
+        self.owner_id = None
+        self.owner_name = 'Unknown'
+        self.total_tracks = 0
+        self.snapshot_id = None
+        self.images = ()
+
+
+class EntityStore:
+    """Spotify ID 기준 identity map
+
+    레코드는 약한 참조로 보관되어, 어떤 화면도 참조하지 않으면 자동으로 해제된다.
+    워커 스레드에서 파싱할 수 있도록 잠금으로 보호한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.artists = weakref.WeakValueDictionary()
+        self.albums = weakref.WeakValueDictionary()
+        self.tracks = weakref.WeakValueDictionary()
+        self.playlists = weakref.WeakValueDictionary()
+
+    def _get_or_create(self, table, cls, entity_id):
+        """ID로 레코드 조회, 없으면 생성 (ID가 없는 로컬 트랙은 공유하지 않음)"""
+        if not entity_id:
+            return cls(None)
+
+        entity_id = _intern(entity_id)
+        entity = table.get(entity_id)
+        if entity is None:
+            entity = cls(entity_id)
+            table[entity_id] = entity
+        return entity
+
+    def artist(self, data):
+        """아티스트 JSON → Artist"""
+        if not data:
+            return None
+
+        with self._lock:
+            artist = self._get_or_create(self.artists, Artist, data.get('id'))
+            artist.update(data)
+            return artist
+
+    def album(self, data):
+        """앨범 JSON → Album (저장된 앨범 래퍼 {'album': ...}도 허용)"""
+        if not data:
+            return None
+        if isinstance(data.get('album'), dict):
+            data = data['album']
+
+        with self._lock:
+            album = self._get_or_create(self.albums, Album, data.get('id'))
+            album.name = _intern(data.get('name')) or album.name
+            album.uri = data.get('uri') or album.uri
+            if data.get('artists'):
+                album.artists = tuple(self.artist(a) for a in data['artists'] if a)
+            album.release_date = data.get('release_date') or album.release_date
+            album.total_tracks = data.get('total_tracks') or album.total_tracks
+            album.images = _images(data) or album.images
+            embedded = data.get('tracks')
+            if isinstance(embedded, dict) and embedded.get('items'):
+                # Album track objects carry no album field; link them to this record
+                album.tracks = tuple(self.parse_many(self.track, embedded['items'], album=album))
+            return album
+
+    def track(self, data, album=None):
+        """
+        트랙 JSON → Track
+
+        Args:
+            data (dict): 트랙 JSON (플레이리스트 항목 {'track': ...}도 허용)
+            album (Album): 앨범 트랙 목록처럼 album 필드가 없는 경우 지정
+        """
+        if not data:
+            return None
+        if isinstance(data.get('track'), dict):
+            data = data['track']
+        elif 'added_at' in data:
+            # Playlist item whose track was removed or is unavailable
+            return None
+
+        with self._lock:
+            track = self._get_or_create(self.tracks, Track, data.get('id'))
+            track.name = _intern(data.get('name')) or track.name
+            track.uri = data.get('uri') or track.uri
+            if data.get('artists'):
+                track.artists = tuple(self.artist(a) for a in data['artists'] if a)
+            if data.get('album'):
+                track.album = self.album(data['album'])
+            elif album is not None:
+                track.album = album
+            track.duration_ms = data.get('duration_ms') or track.duration_ms
+            track.popularity = data.get('popularity', track.popularity)
+            track.track_number = data.get('track_number') or track.track_number
+            return track
+
+    def playlist(self, data):
+        """플레이리스트 JSON → Playlist"""
+        if not data:
+            return None
+
+        with self._lock:
+            playlist = self._get_or_create(self.playlists, Playlist, data.get('id'))
+            playlist.name = _intern(data.get('name')) or playlist.name
+            playlist.uri = data.get('uri') or playlist.uri
+            owner = data.get('owner') or {}
+            playlist.owner_id = owner.get('id') or playlist.owner_id
+            playlist.owner_name = owner.get('display_name') or playlist.owner_name
+            playlist.total_tracks = (data.get('tracks') or {}).get('total', playlist.total_tracks)
+            playlist.snapshot_id = data.get('snapshot_id') or playlist.snapshot_id
+            playlist.images = _images(data) or playlist.images
+            return playlist
+
+    def export(self, entity, embed_tracks=True):
+        """
+        레코드를 원본 JSON 형태의 dict로 변환 (UI 스냅샷 저장용)
+
+        같은 파서(artist/album/track/playlist)로 다시 레코드를 만들 수 있는 모양이라,
+        복원 시 identity map 등록과 하위 레코드 연결이 파싱과 똑같이 처리된다.
+
+        Args:
+            entity: Artist/Album/Track/Playlist 레코드
+            embed_tracks (bool): 앨범의 트랙/트랙의 앨범 포함 여부 (중첩 레코드는 한 단계만)
+
+        Returns:
+            dict: JSON 직렬화 가능한 dict (entity가 None이면 None)
+        """
+        if entity is None:
+            return None
+
+        data = {'id': entity.id, 'name': entity.name, 'uri': entity.uri}
+        if isinstance(entity, Artist):
+            data.update(
+                genres=list(entity.genres),
+                followers={'total': entity.followers},
+                popularity=entity.popularity,
+                images=_export_images(entity.images),
+            )
+        elif isinstance(entity, Album):
+            data.update(
+                artists=[self.export(a) for a in entity.artists],
+                release_date=entity.release_date,
+                total_tracks=entity.total_tracks,
+                images=_export_images(entity.images),
+            )
+            if embed_tracks and entity.tracks:
+                # Album track objects carry no album field; the parser links them back
+                data['tracks'] = {'items': [self.export(t, embed_tracks=False) for t in entity.tracks]}
+        elif isinstance(entity, Track):
+            data.update(
+                artists=[self.export(a) for a in entity.artists],
+                duration_ms=entity.duration_ms,
+                popularity=entity.popularity,
+                track_number=entity.track_number,
+            )
+            if embed_tracks and entity.album is not None:
+                data['album'] = self.export(entity.album, embed_tracks=False)
+        else:
+            data.update(
+                owner={'id': entity.owner_id, 'display_name': entity.owner_name},
+                tracks={'total': entity.total_tracks},
+                snapshot_id=entity.snapshot_id,
+                images=_export_images(entity.images),
+            )
+        return data
+
+    def parse_many(self, parser, items, **kwargs):
+        """JSON 리스트를 레코드 리스트로 변환 (빈 항목 제외)"""
+        parsed = (parser(item, **kwargs) for item in items or () if item)
+        return [entity for entity in parsed if entity is not None]
+
+    def stats(self):
+        """현재 공유 중인 레코드 수"""
+        return {
+            'artists': len(self.artists),
+            'albums': len(self.albums),
+            'tracks': len(self.tracks),
+            'playlists': len(self.playlists),
+        }
@@ -0,0 +1,66 @@
+"""
+Idle Monitor
+사용자 입력/재생 명령이 없는 유휴 시간 감지
+"""
+
+import time
+
+from PyQt6.QtCore import QObject, QEvent, QTimer, pyqtSignal
+
+import config
+
+
+class IdleMonitor(QObject):
+    """유휴 상태 감지 클래스
+
+    애플리케이션 이벤트 필터로 입력 이벤트를 감시하고, 재생 명령은
+    note_activity()로 전달받는다. 유휴 상태가 유지되는 동안
+    IDLE_CHECK_INTERVAL마다 idle 시그널을 보낸다.
+    """
+
+    # Signals
+    idle = pyqtSignal()
+
+    INPUT_EVENTS = (
+        QEvent.Type.KeyPress,
+        QEvent.Type.MouseButtonPress,
+        QEvent.Type.MouseButtonDblClick,
+        QEvent.Type.Wheel,
+        QEvent.Type.TouchBegin,
+    )
+
+    def __init__(self, idle_threshold=config.IDLE_THRESHOLD, check_interval=config.IDLE_CHECK_INTERVAL):
+        super().__init__()
+        self.idle_threshold = idle_threshold / 1000.0
+        self.last_activity = time.monotonic()
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._check_idle)
+        self.timer.start(check_interval)
+
+    def note_activity(self, *args):
+        """활동 기록 (입력 또는 재생 명령)"""
+        self.last_activity = time.monotonic()
+
+    def idle_seconds(self):
+        """마지막 활동 이후 경과 시간 (초)"""
+        return time.monotonic() - self.last_activity
+
+    def is_idle(self):
+        """현재 유휴 상태인지 확인"""
+        return self.idle_seconds() >= self.idle_threshold
+
+    def eventFilter(self, obj, event):
+        """입력 이벤트 감시"""
+        if event.type() in self.INPUT_EVENTS:
+            self.note_activity()
+        return False
+
+    def _check_idle(self):
+        """주기적으로 유휴 상태 확인"""
+        if self.is_idle():
+            self.idle.emit()
+
+    def stop(self):
+        """타이머 중지"""
+        self.timer.stop()
@@ -0,0 +1,288 @@
+"""
+Image Cache
+앨범 아트 다운로드/디코딩 파이프라인 (메모리 LRU + 디스크 캐시)
+"""
+
+import hashlib
+import os
+import threading
+import urllib.request
+from collections import OrderedDict
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QObject, QRunnable, QSize, Qt, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImageReader, QPixmap
+
+import config
+
+
+def image_variants(images):
+    """이미지 배열을 (url, width, height) 리스트로 통일 (Entity 튜플/원본 JSON 모두 허용)"""
+    variants = []
+    for image in images or ():
+        if isinstance(image, dict):
+            image = (image.get('url'), image.get('width') or 0, image.get('height') or 0)
+        if image and image[0]:
+            variants.append(tuple(image))
+    return variants
+
+
+def pick_image(images, size):
+    """
+    목표 크기 이상인 가장 작은 이미지 선택 (없으면 가장 큰 이미지)
+
+    Args:
+        images: Spotify 이미지 배열
+        size (int): 표시 크기 (픽셀, 정사각형 기준)
+
+    Returns:
+        str: 이미지 URL (없으면 None)
+    """
+    variants = image_variants(images)
+    if not variants:
+        return None
+
+    # Spotify sometimes omits dimensions; treat those as large so they are a last resort
+    def edge(variant):
+        return max(variant[1], variant[2]) or 10 ** 6
+
+    large_enough = [v for v in variants if edge(v) >= size]
+    if large_enough:
+        return min(large_enough, key=edge)[0]
+    return max(variants, key=edge)[0]
+
+
+class DiskImageCache:
+    """용량 제한이 있는 디스크 이미지 캐시 (원본 인코딩 바이트 저장)"""
+
+    def __init__(self, directory=config.IMAGE_CACHE_DIR, max_bytes=config.IMAGE_DISK_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total = None  # computed lazily on first write
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, url):
+        """URL의 캐시 파일 경로"""
+        return os.path.join(self.directory, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+    def read(self, url):
+        """캐시된 바이트 (없으면 None)"""
+        path = self.path_for(url)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # refresh recency for eviction
+            return data
+        except OSError:
+            return None
+
+    def write(self, url, data):
+        """바이트 저장 후 용량 초과 시 오래된 파일부터 삭제"""
+        path = self.path_for(url)
+        tmp_path = f"{path}.tmp-{threading.get_ident()}"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  Failed to cache image: {e}")
+            return
+
+        with self._lock:
+            if self._total is None:
+                self._total = self._scan_total()
+            else:
+                self._total += len(data)
+            if self._total > self.max_bytes:
+                self._trim()
+
+    def _scan_total(self):
+        """디렉터리 전체 크기"""
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.is_file():
+                total += entry.stat().st_size
+        return total
+
+    def _trim(self):
+        """용량의 90%까지 오래된 파일 삭제"""
+        entries = sorted(
+            (e for e in os.scandir(self.directory) if e.is_file()),
+            key=lambda e: e.stat().st_mtime,
+        )
+        target = int(self.max_bytes * 0.9)
+        for entry in entries:
+            if self._total <= target:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self._total -= size
+            except OSError:
+                pass
+
+
+class ImageTaskSignals(QObject):
+    """ImageLoadTask 결과 시그널 (QRunnable은 시그널을 가질 수 없음)"""
+
+    finished = pyqtSignal(str, int, object)  # url, size, QImage or None
+
+
+class ImageLoadTask(QRunnable):
+    """이미지 다운로드 + 표시 크기로 디코딩 (스레드 풀에서 실행)"""
+
+    def __init__(self, url, size, disk_cache):
+        super().__init__()
+        self.url = url
+        self.size = size
+        self.disk = disk_cache
+        self.signals = ImageTaskSignals()
+
+    def run(self):
+        image = None
+        try:
+            data = self.disk.read(self.url)
+            if data is None:
+                with urllib.request.urlopen(self.url, timeout=config.IMAGE_DOWNLOAD_TIMEOUT) as response:
+                    data = response.read()
+                self.disk.write(self.url, data)
+            image = self.decode(data)
+        except Exception as e:
+            print(f"⚠️  Failed to load image: {e}")
+        self.signals.finished.emit(self.url, self.size, image)
+
+    def decode(self, data):
+        """표시 크기로 바로 디코딩 (전체 해상도 비트맵을 만들지 않음)"""
+        buffer = QBuffer()
+        buffer.setData(QByteArray(data))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+
+        reader = QImageReader(buffer)
+        source = reader.size()
+        if source.isValid() and max(source.width(), source.height()) > self.size:
+            reader.setScaledSize(source.scaled(QSize(self.size, self.size), Qt.AspectRatioMode.KeepAspectRatio))
+
+        image = reader.read()
+        return None if image.isNull() else image
+
+
+class ImageCache(QObject):
+    """앨범 아트 캐시
+
+    요청은 (URL, 표시 크기) 단위로 합쳐지고, 디코딩된 QPixmap은 바이트 한도가 있는
+    메모리 LRU에, 원본 파일은 용량 제한이 있는 디스크 캐시에 보관된다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(config.IMAGE_LOADER_THREADS)
+        self.disk = DiskImageCache()
+        self.pixmaps = OrderedDict()  # (url, size) -> QPixmap
+        self.memory_bytes = 0
+        self.pending = {}  # (url, size) -> [task, [callbacks], store]
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url, size):
+        """메모리 캐시 조회 (없으면 None)"""
+        key = (url, size)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+        return pixmap
+
+    def request(self, images, size, callback, store=True):
+        """
+        이미지 요청
+
+        Args:
+            images: Spotify 이미지 배열 (Entity 튜플 또는 원본 JSON)
+            size (int): 표시 크기 (픽셀)
+            callback (callable): 로드 완료 시 QPixmap으로 호출 (GUI 스레드)
+            store (bool): 메모리 LRU에 보관 (썸네일 아틀라스처럼 호출자가 보관하면 False)
+
+        Returns:
+            QPixmap: 메모리 캐시에 있으면 즉시 반환, 아니면 None (나중에 callback 호출)
+        """
+        url = pick_image(images, size)
+        if not url:
+            return None
+
+        pixmap = self.get(url, size)
+        if pixmap is not None:
+            self.hits += 1
+            return pixmap
+
+        self.misses += 1
+        key = (url, size)
+        if key in self.pending:
+            entry = self.pending[key]
+            entry[1].append(callback)
+            entry[2] = entry[2] or store
+            return None
+
+        task = ImageLoadTask(url, size, self.disk)
+        task.setAutoDelete(False)  # kept in pending so a queued task can be taken back
+        task.signals.finished.connect(self._handle_loaded)
+        self.pending[key] = [task, [callback], store]
+        self.pool.start(task)
+        return None
+
+    def cancel(self, url, size, callback):
+        """
+        요청 취소 - 다른 요청자가 없고 아직 시작 전이면 작업 자체를 풀에서 제거
+
+        Args:
+            url (str): pick_image로 선택된 URL
+            size (int): 표시 크기
+            callback (callable): request에 넘긴 콜백
+        """
+        key = (url, size)
+        entry = self.pending.get(key)
+        if not entry:
+            return
+
+        if callback in entry[1]:
+            entry[1].remove(callback)
+        if not entry[1] and self.pool.tryTake(entry[0]):
+            del self.pending[key]
+
+    def _handle_loaded(self, url, size, image):
+        """디코딩 완료 - GUI 스레드에서 QPixmap 변환 후 콜백 호출"""
+        _, callbacks, store = self.pending.pop((url, size), (None, [], False))
+        if image is None:
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        if store:
+            self._store((url, size), pixmap)
+        for callback in callbacks:
+            callback(pixmap)
+
+    def _store(self, key, pixmap):
+        """메모리 LRU에 저장 (바이트 한도 초과 시 오래된 것부터 제거)"""
+        cost = pixmap.width() * pixmap.height() * 4
+        if cost > config.IMAGE_MEMORY_CACHE_BYTES:
+            return
+
+        self.pixmaps[key] = pixmap
+        self.memory_bytes += cost
+        while self.memory_bytes > config.IMAGE_MEMORY_CACHE_BYTES and self.pixmaps:
+            _, evicted = self.pixmaps.popitem(last=False)
+            self.memory_bytes -= evicted.width() * evicted.height() * 4
+
+    def stats(self):
+        """캐시 통계"""
+        return {
+            'pixmaps': len(self.pixmaps),
+            'memory_bytes': self.memory_bytes,
+            'pending': len(self.pending),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def stop(self):
+        """대기 중인 작업 취소 후 실행 중인 작업 대기"""
+        self.pool.clear()
+        self.pool.waitForDone()
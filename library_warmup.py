@@ -0,0 +1,30 @@
+"""
+Library Warmup
+인증 직후 라이브러리 화면 데이터 동시 로딩 (첫 화면 진입 시 바로 표시)
+"""
+
+SECTIONS = ('playlists', 'albums', 'artists')
+
+
+def load_warmup_section(token, spotify, section):
+    """
+    섹션 하나 로딩 작업 (공유 풀의 백그라운드 레인에서 실행) - 화면 작업과 같은 레코드로 변환
+
+    실패는 빈 목록이 아니라 예외로 전달되어 섹션을 건너뛴다 (복원된 화면 유지).
+
+    Returns:
+        list: 파싱된 레코드 리스트
+    """
+    entities = spotify.entities
+    if section == 'playlists':
+        items, _ = spotify.get_library('playlists', raise_errors=True)
+        return entities.parse_many(entities.playlist, items)
+    if section == 'albums':
+        items, _ = spotify.get_library('albums', raise_errors=True)
+        return entities.parse_many(entities.album, items)
+    artists = []
+    for items, _ in spotify.iter_followed_artists(raise_errors=True):
+        if token.cancelled():
+            break
+        artists.extend(entities.parse_many(entities.artist, items))
+    return artists
@@ -4,8 +4,9 @@ Music Streaming DAC - Main Application
 """
 
 import sys
+from functools import partial
 from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
 
 # Import screens
@@ -21,6 +22,18 @@ from screens.detail_screen import DetailScreen
 # Import managers
 from spotify_manager import SpotifyManager
 from ai_manager import AIManager
+from ai_request_manager import AIRequestManager
+from idle_monitor import IdleMonitor
+from mood_store import MoodStore, MoodTagger
+from prompt_history import SuggestionPrewarmer
+from description_store import DescriptionStore, PlaylistDescriber
+from detail_loader import DetailPrefetcher
+from image_cache import ImageCache
+from library_warmup import SECTIONS as WARMUP_SECTIONS, load_warmup_section
+from queue_prefetcher import QueuePrefetcher
+from task_pool import TaskPool
+from thumbnail_loader import ThumbnailAtlas
+from ui_snapshot import UISnapshot
 
 # Import config
 import config
@@ -44,10 +57,45 @@ class MusicDACApp(QMainWindow):
         
         print("Initializing AI Manager...")
         self.ai = AIManager()
+        self.ai_requests = AIRequestManager(self.ai)
+        
+        # Shared pool for screen loads and background jobs (no QThread per load)
+        self.tasks = TaskPool()
+        self.images = ImageCache()
+        self.thumbnail_atlas = ThumbnailAtlas()
+        # Art size is read lazily, once the player screen exists
+        self.queue_prefetcher = QueuePrefetcher(
+            self.spotify, self.images, self.tasks, lambda: self.player_screen.album_art.width()
+        )
+        self.detail_prefetcher = DetailPrefetcher(self.spotify, self.images, self.tasks)
+        
+        # Idle-time background jobs
+        self.idle_monitor = IdleMonitor()
+        QApplication.instance().installEventFilter(self.idle_monitor)
+        self.spotify.playback_command.connect(self.idle_monitor.note_activity)
+        
+        self.mood_store = MoodStore()
+        self.mood_tagger = MoodTagger(self.spotify, self.ai, self.mood_store, self.tasks)
+        self.idle_monitor.idle.connect(self.mood_tagger.run_once)
+        
+        self.prewarmer = SuggestionPrewarmer(self.spotify, self.ai, self.tasks)
+        self.idle_monitor.idle.connect(self.prewarmer.run_once)
+        
+        self.description_store = DescriptionStore()
+        self.playlist_describer = PlaylistDescriber(self.spotify, self.ai, self.description_store, self.tasks)
+        self.idle_monitor.idle.connect(self.playlist_describer.run_once)
         
         # Setup UI
         self.setup_ui()
         
+        # Paint the last session's screens before anything is fetched
+        self.ui_snapshot = UISnapshot(self)
+        self.ui_snapshot.restore()
+        self.ui_snapshot.start()
+        
+        self.queue_prefetcher.start()
+        self.start_warmup()
+        
         print("Application initialized successfully!")
         
     def setup_ui(self):
@@ -77,9 +125,41 @@ class MusicDACApp(QMainWindow):
         self.stacked_widget.addWidget(self.player_screen)    # 6
         self.stacked_widget.addWidget(self.detail_screen)    # 7
         
+        self.playlist_describer.descriptions_updated.connect(self.playlist_screen.refresh_descriptions)
+        
         # Set initial screen
         self.stacked_widget.setCurrentIndex(0)
         
+    def start_warmup(self):
+        """인증 후 라이브러리 화면 데이터를 백그라운드에서 미리 불러오기"""
+        if not self.spotify.sp:
+            return
+        
+        # One background-lane task per section; a failed section is logged by the pool and skipped
+        for section in WARMUP_SECTIONS:
+            self.tasks.submit(
+                f'warmup.{section}', load_warmup_section, self.spotify, section,
+                on_result=partial(self.apply_warmup_section, section), background=True,
+            )
+        
+    def apply_warmup_section(self, section, data):
+        """
+        미리 불러온 섹션으로 화면 모델 구성 (스냅샷으로 복원된 stale 화면은 교체,
+        사용자가 이미 연 화면은 건드리지 않음). 실패한 섹션은 전달되지 않으므로
+        복원된 목록은 화면 진입 시 다시 불러올 때까지 유지된다.
+        
+        Args:
+            section (str): library_warmup.SECTIONS 중 하나
+            data: 파싱된 레코드 리스트
+        """
+        if section == 'playlists' and (self.playlist_screen.stale or not self.playlist_screen.playlists):
+            self.playlist_screen.display_playlists(data)
+        elif section == 'albums' and (self.album_screen.stale or not self.album_screen.albums):
+            self.album_screen.display_albums(data)
+        elif section == 'artists' and (self.artist_screen.stale or not self.artist_screen.artists):
+            self.artist_screen.append_artists(data, reset=True)
+            self.artist_screen.display_artists()
+        
     def navigate_to(self, screen_index):
         """
         특정 화면으로 이동
@@ -91,17 +171,75 @@ class MusicDACApp(QMainWindow):
             self.stacked_widget.setCurrentIndex(screen_index)
             print(f"Navigated to screen {screen_index}")
         
+    def start_playback(self, track, request, *args, **kwargs):
+        """
+        대기 트랙을 표시하고 플레이어로 이동한 뒤 재생 요청
+        
+        요청은 동기 HTTP 호출이라 GUI 스레드를 막으므로, 대기 화면이 먼저
+        그려지도록 다음 이벤트 루프 차례로 미룬다.
+        
+        Args:
+            track: 대기 상태로 표시할 Track 레코드 (없으면 None)
+            request (callable): SpotifyManager.play_tracks/play_context 등
+        """
+        self.player_screen.show_pending(track)
+        self.navigate_to(6)
+        QTimer.singleShot(0, partial(request, *args, **kwargs))
+        
     def go_back(self):
         """홈 화면으로 돌아가기"""
         self.stacked_widget.setCurrentIndex(0)
         print("Navigated back to home")
         
+    def get_diagnostics(self):
+        """
+        앱 진단 정보 수집
+        
+        Returns:
+            dict: AI 호출 통계, 요청 관리자 상태, 백그라운드 작업 상태
+        """
+        return {
+            'ai': self.ai.get_diagnostics(),
+            'ai_requests': self.ai_requests.stats(),
+            'mood_store_size': len(self.mood_store),
+            'idle_seconds': int(self.idle_monitor.idle_seconds()),
+            'images': self.images.stats(),
+            'tasks': self.tasks.stats(),
+            'detail_prefetch': self.detail_prefetcher.stats(),
+        }
+        
     def closeEvent(self, event):
         """애플리케이션 종료 시 정리"""
         print("Closing application...")
+        if config.DEBUG_MODE and hasattr(self, 'ai'):
+            print(f"Diagnostics: {self.get_diagnostics()}")
         # Stop player timer if running
         if hasattr(self, 'player_screen'):
             self.player_screen.timer.stop()
+        # Persist screen state for the next warm start
+        if hasattr(self, 'ui_snapshot'):
+            self.ui_snapshot.stop()
+        # Stop background jobs
+        if hasattr(self, 'idle_monitor'):
+            self.idle_monitor.stop()
+        if hasattr(self, 'mood_tagger'):
+            self.mood_tagger.stop()
+        if hasattr(self, 'prewarmer'):
+            self.prewarmer.stop()
+        if hasattr(self, 'playlist_describer'):
+            self.playlist_describer.stop()
+        if hasattr(self, 'ai_requests'):
+            self.ai_requests.shutdown()
+        if hasattr(self, 'detail_screen'):
+            self.detail_screen.window_model.stop()
+        if hasattr(self, 'queue_prefetcher'):
+            self.queue_prefetcher.stop()
+        if hasattr(self, 'detail_prefetcher'):
+            self.detail_prefetcher.stop()
+        if hasattr(self, 'images'):
+            self.images.stop()
+        if hasattr(self, 'tasks'):
+            self.tasks.shutdown()
         event.accept()
 
 
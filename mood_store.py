@@ -0,0 +1,194 @@
+"""
+Mood Store
+트랙 ID별 분위기 분석 결과 저장 및 유휴 시간 자동 태깅
+"""
+
+import threading
+
+from PyQt6.QtCore import QObject
+
+import config
+from ai_governor import AIBudgetExceeded
+from storage import load_json, save_json
+
+
+class MoodStore:
+    """트랙 ID별 분위기 저장소 (JSON 파일로 영구 저장)"""
+
+    def __init__(self, filename=config.MOOD_STORE_FILE):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._dirty = False
+        data = load_json(filename, {})
+        self.moods = data if isinstance(data, dict) else {}
+
+    def __len__(self):
+        return len(self.moods)
+
+    def get(self, track_id):
+        """트랙의 분위기 정보 (없으면 None)"""
+        return self.moods.get(track_id)
+
+    def has(self, track_id):
+        """분석 결과가 있는지 확인"""
+        return track_id in self.moods
+
+    def missing(self, track_ids):
+        """아직 분석되지 않은 트랙 ID 목록"""
+        return [track_id for track_id in track_ids if track_id and track_id not in self.moods]
+
+    def update(self, results):
+        """
+        분석 결과 추가
+
+        Args:
+            results (dict): {track_id: {'mood', 'energy', 'tags', 'track'}}
+                ('track'은 오프라인 표시용 트랙 JSON)
+        """
+        if not results:
+            return
+
+        with self._lock:
+            self.moods.update(results)
+            self._dirty = True
+
+    def save(self):
+        """변경 사항이 있으면 파일로 저장"""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = dict(self.moods)
+            self._dirty = False
+
+        save_json(self.filename, snapshot)
+
+    def filter(self, mood=None, energy=None, tag=None):
+        """
+        조건에 맞는 트랙 ID 검색 (오프라인 분위기 필터)
+
+        Args:
+            mood (str): 분위기 (예: 'calm')
+            energy (str): 에너지 (low/medium/high)
+            tag (str): 태그
+
+        Returns:
+            list: 트랙 ID 리스트
+        """
+        tag = tag.lower() if tag else None
+        matches = []
+
+        for track_id, info in self.moods.items():
+            if mood and info.get('mood') != mood:
+                continue
+            if energy and info.get('energy') != energy:
+                continue
+            if tag and tag not in info.get('tags', []):
+                continue
+            matches.append(track_id)
+
+        return matches
+
+    def tracks(self, track_ids):
+        """
+        저장된 트랙 JSON 목록 (오프라인 필터 결과 표시용)
+
+        Args:
+            track_ids (list): filter()가 반환한 트랙 ID 리스트
+
+        Returns:
+            list: 트랙 JSON 리스트 (트랙 정보 없이 저장된 이전 항목은 제외)
+        """
+        tracks = []
+        for track_id in track_ids:
+            track = (self.moods.get(track_id) or {}).get('track')
+            if track:
+                tracks.append(track)
+        return tracks
+
+
+def tag_moods_task(token, spotify, ai, store, offset):
+    """
+    저장된 트랙 한 페이지 분위기 태깅 작업 (공유 풀의 백그라운드 레인에서 실행)
+
+    Returns:
+        tuple: (가져온 트랙 수 - 요청 실패 시 -1, 태깅한 트랙 수, 페이지 완료 여부)
+    """
+    tracks = spotify.get_saved_tracks(limit=config.MOOD_LIBRARY_PAGE_SIZE, offset=offset)
+    if tracks is None:
+        return -1, 0, False
+
+    untagged_ids = set(store.missing([t.get('id') for t in tracks if t]))
+    untagged = [t for t in tracks if t and t.get('id') in untagged_ids]
+    # Keep a compact record with each mood so filters can list tracks offline
+    entities = spotify.entities
+    records = {t['id']: entities.export(entities.track(t)) for t in untagged}
+
+    tagged = 0
+    complete = True
+    for start in range(0, len(untagged), config.MOOD_BATCH_SIZE):
+        if token.cancelled():
+            complete = False
+            break
+
+        try:
+            results = ai.analyze_moods_batch(untagged[start:start + config.MOOD_BATCH_SIZE])
+        except AIBudgetExceeded as e:
+            print(f"⏸️  Mood tagging stopped: {e}")
+            results = {}
+        if not results:
+            # Model error or budget exhausted: retry this page on a later idle tick
+            complete = False
+            break
+        for track_id, info in results.items():
+            info['track'] = records.get(track_id)
+        store.update(results)
+        tagged += len(results)
+
+    store.save()
+    return len(tracks), tagged, complete
+
+
+class MoodTagger(QObject):
+    """유휴 시간에 저장된 트랙을 페이지 단위로 태깅하는 백그라운드 작업"""
+
+    CHANNEL = 'background.moods'
+
+    def __init__(self, spotify_manager, ai_manager, store, task_pool):
+        super().__init__()
+        self.spotify = spotify_manager
+        self.ai = ai_manager
+        self.store = store
+        self.tasks = task_pool
+        self.offset = 0
+        self.exhausted = False
+
+    def run_once(self):
+        """다음 페이지 태깅 (유휴 시그널에 연결)"""
+        if self.exhausted or not self.ai.model or not self.spotify.sp:
+            return
+        if self.tasks.busy(self.CHANNEL):
+            return
+
+        self.tasks.submit(
+            self.CHANNEL, tag_moods_task, self.spotify, self.ai, self.store, self.offset,
+            on_result=lambda result: self._handle_finished(*result), background=True,
+        )
+
+    def _handle_finished(self, fetched, tagged, complete):
+        """태깅 결과 처리 (실패한 페이지는 다음 유휴 시간에 다시 시도)"""
+        if tagged:
+            print(f"🏷️  Tagged {tagged} tracks ({len(self.store)} in mood store)")
+
+        if fetched < 0 or not complete:
+            # Fetch error is not the end of the library; keep the offset
+            return
+        if fetched < config.MOOD_LIBRARY_PAGE_SIZE:
+            # End of library reached; stop until next launch
+            self.exhausted = True
+            self.offset = 0
+        else:
+            self.offset += fetched
+
+    def stop(self):
+        """실행 중인 작업 중단 요청 (TaskPool.shutdown이 종료를 기다림)"""
+        self.tasks.cancel(self.CHANNEL)
@@ -0,0 +1,188 @@
+"""
+Prompt History
+AI 검색 프롬프트 기록, 시간대별 예측 및 유휴 시간 사전 생성
+"""
+
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime
+
+from PyQt6.QtCore import QObject
+
+import config
+from ai_governor import AIBudgetExceeded, PRIORITY_BACKGROUND
+from storage import load_json, save_json
+
+
+def normalize_prompt(prompt):
+    """캐시/통계용 프롬프트 정규화 (대소문자, 공백 통일)"""
+    return ' '.join((prompt or '').lower().split())
+
+
+class PromptHistory:
+    """최근 AI 검색 프롬프트 기록 (JSON 파일로 영구 저장)"""
+
+    def __init__(self, filename=config.AI_PROMPT_HISTORY_FILE, max_entries=config.AI_PROMPT_HISTORY_SIZE):
+        self.filename = filename
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        data = load_json(filename, {})
+        data = data if isinstance(data, dict) else {}
+        self.entries = [tuple(entry) for entry in data.get('prompts', []) if len(entry) == 2]
+        self.prewarm_date = data.get('prewarm_date', '')
+        self.prewarm_calls = data.get('prewarm_calls', 0)
+
+    def record(self, prompt):
+        """프롬프트 기록"""
+        prompt = (prompt or '').strip()
+        if not prompt:
+            return
+
+        with self._lock:
+            self.entries.append((prompt, time.time()))
+            del self.entries[:-self.max_entries]
+        self.save()
+
+    def predict(self, now=None, hours_ahead=config.AI_PREWARM_HOURS_AHEAD, limit=3):
+        """
+        앞으로 몇 시간 동안 입력될 가능성이 높은 프롬프트 예측
+
+        Args:
+            now (datetime): 기준 시각
+            hours_ahead (int): 예측 구간 (시간)
+            limit (int): 최대 개수
+
+        Returns:
+            list: 예측된 프롬프트 (빈도순)
+        """
+        now = now or datetime.now()
+        window = {(now.hour + offset) % 24 for offset in range(hours_ahead)}
+
+        counts = Counter()
+        latest_text = {}
+        with self._lock:
+            entries = list(self.entries)
+
+        for prompt, timestamp in entries:
+            if datetime.fromtimestamp(timestamp).hour not in window:
+                continue
+            key = normalize_prompt(prompt)
+            counts[key] += 1
+            latest_text[key] = prompt
+
+        return [
+            latest_text[key]
+            for key, count in counts.most_common(limit)
+            if count >= config.AI_PREWARM_MIN_COUNT
+        ]
+
+    def remaining_budget(self):
+        """오늘 남은 사전 생성 모델 호출 수"""
+        if self.prewarm_date != date.today().isoformat():
+            return config.AI_PREWARM_DAILY_BUDGET
+        return max(0, config.AI_PREWARM_DAILY_BUDGET - self.prewarm_calls)
+
+    def consume_budget(self):
+        """사전 생성 모델 호출 1회 차감"""
+        today = date.today().isoformat()
+        with self._lock:
+            if self.prewarm_date != today:
+                self.prewarm_date = today
+                self.prewarm_calls = 0
+            self.prewarm_calls += 1
+        self.save()
+
+    def save(self):
+        """파일로 저장"""
+        with self._lock:
+            data = {
+                'prompts': [list(entry) for entry in self.entries],
+                'prewarm_date': self.prewarm_date,
+                'prewarm_calls': self.prewarm_calls,
+            }
+        save_json(self.filename, data)
+
+
+def prewarm_task(token, spotify, ai, prompts):
+    """
+    예측 프롬프트의 AI 제안 및 검색 결과 미리 생성 작업 (공유 풀의 백그라운드 레인에서 실행)
+
+    Returns:
+        int: 미리 생성한 프롬프트 수
+    """
+    warmed = 0
+    for prompt in prompts:
+        if token.cancelled() or ai.prompt_history.remaining_budget() <= 0:
+            break
+
+        try:
+            suggestions = ai.generate_music_suggestions(
+                prompt, cache_ttl=config.AI_PREWARM_CACHE_TTL, priority=PRIORITY_BACKGROUND
+            )
+        except AIBudgetExceeded as e:
+            # Governor refused the call: nothing was spent, stop until the next idle tick
+            print(f"⏸️  Prewarm stopped: {e}")
+            break
+
+        # The governor admitted the call, so it counts against the prewarm budget
+        ai.prompt_history.consume_budget()
+        if not ai.has_cached_suggestions(prompt):
+            continue  # model failed; don't cache search results for fallback suggestions
+
+        # Same query/limit as AISearchScreen.perform_search so the results hit the cache
+        for query in suggestions:
+            if token.cancelled():
+                break
+            spotify.search(
+                query,
+                search_type='track',
+                limit=config.MAX_AI_SUGGESTIONS * 5,
+                cache_ttl=config.AI_PREWARM_CACHE_TTL,
+            )
+        warmed += 1
+
+    return warmed
+
+
+class SuggestionPrewarmer(QObject):
+    """유휴 시간에 예측 프롬프트를 미리 생성해 캐시에 넣는 백그라운드 작업"""
+
+    CHANNEL = 'background.prewarm'
+
+    def __init__(self, spotify_manager, ai_manager, task_pool):
+        super().__init__()
+        self.spotify = spotify_manager
+        self.ai = ai_manager
+        self.tasks = task_pool
+
+    def run_once(self):
+        """예측 프롬프트 사전 생성 (유휴 시그널에 연결)"""
+        if not self.ai.model or not self.spotify.sp:
+            return
+        if self.tasks.busy(self.CHANNEL):
+            return
+
+        history = self.ai.prompt_history
+        budget = history.remaining_budget()
+        if budget <= 0:
+            return
+
+        prompts = [p for p in history.predict() if not self.ai.has_cached_suggestions(p)]
+        if not prompts:
+            return
+
+        self.tasks.submit(
+            self.CHANNEL, prewarm_task, self.spotify, self.ai, prompts[:budget],
+            on_result=self._handle_finished, background=True,
+        )
+
+    def _handle_finished(self, warmed):
+        """사전 생성 결과 처리"""
+        if warmed:
+            print(f"🔥 Prewarmed AI suggestions for {warmed} predicted prompts")
+
+    def stop(self):
+        """실행 중인 작업 중단 요청 (TaskPool.shutdown이 종료를 기다림)"""
+        self.tasks.cancel(self.CHANNEL)
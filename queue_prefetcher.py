@@ -0,0 +1,123 @@
+"""
+Queue Prefetcher
+Spotify 재생 대기열의 다음 트랙 메타데이터/앨범 아트 미리 불러오기
+"""
+
+from PyQt6.QtCore import QObject, QTimer
+
+import config
+
+
+def track_display(track):
+    """
+    플레이어에 표시할 문자열 구성
+
+    Args:
+        track (dict): Spotify 트랙 JSON (에피소드는 show 정보 사용)
+
+    Returns:
+        dict: name, artists, album, duration_ms, images
+    """
+    artists = track.get('artists') or []
+    album = track.get('album') or track.get('show') or {}
+    return {
+        'name': track.get('name', 'Unknown'),
+        'artists': ', '.join(a.get('name', 'Unknown') for a in artists) if artists else 'Unknown Artist',
+        'album': album.get('name', ''),
+        'duration_ms': track.get('duration_ms') or 0,
+        'images': album.get('images') or track.get('images') or [],
+    }
+
+
+def record_display(track):
+    """Track 레코드(EntityStore)로 track_display와 같은 형식의 표시 정보 구성"""
+    return {
+        'name': track.name,
+        'artists': track.artist_names,
+        'album': track.album.name if track.album else '',
+        'duration_ms': track.duration_ms,
+        'images': track.album.images if track.album else (),
+    }
+
+
+def fetch_queue_task(token, spotify):
+    """
+    재생 대기열 조회 작업 (공유 풀의 백그라운드 레인에서 실행)
+
+    Returns:
+        list: 다음 트랙 JSON (최대 QUEUE_PREFETCH_COUNT개)
+    """
+    upcoming = spotify.get_queue()[:config.QUEUE_PREFETCH_COUNT]
+    # Warm the shared entity records too, so list screens reuse them
+    entities = spotify.entities
+    entities.parse_many(entities.track, [t for t in upcoming if t.get('type', 'track') == 'track'])
+    return upcoming
+
+
+class QueuePrefetcher(QObject):
+    """다음 트랙 미리 불러오기
+
+    트랙이 바뀔 때와 QUEUE_REFRESH_INTERVAL마다 대기열을 조회하고, 다음 몇 곡의
+    표시 문자열을 만들어 두고 앨범 아트를 플레이어 크기로 메모리 캐시에 올려 둔다.
+    """
+
+    CHANNEL = 'background.queue'
+
+    def __init__(self, spotify_manager, image_cache, task_pool, art_size):
+        """
+        Args:
+            spotify_manager: SpotifyManager
+            image_cache: ImageCache
+            task_pool: TaskPool (조회는 백그라운드 레인에서 실행)
+            art_size (callable): 플레이어 앨범 아트 크기(픽셀)를 반환
+        """
+        super().__init__()
+        self.spotify = spotify_manager
+        self.images = image_cache
+        self.tasks = task_pool
+        self.art_size = art_size
+        self.upcoming = []  # list of (uri, display dict)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        # A new track means the queue has moved on too
+        self.spotify.track_changed.connect(self.refresh)
+
+    def start(self):
+        """주기적 갱신 시작"""
+        self.timer.start(config.QUEUE_REFRESH_INTERVAL)
+
+    def refresh(self, *args):
+        """대기열 다시 조회"""
+        if not self.spotify.sp or self.tasks.busy(self.CHANNEL):
+            return
+
+        self.tasks.submit(
+            self.CHANNEL, fetch_queue_task, self.spotify, on_result=self._handle_queue, background=True
+        )
+
+    def _handle_queue(self, upcoming):
+        """다음 트랙 표시 정보 준비 및 앨범 아트 미리 로드"""
+        self.upcoming = [(track.get('uri'), track_display(track)) for track in upcoming if track]
+
+        size = self.art_size()
+        for _, display in self.upcoming:
+            if display['images']:
+                # Stored in the pixmap LRU at player size; nothing to do on arrival
+                self.images.request(display['images'], size, lambda pixmap: None)
+
+    def next_display(self):
+        """다음 트랙 표시 정보 (없으면 None)"""
+        return self.upcoming[0][1] if self.upcoming else None
+
+    def display_for(self, uri):
+        """미리 준비된 트랙 표시 정보 (없으면 None)"""
+        for upcoming_uri, display in self.upcoming:
+            if upcoming_uri == uri:
+                return display
+        return None
+
+    def stop(self):
+        """갱신 중단 (진행 중인 조회 결과는 버림)"""
+        self.timer.stop()
+        self.tasks.cancel(self.CHANNEL)
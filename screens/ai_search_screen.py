@@ -3,6 +3,9 @@ AI Search Screen
 Gemini AI 기반 음악 검색 및 추천 화면
 """
 
+import re
+from functools import partial
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -17,8 +20,10 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
+from PyQt6.QtCore import Qt
 import config
+from suggestion_engine import extract_keywords
+from thumbnail_loader import ThumbnailScheduler
 from ui_styles import (
     BASE_STYLESHEET,
     apply_font_scaling,
@@ -28,19 +33,55 @@ from ui_styles import (
 )
 
 
-class AISearchWorker(QThread):
-    """AI 검색을 백그라운드에서 처리하는 Worker Thread"""
-
-    finished = pyqtSignal(list)
-
-    def __init__(self, ai_manager, query):
-        super().__init__()
-        self.ai_manager = ai_manager
-        self.query = query
-
-    def run(self):
-        suggestions = self.ai_manager.generate_music_suggestions(self.query)
-        self.finished.emit(suggestions)
+def speculative_search_task(token, spotify, query):
+    """
+    AI 응답을 기다리는 동안 원문 프롬프트로 Spotify를 미리 검색하는 작업 (공유 풀에서 실행)
+
+    Returns:
+        list: Track 리스트 (중복 제거)
+    """
+    queries = [query]
+    keywords = extract_keywords(query)
+    if keywords and keywords.lower() != query.lower():
+        queries.append(keywords)
+
+    entities = spotify.entities
+    tracks = []
+    seen_ids = set()
+    for text in queries:
+        if token.cancelled():
+            break
+
+        results = spotify.search(text, search_type="track", limit=config.MAX_SEARCH_RESULTS // 2)
+        items = (results or {}).get("tracks", {}).get("items", [])
+        for track in entities.parse_many(entities.track, items):
+            if track.id not in seen_ids:
+                seen_ids.add(track.id)
+                tracks.append(track)
+
+    return tracks
+
+
+def parse_mood_prompt(query, moods, energy_levels):
+    """
+    프롬프트에서 분위기 필터 조건 추출 (예: "calm songs", "high energy")
+
+    Args:
+        query (str): 사용자 프롬프트
+        moods (tuple): 지원하는 분위기 목록
+        energy_levels (tuple): 지원하는 에너지 목록
+
+    Returns:
+        tuple: (mood, energy) - 없으면 None
+    """
+    text = query.lower()
+    words = re.findall(r"[a-z]+", text)
+    mood = next((word for word in words if word in moods), None)
+    energy = next(
+        (level for level in energy_levels if re.search(rf"\b{level}[\s-]+energy\b", text)),
+        None,
+    )
+    return mood, energy
 
 
 class AISearchScreen(QWidget):
@@ -50,10 +91,15 @@ class AISearchScreen(QWidget):
         super().__init__()
         self.parent = parent
         self.current_suggestions = []
-        self.worker = None
+        self.search_generation = 0
+        self.showing_provisional = False
+        self.ai_answered = False
+        self.result_tracks = []
         self.buttons = []
         self.setup_ui()
 
+        self.parent.ai_requests.suggestions_ready.connect(self.handle_ai_response)
+
     def setup_ui(self):
         """UI 구성"""
         self.setObjectName("aiSearchScreen")
@@ -188,6 +234,7 @@ class AISearchScreen(QWidget):
         self.results_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.results_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.results_list.itemDoubleClicked.connect(self.play_selected)
+        self.thumbnails = ThumbnailScheduler(self.results_list, self.parent.images, self.parent.thumbnail_atlas)
         results_layout.addWidget(self.results_list)
 
         self.card_layout.addWidget(results_section)
@@ -217,19 +264,82 @@ class AISearchScreen(QWidget):
         self.search_btn.setEnabled(False)
         self.search_btn.setText("Generating…")
 
-        for btn in self.suggestion_buttons:
-            btn.hide()
-
         self.results_list.clear()
+        self.showing_provisional = False
+        self.ai_answered = False
         self.results_info.setText("Waiting for AI suggestions…")
         self.results_info.setStyleSheet(f"color: {config.COLOR_PRIMARY};")
 
-        self.worker = AISearchWorker(self.parent.ai, query)
-        self.worker.finished.connect(self.handle_ai_results)
-        self.worker.start()
+        # Instant local answer; replaced when the model responds
+        quick = self.parent.ai.quick_suggestions(query)
+        self.show_suggestions([{"query": q, "description": ""} for q in quick])
+
+        # A new prompt supersedes any in-flight request; its result will be dropped
+        self.search_generation = self.parent.ai_requests.request(query)
+        if not self.show_mood_matches(query):
+            self.start_speculative_search(query)
+
+    def show_mood_matches(self, query):
+        """
+        프롬프트가 분위기를 지정하면 태깅된 라이브러리 트랙을 바로 표시 (오프라인 동작)
+
+        Returns:
+            bool: 표시한 트랙이 있는지 (있으면 추측 검색 생략)
+        """
+        ai = self.parent.ai
+        mood, energy = parse_mood_prompt(query, ai.MOODS, ai.ENERGY_LEVELS)
+        if not mood and not energy:
+            return False
+
+        store = self.parent.mood_store
+        matches = store.tracks(store.filter(mood=mood, energy=energy))
+        if not matches:
+            return False
+
+        self.cancel_speculative_search()
+        entities = self.parent.spotify.entities
+        tracks = entities.parse_many(entities.track, matches[:config.MAX_SEARCH_RESULTS])
+        self.showing_provisional = True
+        self.populate_results(tracks)
+
+        label = " · ".join(part for part in (mood, energy and f"{energy} energy") if part)
+        self.results_info.setText(f"From your library: {len(matches)} tracks tagged {label}")
+        self.results_info.setStyleSheet(f"color: {config.COLOR_TEXT_SECONDARY};")
+        return True
+
+    def start_speculative_search(self, query):
+        """AI와 병렬로 원문 프롬프트 직접 검색 시작"""
+        self.cancel_speculative_search()
+
+        self.parent.tasks.submit(
+            "ai.speculative", speculative_search_task, self.parent.spotify, query,
+            on_result=partial(self.handle_speculative_results, self.search_generation),
+        )
+
+    def cancel_speculative_search(self):
+        """진행 중인 추측 검색 취소 (결과는 버려짐)"""
+        self.parent.tasks.cancel("ai.speculative")
+
+    def handle_speculative_results(self, generation, tracks):
+        """추측 검색 결과를 임시 결과로 표시"""
+        if generation != self.search_generation or self.ai_answered or not tracks:
+            return
+
+        self.showing_provisional = True
+        self.populate_results(tracks)
+        self.results_info.setText(f"Quick matches while AI is thinking ({len(tracks)} tracks)")
+        self.results_info.setStyleSheet(f"color: {config.COLOR_TEXT_SECONDARY};")
+
+    def handle_ai_response(self, generation, suggestions):
+        """AI 요청 관리자 응답 수신 (이전 프롬프트의 응답은 무시)"""
+        if generation != self.search_generation:
+            return
+        self.handle_ai_results(suggestions)
 
     def handle_ai_results(self, suggestions):
         """AI 검색 결과 처리"""
+        self.ai_answered = True
+        self.cancel_speculative_search()
         self.loading_label.hide()
         self.search_btn.setEnabled(True)
         self.search_btn.setText("Get AI Suggestions")
@@ -263,11 +373,20 @@ class AISearchScreen(QWidget):
             self.results_info.setStyleSheet(f"color: {config.COLOR_ERROR};")
             return
 
-        self.current_suggestions = normalized_suggestions
-        self.results_info.setText("Pick a suggestion to explore matching tracks.")
-        self.results_info.setStyleSheet(f"color: {config.COLOR_TEXT_SECONDARY};")
+        self.show_suggestions(normalized_suggestions)
 
-        for idx, suggestion in enumerate(normalized_suggestions):
+        if self.showing_provisional:
+            self.results_info.setText("Showing quick matches. Pick a suggestion to refine the results.")
+            self.results_info.setStyleSheet(f"color: {config.COLOR_TEXT_SECONDARY};")
+        elif self.results_list.count() == 0:
+            self.results_info.setText("Pick a suggestion to explore matching tracks.")
+            self.results_info.setStyleSheet(f"color: {config.COLOR_TEXT_SECONDARY};")
+
+    def show_suggestions(self, suggestions):
+        """제안 버튼 표시"""
+        self.current_suggestions = suggestions
+
+        for idx, suggestion in enumerate(suggestions):
             if idx >= len(self.suggestion_buttons):
                 break
 
@@ -276,7 +395,7 @@ class AISearchScreen(QWidget):
             btn.setText(text)
             btn.show()
 
-        for idx in range(len(normalized_suggestions), len(self.suggestion_buttons)):
+        for idx in range(len(suggestions), len(self.suggestion_buttons)):
             self.suggestion_buttons[idx].hide()
 
     def select_suggestion(self, index):
@@ -307,7 +426,9 @@ class AISearchScreen(QWidget):
 
     def perform_search(self, query):
         """Spotify 검색 수행"""
+        self.cancel_speculative_search()
         self.results_list.clear()
+        self.showing_provisional = False
 
         try:
             results = self.parent.spotify.search(query, search_type="track", limit=config.MAX_AI_SUGGESTIONS * 5)
@@ -322,7 +443,8 @@ class AISearchScreen(QWidget):
             self.results_info.setStyleSheet(f"color: {config.COLOR_ERROR};")
             return
 
-        tracks = results["tracks"]["items"]
+        entities = self.parent.spotify.entities
+        tracks = entities.parse_many(entities.track, results["tracks"]["items"])
 
         if not tracks:
             self.results_info.setText(f"No results found for '{query}'")
@@ -333,20 +455,24 @@ class AISearchScreen(QWidget):
         self.results_info.setText(f"Found {len(tracks)} tracks for '{query}'")
         self.results_info.setStyleSheet(f"color: {config.COLOR_TEXT_SECONDARY};")
 
+        self.populate_results(tracks)
+
+    def populate_results(self, tracks):
+        """트랙 목록을 결과 리스트에 표시"""
+        self.results_list.clear()
+        self.result_tracks = [track for track in tracks if track]
+
         for track in tracks:
             if not track:
                 continue
 
-            track_name = track.get("name", "Unknown")
-            artists = track.get("artists", [])
-            artist_names = ", ".join([a.get("name", "Unknown") for a in artists]) if artists else "Unknown"
-            album_name = track.get("album", {}).get("name", "Unknown")
-
-            duration_ms = track.get("duration_ms", 0)
-            duration_min = duration_ms // 60000
-            duration_sec = (duration_ms % 60000) // 1000
+            duration_min = track.duration_ms // 60000
+            duration_sec = (track.duration_ms % 60000) // 1000
 
-            item_text = f"🎵 {track_name}\n   👤 {artist_names}  ·  💿 {album_name}  ·  ⏱ {duration_min}:{duration_sec:02d}"
+            item_text = (
+                f"🎵 {track.name}\n   👤 {track.artist_names}  ·  💿 {track.album_name}  ·  "
+                f"⏱ {duration_min}:{duration_sec:02d}"
+            )
 
             item = QListWidgetItem(item_text)
             item.setData(Qt.ItemDataRole.UserRole, track)
@@ -356,10 +482,12 @@ class AISearchScreen(QWidget):
         """선택한 트랙 재생"""
         track = item.data(Qt.ItemDataRole.UserRole)
 
-        if track and track.get("uri"):
-            uri = track["uri"]
-            self.parent.spotify.play_track(uri)
-            self.parent.navigate_to(6)
+        if track and track.uri:
+            # Keep playing the rest of the results after the selected one
+            uris = [result.uri for result in self.result_tracks]
+            self.parent.start_playback(
+                track, self.parent.spotify.play_tracks, uris, start=self.results_list.row(item)
+            )
         else:
             print("❌ No valid track URI")
 
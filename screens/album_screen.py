@@ -15,8 +15,10 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt
 import config
+from thumbnail_loader import ThumbnailScheduler
+from ui_snapshot import list_position, restore_list_position
 from ui_styles import (
     BASE_STYLESHEET,
     apply_font_scaling,
@@ -26,18 +28,18 @@ from ui_styles import (
 )
 
 
-class AlbumLoadWorker(QThread):
-    """앨범 로딩 Worker Thread"""
+def load_albums_task(token, spotify):
+    """
+    저장된 앨범 로딩 작업 (공유 풀에서 실행)
 
-    finished = pyqtSignal(list)
-
-    def __init__(self, spotify_manager):
-        super().__init__()
-        self.spotify = spotify_manager
-
-    def run(self):
-        albums = self.spotify.get_saved_albums()
-        self.finished.emit(albums)
+    Returns:
+        tuple: (Album 리스트, 변경 여부) - 304이면 캐시된 목록과 False (화면이 다시 그릴지 결정)
+    """
+    # On 304 the cached body is still parsed: the ETag is shared with other callers,
+    # so a screen without rows may be seeing this list for the first time
+    items, modified = spotify.get_library('albums', raise_errors=True)
+    entities = spotify.entities
+    return entities.parse_many(entities.album, items), modified
 
 
 class AlbumScreen(QWidget):
@@ -47,7 +49,7 @@ class AlbumScreen(QWidget):
         super().__init__()
         self.parent = parent
         self.albums = []
-        self.worker = None
+        self.stale = False  # restored from the UI snapshot, not yet revalidated
         self.buttons = []
         self.setup_ui()
 
@@ -117,6 +119,8 @@ class AlbumScreen(QWidget):
         self.albums_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.albums_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.albums_list.itemClicked.connect(self.open_album)
+        self.albums_list.currentItemChanged.connect(self.prefetch_focused)
+        self.thumbnails = ThumbnailScheduler(self.albums_list, self.parent.images, self.parent.thumbnail_atlas)
         self.card_layout.addWidget(self.albums_list)
 
         self.content_layout.addWidget(self.card, alignment=Qt.AlignmentFlag.AlignHCenter)
@@ -131,16 +135,42 @@ class AlbumScreen(QWidget):
 
     def load_albums(self):
         """앨범 로드"""
-        self.info_label.setText("Loading albums…")
+        if self.albums:
+            # Revalidate in place; rows are only rebuilt if the server reports a change
+            self.info_label.setText("Checking for updates…")
+        else:
+            self.info_label.setText("Loading albums…")
+            self.albums_list.clear()
         self.info_label.setStyleSheet(f"color: {config.COLOR_PRIMARY};")
-        self.albums_list.clear()
 
-        self.worker = AlbumLoadWorker(self.parent.spotify)
-        self.worker.finished.connect(self.display_albums)
-        self.worker.start()
+        # A repeated load supersedes the previous one; its result is dropped
+        self.parent.tasks.submit(
+            'library.albums', load_albums_task, self.parent.spotify,
+            on_result=lambda result: self.display_albums(*result),
+            on_error=self.handle_load_error,
+        )
+
+    def handle_load_error(self, error):
+        """로드 실패 - 현재(복원된) 목록과 stale 표시는 유지하고 오류만 안내"""
+        if self.albums:
+            self.info_label.setText(f"Offline · showing {len(self.albums)} saved albums")
+            self.info_label.setStyleSheet(f"color: {config.COLOR_WARNING};")
+            return
 
-    def display_albums(self, albums):
+        self.albums_list.clear()
+        self.albums_list.addItem("Couldn't reach Spotify. Open this screen again to retry.")
+        self.info_label.setText("Failed to load saved albums")
+        self.info_label.setStyleSheet(f"color: {config.COLOR_ERROR};")
+
+    def display_albums(self, albums, modified=True):
         """앨범 표시"""
+        self.stale = False
+        if not modified and self.albums:
+            self.info_label.setText(f"Found {len(self.albums)} saved albums")
+            self.info_label.setStyleSheet(f"color: {config.COLOR_TEXT_SECONDARY};")
+            self.parent.detail_prefetcher.schedule('album', self.albums)
+            return
+
         self.albums = albums or []
         self.albums_list.clear()
 
@@ -153,25 +183,47 @@ class AlbumScreen(QWidget):
         self.info_label.setText(f"Found {len(self.albums)} saved albums")
         self.info_label.setStyleSheet(f"color: {config.COLOR_TEXT_SECONDARY};")
 
-        for item in self.albums:
-            if not item:
+        for album in self.albums:
+            if not album:
                 continue
 
-            album = item.get("album", {})
-            name = album.get("name", "Unknown Album")
-            artists = album.get("artists", [])
-            artist_names = ", ".join([a.get("name", "Unknown") for a in artists]) if artists else "Unknown"
-            track_count = album.get("total_tracks", 0)
-            release_date = album.get("release_date", "Unknown")[:4]
+            release_date = album.release_date[:4] or "Unknown"
 
             item_text = (
-                f"💿 {name}\n   👤 {artist_names}  ·  🎵 {track_count} tracks  ·  📅 {release_date}"
+                f"💿 {album.name}\n   👤 {album.artist_names}  ·  🎵 {album.total_tracks} tracks  ·  📅 {release_date}"
             )
 
             list_item = QListWidgetItem(item_text)
             list_item.setData(Qt.ItemDataRole.UserRole, album)
             self.albums_list.addItem(list_item)
 
+        # Warm the detail screen for the rows most likely to be opened next
+        self.parent.detail_prefetcher.schedule('album', self.albums)
+
+    def prefetch_focused(self, item, previous=None):
+        """포커스된 앨범의 트랙을 먼저 미리 불러오기"""
+        if item is not None:
+            self.parent.detail_prefetcher.focus('album', item.data(Qt.ItemDataRole.UserRole))
+
+    def snapshot_state(self):
+        """UI 스냅샷용 화면 상태"""
+        entities = self.parent.spotify.entities
+        return {
+            'albums': [entities.export(album) for album in self.albums],
+            'position': list_position(self, self.albums_list),
+        }
+
+    def restore_state(self, state):
+        """스냅샷 복원 (다음 로드가 교체할 때까지 stale 표시)"""
+        entities = self.parent.spotify.entities
+        albums = entities.parse_many(entities.album, state.get('albums'))
+        if not albums:
+            return
+        self.display_albums(albums)
+        self.stale = True
+        self.info_label.setText(f"{len(albums)} saved albums · updating…")
+        restore_list_position(self, self.albums_list, state.get('position'))
+
     def open_album(self, item):
         """앨범 열기"""
         album = item.data(Qt.ItemDataRole.UserRole)
@@ -357,5 +409,5 @@ class AlbumScreen(QWidget):
         """화면 표시시 자동 로드"""
         super().showEvent(event)
         self.adjust_layout()
-        if not self.albums:
+        if not self.albums or self.stale:
             self.load_albums()
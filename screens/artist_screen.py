@@ -3,6 +3,8 @@ Artist Screen
 아티스트 목록 화면
 """
 
+import bisect
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -15,8 +17,10 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt
 import config
+from thumbnail_loader import ThumbnailScheduler
+from ui_snapshot import list_position, restore_list_position
 from ui_styles import (
     BASE_STYLESHEET,
     apply_font_scaling,
@@ -26,18 +30,36 @@ from ui_styles import (
 )
 
 
-class ArtistLoadWorker(QThread):
-    """아티스트 로딩 Worker Thread"""
+def load_artists_task(token, spotify, stream=True):
+    """
+    팔로우한 아티스트 로딩 작업 (커서 페이지 단위 스트리밍, 공유 풀에서 실행)
 
-    finished = pyqtSignal(list)
+    Args:
+        token: TaskToken - 페이지마다 token.report((artists, reset)) 전달
+        spotify: SpotifyManager
+        stream (bool): 페이지가 도착할 때마다 전달 (False면 변경 시에만 한 번에 전달)
 
-    def __init__(self, spotify_manager):
-        super().__init__()
-        self.spotify = spotify_manager
+    Returns:
+        bool: 변경 여부
+    """
+    entities = spotify.entities
+    buffered = []
+    any_modified = False
+
+    # Errors propagate to on_error so a failed page never reports a truncated list as complete
+    for items, modified in spotify.iter_followed_artists(raise_errors=True):
+        if token.cancelled():
+            return False
+        any_modified = any_modified or modified
+        artists = entities.parse_many(entities.artist, items)
+        if stream:
+            token.report((artists, not buffered))
+        buffered.extend(artists)
 
-    def run(self):
-        artists = self.spotify.get_followed_artists()
-        self.finished.emit(artists)
+    if not stream and any_modified:
+        # Revalidation found a change: swap the whole list at once
+        token.report((buffered, True))
+    return any_modified or stream
 
 
 class ArtistScreen(QWidget):
@@ -46,8 +68,9 @@ class ArtistScreen(QWidget):
     def __init__(self, parent):
         super().__init__()
         self.parent = parent
-        self.artists = []
-        self.worker = None
+        self.artists = []       # kept sorted by sort_keys
+        self.sort_keys = []
+        self.stale = False  # restored from the UI snapshot, not yet revalidated
         self.buttons = []
         self.setup_ui()
 
@@ -117,6 +140,8 @@ class ArtistScreen(QWidget):
         self.artists_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.artists_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.artists_list.itemClicked.connect(self.open_artist)
+        self.artists_list.currentItemChanged.connect(self.prefetch_focused)
+        self.thumbnails = ThumbnailScheduler(self.artists_list, self.parent.images, self.parent.thumbnail_atlas)
         self.card_layout.addWidget(self.artists_list)
 
         self.content_layout.addWidget(self.card, alignment=Qt.AlignmentFlag.AlignHCenter)
@@ -131,20 +156,65 @@ class ArtistScreen(QWidget):
 
     def load_artists(self):
         """아티스트 로드"""
-        self.info_label.setText("Loading artists…")
+        if self.artists:
+            # Revalidate in place; rows are only rebuilt if the server reports a change
+            self.info_label.setText("Checking for updates…")
+        else:
+            self.info_label.setText("Loading artists…")
+            self.artists_list.clear()
         self.info_label.setStyleSheet(f"color: {config.COLOR_PRIMARY};")
-        self.artists_list.clear()
 
-        self.worker = ArtistLoadWorker(self.parent.spotify)
-        self.worker.finished.connect(self.display_artists)
-        self.worker.start()
+        # A repeated load supersedes the previous one; its batches are dropped
+        self.parent.tasks.submit(
+            'library.artists', load_artists_task, self.parent.spotify, not self.artists,
+            on_progress=lambda batch: self.append_artists(*batch),
+            on_result=self.display_artists,
+            on_error=self.handle_load_error,
+        )
+
+    def handle_load_error(self, error):
+        """로드 실패 - 현재(복원된) 목록과 stale 표시는 유지하고 오류만 안내"""
+        if self.artists:
+            # Streamed pages may be partial: revalidate again on the next visit
+            self.stale = True
+            self.info_label.setText(f"Offline · showing {len(self.artists)} saved artists")
+            self.info_label.setStyleSheet(f"color: {config.COLOR_WARNING};")
+            return
 
-    def display_artists(self, artists):
-        """아티스트 표시"""
-        self.artists = artists or []
         self.artists_list.clear()
+        self.artists_list.addItem("Couldn't reach Spotify. Open this screen again to retry.")
+        self.info_label.setText("Failed to load artists")
+        self.info_label.setStyleSheet(f"color: {config.COLOR_ERROR};")
+
+    def append_artists(self, artists, reset=False):
+        """
+        아티스트 배치를 알파벳 순서 위치에 삽입 (전체 재정렬 없음)
+
+        Args:
+            artists (list): Artist 레코드 리스트
+            reset (bool): 기존 목록을 비우고 시작
+        """
+        if reset:
+            self.artists = []
+            self.sort_keys = []
+            self.artists_list.clear()
+
+        for artist in artists:
+            if not artist:
+                continue
+            key = (artist.name.casefold(), artist.id or '')
+            position = bisect.bisect_right(self.sort_keys, key)
+            self.sort_keys.insert(position, key)
+            self.artists.insert(position, artist)
+            self.artists_list.insertItem(position, self.create_artist_item(artist))
+
+        self.info_label.setText(f"Loading artists… {len(self.artists)}")
 
+    def display_artists(self, modified=True):
+        """아티스트 로드 완료 처리"""
+        self.stale = False
         if not self.artists:
+            self.artists_list.clear()
             self.info_label.setText("No followed artists found")
             self.info_label.setStyleSheet(f"color: {config.COLOR_TEXT_SECONDARY};")
             self.artists_list.addItem("You're not following any artists yet.")
@@ -153,31 +223,57 @@ class ArtistScreen(QWidget):
         self.info_label.setText(f"Following {len(self.artists)} artists")
         self.info_label.setStyleSheet(f"color: {config.COLOR_TEXT_SECONDARY};")
 
-        for artist in self.artists:
-            if not artist:
-                continue
+        # Scheduled once the alphabetical order has settled
+        self.parent.detail_prefetcher.schedule('artist', self.artists)
 
-            name = artist.get("name", "Unknown Artist")
-            genres = artist.get("genres", [])
-            genre_text = ", ".join(genres[:2]) if genres else "Various genres"
+    def create_artist_item(self, artist):
+        """아티스트 리스트 항목 생성"""
+        name = artist.name
+        genres = artist.genres
+        genre_text = ", ".join(genres[:2]) if genres else "Various genres"
 
-            followers = artist.get("followers", {}).get("total", 0)
-            if followers >= 1_000_000:
-                followers_text = f"{followers / 1_000_000:.1f}M"
-            elif followers >= 1_000:
-                followers_text = f"{followers / 1_000:.1f}K"
-            else:
-                followers_text = str(followers)
+        followers = artist.followers
+        if followers >= 1_000_000:
+            followers_text = f"{followers / 1_000_000:.1f}M"
+        elif followers >= 1_000:
+            followers_text = f"{followers / 1_000:.1f}K"
+        else:
+            followers_text = str(followers)
 
-            popularity = artist.get("popularity", 0)
+        popularity = artist.popularity
 
-            item_text = (
-                f"🎤 {name}\n   🎵 {genre_text}  ·  👥 {followers_text} followers  ·  ⭐ {popularity}% popular"
-            )
+        item_text = (
+            f"🎤 {name}\n   🎵 {genre_text}  ·  👥 {followers_text} followers  ·  ⭐ {popularity}% popular"
+        )
 
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, artist)
-            self.artists_list.addItem(item)
+        item = QListWidgetItem(item_text)
+        item.setData(Qt.ItemDataRole.UserRole, artist)
+        return item
+
+    def prefetch_focused(self, item, previous=None):
+        """포커스된 아티스트의 상세 정보를 먼저 미리 불러오기"""
+        if item is not None:
+            self.parent.detail_prefetcher.focus('artist', item.data(Qt.ItemDataRole.UserRole))
+
+    def snapshot_state(self):
+        """UI 스냅샷용 화면 상태"""
+        entities = self.parent.spotify.entities
+        return {
+            'artists': [entities.export(artist) for artist in self.artists],
+            'position': list_position(self, self.artists_list),
+        }
+
+    def restore_state(self, state):
+        """스냅샷 복원 (다음 로드가 교체할 때까지 stale 표시)"""
+        entities = self.parent.spotify.entities
+        artists = entities.parse_many(entities.artist, state.get('artists'))
+        if not artists:
+            return
+        self.append_artists(artists, reset=True)
+        self.display_artists()
+        self.stale = True
+        self.info_label.setText(f"{len(artists)} saved artists · updating…")
+        restore_list_position(self, self.artists_list, state.get('position'))
 
     def open_artist(self, item):
         """아티스트 열기"""
@@ -364,5 +460,5 @@ class ArtistScreen(QWidget):
         """화면 표시시 자동 로드"""
         super().showEvent(event)
         self.adjust_layout()
-        if not self.artists:
+        if not self.artists or self.stale:
             self.load_artists()
@@ -3,20 +3,29 @@ Detail Screen
 플레이리스트/앨범/아티스트의 트랙 상세 목록 화면
 """
 
+from functools import partial
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
+    QListView,
     QListWidget,
-    QLabel,
     QListWidgetItem,
+    QLineEdit,
+    QLabel,
     QFrame,
     QScrollArea,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QPoint
 import config
+from detail_loader import ARTIST_SECTIONS, fetch_artist_section, fetch_track_table, track_cache_key
+from thumbnail_loader import ThumbnailScheduler
+from track_list_model import TrackListModel
+from track_table import TrackTable
+from track_window import WindowedTrackModel
 from ui_styles import (
     BASE_STYLESHEET,
     apply_font_scaling,
@@ -26,42 +35,51 @@ from ui_styles import (
 )
 
 
-class TrackLoadWorker(QThread):
-    """트랙 데이터 로딩 Worker"""
-    finished = pyqtSignal(list)
-    
-    def __init__(self, spotify_manager, item_type, item_id):
-        super().__init__()
-        self.spotify = spotify_manager
-        self.item_type = item_type
-        self.item_id = item_id
-        
-    def run(self):
-        tracks = []
-        try:
-            if self.item_type == 'playlist':
-                results = self.spotify.get_playlist_tracks(self.item_id)
-                tracks = [item['track'] for item in results if item.get('track')]
-            elif self.item_type == 'album':
-                tracks = self.spotify.get_album_tracks(self.item_id)
-            elif self.item_type == 'artist':
-                tracks = self.spotify.get_artist_top_tracks(self.item_id)
-        except Exception as e:
-            print(f"Failed to load tracks: {e}")
-        
-        self.finished.emit(tracks)
+def load_tracks_task(token, spotify, item_type, item_id, cache_key=None):
+    """
+    트랙 데이터 로딩 작업 (열 기반 TrackTable까지 공유 풀에서 구성)
+
+    Returns:
+        TrackTable: 트랙 테이블
+
+    Raises:
+        Exception: 페이지 요청 실패 (TaskPool이 on_error로 전달, 부분 테이블은 캐시하지 않음)
+    """
+    table = fetch_track_table(spotify, item_type, item_id, token.cancelled)
+    # Only a complete table reaches here: failed pages raise and cancelled loads stop early
+    if cache_key and len(table) and not token.cancelled():
+        spotify.cache_put(cache_key, table, config.DETAIL_TRACKS_CACHE_TTL)
+    return table
+
+
+def load_artist_section_task(token, spotify, artist_id, section):
+    """아티스트 상세 섹션 하나 로딩 작업 (섹션마다 따로 제출되어 동시에 실행)"""
+    return fetch_artist_section(spotify, artist_id, section)
 
 
 class DetailScreen(QWidget):
     """상세 화면 클래스"""
     
+    # (label, TrackTable sort key, descending)
+    SORT_MODES = (
+        ("#", 'position', False),
+        ("Title", 'title', False),
+        ("Artist", 'artist', False),
+        ("Duration", 'duration', True),
+        ("Added", 'added_at', True),
+    )
+    
     def __init__(self, parent):
         super().__init__()
         self.parent = parent
         self.current_item = None
         self.current_type = None
+        self.return_screen = None  # screen index to go back to, when not the library list
         self.tracks = []
-        self.worker = None
+        self.table = None
+        self.table_version = None  # ('playlist', id, snapshot_id) of the loaded table
+        self.sort_index = 0
+        self.artist_sections = {}  # sections of the artist being loaded, cached once complete (None = failed)
         self.buttons = []
         self.setup_ui()
         
@@ -129,6 +147,13 @@ class DetailScreen(QWidget):
         self.stats_label.setProperty("role", "caption")
         self.card_layout.addWidget(self.stats_label)
 
+        self.description_label = QLabel("")
+        self.description_label.setObjectName("descriptionLabel")
+        self.description_label.setProperty("role", "caption")
+        self.description_label.setWordWrap(True)
+        self.description_label.hide()
+        self.card_layout.addWidget(self.description_label)
+
         self.loading_label = QLabel("Loading tracks…")
         self.loading_label.setObjectName("loadingLabel")
         self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -149,15 +174,57 @@ class DetailScreen(QWidget):
         tracks_layout.addWidget(tracks_label)
         self.tracks_label = tracks_label
 
-        self.tracks_list = QListWidget()
+        controls = QHBoxLayout()
+        controls.setSpacing(10)
+
+        self.filter_input = QLineEdit()
+        self.filter_input.setObjectName("trackFilter")
+        self.filter_input.setPlaceholderText("Filter by title, artist or album…")
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_input.textChanged.connect(self.apply_view)
+        self.filter_input.returnPressed.connect(self.jump_from_input)
+        controls.addWidget(self.filter_input, 1)
+
+        self.sort_btn = QPushButton()
+        self.sort_btn.setProperty("variant", "ghost")
+        self.sort_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.sort_btn.clicked.connect(self.cycle_sort)
+        controls.addWidget(self.sort_btn)
+        self.buttons.append(self.sort_btn)
+        self.update_sort_button()
+
+        tracks_layout.addLayout(controls)
+
+        self.empty_label = QLabel("")
+        self.empty_label.setObjectName("loadingLabel")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.hide()
+        tracks_layout.addWidget(self.empty_label)
+
+        # Model/view: rows are rendered lazily from the table, sorting only permutes indices
+        self.tracks_model = TrackListModel(self)
+        self.tracks_list = QListView()
         self.tracks_list.setObjectName("tracksList")
+        self.window_model = WindowedTrackModel(self.parent.spotify, self.parent.tasks, self)
+        self.tracks_list.setModel(self.tracks_model)
+        self.tracks_list.setUniformItemSizes(True)
+        self.tracks_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         self.tracks_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.tracks_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.tracks_list.itemDoubleClicked.connect(self.play_track)
+        self.tracks_list.doubleClicked.connect(self.play_track)
+        self.tracks_list.verticalScrollBar().valueChanged.connect(self.update_window)
+        self.thumbnails = ThumbnailScheduler(self.tracks_list, self.parent.images, self.parent.thumbnail_atlas)
+        self.thumbnails.watch_model(self.window_model)
         tracks_layout.addWidget(self.tracks_list)
 
         self.card_layout.addWidget(tracks_section)
 
+        # Artist-only sections, filled progressively by the per-section tasks
+        self.albums_section, self.albums_list = self.create_artist_section("Albums & Singles")
+        self.albums_list.itemDoubleClicked.connect(self.open_album_item)
+        self.related_section, self.related_list = self.create_artist_section("Related Artists")
+        self.related_list.itemDoubleClicked.connect(self.open_artist_item)
+
         self.content_layout.addWidget(self.card, alignment=Qt.AlignmentFlag.AlignHCenter)
         self.content_layout.addStretch(1)
 
@@ -171,59 +238,68 @@ class DetailScreen(QWidget):
     def load_playlist(self, playlist):
         """플레이리스트 로드"""
         self.current_item = playlist
+        self.return_screen = None
         self.current_type = 'playlist'
         
         # Update info
-        name = playlist.get('name', 'Unknown Playlist')
-        self.title_label.setText(f"📝 {name}")
+        self.title_label.setText(f"📝 {playlist.name}")
+        self.subtitle_label.setText(f"by {playlist.owner_name}")
+        self.stats_label.setText(f"🎵 {playlist.total_tracks} tracks")
         
-        owner = playlist.get('owner', {}).get('display_name', 'Unknown')
-        self.subtitle_label.setText(f"by {owner}")
+        # Cached AI description (generated at idle time, keyed by snapshot_id)
+        self.show_description(self.parent.description_store.get(playlist.id, playlist.snapshot_id))
         
-        track_count = playlist.get('tracks', {}).get('total', 0)
-        self.stats_label.setText(f"🎵 {track_count} tracks")
+        # Unchanged snapshot_id means the loaded table is still current
+        # (an empty table may be a failed load, so it never short-circuits)
+        version = ('playlist', playlist.id, playlist.snapshot_id)
+        if playlist.snapshot_id and self.table is not None and len(self.table) and self.table_version == version:
+            return
+        
+        self.show_artist_sections(False)
         
         # Load tracks
-        playlist_id = playlist.get('id')
-        if playlist_id:
-            self.load_tracks('playlist', playlist_id)
+        if playlist.id and playlist.total_tracks > config.PLAYLIST_WINDOW_THRESHOLD:
+            self.load_windowed(playlist)
+        elif playlist.id:
+            self.load_tracks('playlist', playlist.id, track_cache_key('playlist', playlist.id, playlist.snapshot_id))
+            self.table_version = version
         
     def load_album(self, album):
         """앨범 로드"""
         self.current_item = album
+        self.return_screen = None
         self.current_type = 'album'
         
         # Update info
-        name = album.get('name', 'Unknown Album')
-        self.title_label.setText(f"💿 {name}")
+        self.title_label.setText(f"💿 {album.name}")
+        self.subtitle_label.setText(f"by {album.artist_names}")
         
-        artists = album.get('artists', [])
-        artist_text = ', '.join([a.get('name', 'Unknown') for a in artists]) if artists else 'Unknown'
-        self.subtitle_label.setText(f"by {artist_text}")
+        release_date = album.release_date[:4] or 'Unknown'
+        self.stats_label.setText(f"🎵 {album.total_tracks} tracks | 📅 {release_date}")
+        self.show_description(None)
         
-        track_count = album.get('total_tracks', 0)
-        release_date = album.get('release_date', 'Unknown')[:4]
-        self.stats_label.setText(f"🎵 {track_count} tracks | 📅 {release_date}")
+        self.show_artist_sections(False)
         
-        # Load tracks
-        album_id = album.get('id')
-        if album_id:
-            self.load_tracks('album', album_id)
+        # Load tracks (saved albums usually embed all of them: no round trip)
+        if album.id and album.has_all_tracks:
+            self.reset_tracks()
+            self.display_tracks(TrackTable(list(album.tracks)))
+        elif album.id:
+            self.load_tracks('album', album.id, track_cache_key('album', album.id))
         
     def load_artist(self, artist):
         """아티스트 로드"""
         self.current_item = artist
+        self.return_screen = None
         self.current_type = 'artist'
         
         # Update info
-        name = artist.get('name', 'Unknown Artist')
-        self.title_label.setText(f"🎤 {name}")
+        self.title_label.setText(f"🎤 {artist.name}")
         
-        genres = artist.get('genres', [])
-        genre_text = ', '.join(genres[:3]) if genres else 'Various genres'
+        genre_text = ', '.join(artist.genres[:3]) if artist.genres else 'Various genres'
         self.subtitle_label.setText(f"🎵 {genre_text}")
         
-        followers = artist.get('followers', {}).get('total', 0)
+        followers = artist.followers
         if followers >= 1000000:
             followers_text = f"{followers / 1000000:.1f}M"
         elif followers >= 1000:
@@ -231,104 +307,368 @@ class DetailScreen(QWidget):
         else:
             followers_text = str(followers)
         
-        popularity = artist.get('popularity', 0)
-        self.stats_label.setText(f"👥 {followers_text} followers | ⭐ {popularity}% popularity")
+        self.stats_label.setText(f"👥 {followers_text} followers | ⭐ {artist.popularity}% popularity")
+        self.show_description(None)
+        
+        # Top tracks, albums and related artists
+        if artist.id:
+            self.load_artist_detail(artist.id)
+        
+    def create_artist_section(self, title):
+        """아티스트 전용 섹션(제목 + 리스트) 생성"""
+        section = QFrame()
+        section.setObjectName("section")
+        layout = QVBoxLayout(section)
+        layout.setContentsMargins(20, 16, 20, 16)
+        layout.setSpacing(10)
+        
+        label = QLabel(title)
+        label.setObjectName("tracksLabel")
+        label.setProperty("role", "subtitle")
+        layout.addWidget(label)
+        
+        list_widget = QListWidget()
+        list_widget.setObjectName("artistSectionList")
+        list_widget.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        layout.addWidget(list_widget)
+        
+        section.hide()
+        self.card_layout.addWidget(section)
+        return section, list_widget
+    
+    def show_artist_sections(self, visible):
+        """아티스트 전용 섹션 표시/숨김"""
+        for section, list_widget in (
+            (self.albums_section, self.albums_list),
+            (self.related_section, self.related_list),
+        ):
+            list_widget.clear()
+            if visible:
+                list_widget.addItem("Loading…")
+            section.setVisible(visible)
+        self.adjust_layout()
+    
+    def load_artist_detail(self, artist_id):
+        """아티스트 상세 로드 (캐시에 있으면 즉시 표시)"""
+        self.reset_tracks()
+        self.show_artist_sections(True)
+        
+        cached = self.parent.spotify.cache_get(('artist_detail', artist_id))
+        if cached:
+            for section, data in cached.items():
+                self.display_artist_section(artist_id, section, data)
+            return
+        
+        self.loading_label.show()
+        self.empty_label.hide()
         
-        # Load top tracks
-        artist_id = artist.get('id')
-        if artist_id:
-            self.load_tracks('artist', artist_id)
+        # Independent endpoints: issue them together and render each as it lands
+        self.artist_sections = {}
+        for section in ARTIST_SECTIONS:
+            self.parent.tasks.submit(
+                f'detail.artist.{section}', load_artist_section_task, self.parent.spotify, artist_id, section,
+                on_result=partial(self.handle_artist_section, artist_id, section),
+                on_error=partial(self.handle_artist_section_error, artist_id, section),
+            )
+    
+    def handle_artist_section(self, artist_id, section, data):
+        """아티스트 섹션 도착 - 표시하고, 모두 성공적으로 모이면 캐시"""
+        self.artist_sections[section] = data
+        if (len(self.artist_sections) == len(ARTIST_SECTIONS)
+                and all(value is not None for value in self.artist_sections.values())):
+            self.parent.spotify.cache_put(
+                ('artist_detail', artist_id), dict(self.artist_sections), config.ARTIST_DETAIL_CACHE_TTL
+            )
+        self.display_artist_section(artist_id, section, data)
+    
+    def handle_artist_section_error(self, artist_id, section, error):
+        """아티스트 섹션 로딩 실패 - 실패로 표시하고 이 아티스트 상세는 캐시하지 않음"""
+        self.artist_sections[section] = None
+        if self.current_type != 'artist' or self.current_item is None or self.current_item.id != artist_id:
+            return
+        
+        if section == 'top_tracks':
+            self.loading_label.hide()
+            self.show_empty("Failed to load top tracks")
+            self.play_all_btn.setEnabled(False)
+        else:
+            list_widget = self.albums_list if section == 'albums' else self.related_list
+            list_widget.clear()
+            list_widget.addItem("Failed to load")
+    
+    def display_artist_section(self, artist_id, section, data):
+        """도착한 아티스트 섹션 표시 (다른 화면으로 바뀌었으면 무시)"""
+        if self.current_type != 'artist' or self.current_item is None or self.current_item.id != artist_id:
+            return
+        
+        if section == 'top_tracks':
+            self.display_tracks(data)
+        elif section == 'albums':
+            self.albums_list.clear()
+            for album in data:
+                release_year = album.release_date[:4] or '—'
+                item = QListWidgetItem(f"💿 {album.name}\n   📅 {release_year} · 🎵 {album.total_tracks} tracks")
+                item.setData(Qt.ItemDataRole.UserRole, album)
+                self.albums_list.addItem(item)
+            if not data:
+                self.albums_list.addItem("No albums found")
+        elif section == 'related':
+            self.related_list.clear()
+            for artist in data:
+                item = QListWidgetItem(f"🎤 {artist.name}\n   ⭐ {artist.popularity}% popular")
+                item.setData(Qt.ItemDataRole.UserRole, artist)
+                self.related_list.addItem(item)
+            if not data:
+                self.related_list.addItem("No related artists found")
+    
+    def open_album_item(self, item):
+        """아티스트 앨범 열기"""
+        album = item.data(Qt.ItemDataRole.UserRole)
+        if album:
+            self.load_album(album)
+    
+    def open_artist_item(self, item):
+        """비슷한 아티스트 열기"""
+        artist = item.data(Qt.ItemDataRole.UserRole)
+        if artist:
+            self.load_artist(artist)
         
-    def load_tracks(self, item_type, item_id):
-        """트랙 로드 시작"""
+    def show_description(self, description):
+        """AI 설명 표시 (없으면 숨김)"""
+        if description:
+            self.description_label.setText(f"💬 {description}")
+            self.description_label.show()
+        else:
+            self.description_label.hide()
+        
+    def use_windowed_model(self, windowed):
+        """리스트 모델 전환 (윈도우 모드에서는 전체 데이터가 없어 정렬 비활성화, 입력창은 트랙 번호 이동용)"""
+        model = self.window_model if windowed else self.tracks_model
+        if self.tracks_list.model() is not model:
+            self.tracks_list.setModel(model)
+            self.thumbnails.refresh()
+        if not windowed:
+            self.window_model.clear()
+        self.filter_input.setPlaceholderText(
+            "Jump to track # and press Enter…" if windowed else "Filter by title, artist or album…"
+        )
+        self.sort_btn.setEnabled(not windowed)
+    
+    def load_windowed(self, playlist):
+        """큰 플레이리스트를 페이지 단위로 로드"""
+        self.cancel_loads()
+        self.table = None
+        self.table_version = None
+        self.tracks = []
+        self.tracks_model.set_table(None)
+        self.use_windowed_model(True)
+        self.loading_label.hide()
+        self.empty_label.hide()
+        self.filter_input.clear()
+        
+        self.window_model.set_playlist(playlist.id, playlist.total_tracks)
+        self.tracks_list.scrollToTop()
+        self.tracks_label.setText(f"Tracks · {playlist.total_tracks}")
+        self.play_all_btn.setEnabled(True)
+        self.update_window()
+    
+    def update_window(self, *args):
+        """보이는 행 범위를 윈도우 모델에 전달"""
+        if self.tracks_list.model() is not self.window_model or not self.window_model.total:
+            return
+        
+        viewport = self.tracks_list.viewport()
+        first = self.tracks_list.indexAt(QPoint(0, 0)).row()
+        last = self.tracks_list.indexAt(QPoint(0, viewport.height() - 1)).row()
+        first = max(0, first)
+        if last < 0:
+            # Not laid out yet (or the list ends above the viewport bottom)
+            last = first + config.PLAYLIST_PAGE_SIZE // 4
+        self.window_model.update_viewport(first, last)
+    
+    def jump_from_input(self):
+        """윈도우 모드에서 입력한 트랙 번호(1부터)로 이동"""
+        if self.tracks_list.model() is not self.window_model:
+            return
+        text = self.filter_input.text().strip().lstrip('#')
+        if not text.isdigit():
+            return
+        total = self.window_model.rowCount()
+        self.jump_to_track(min(max(int(text), 1), total) - 1)
+    
+    def jump_to_track(self, row):
+        """행 번호로 이동 (윈도우 모드에서는 해당 페이지를 불러옴)"""
+        model = self.tracks_list.model()
+        if not 0 <= row < model.rowCount():
+            return
+        self.tracks_list.scrollTo(model.index(row), QListView.ScrollHint.PositionAtTop)
+        self.update_window()
+    
+    def cancel_loads(self):
+        """이전 항목의 진행 중인 로드 취소 (늦게 도착한 결과가 새 항목을 덮어쓰지 않도록)"""
+        self.parent.tasks.cancel('detail.tracks')
+        for section in ARTIST_SECTIONS:
+            self.parent.tasks.cancel(f'detail.artist.{section}')
+    
+    def reset_tracks(self):
+        """트랙 목록과 필터 초기화"""
+        self.cancel_loads()
+        self.table = None
+        self.table_version = None
+        self.tracks = []
+        self.tracks_model.set_table(None)
+        self.use_windowed_model(False)
+        self.tracks_label.setText("Tracks")
+        self.filter_input.blockSignals(True)
+        self.filter_input.clear()
+        self.filter_input.blockSignals(False)
+    
+    def load_tracks(self, item_type, item_id, cache_key=None):
+        """트랙 로드 시작 (목록 화면에서 미리 불러온 테이블이 있으면 즉시 표시)"""
+        self.reset_tracks()
+
         if not item_id:
-            self.tracks_list.addItem("Error: Invalid ID")
+            self.show_empty("Error: Invalid ID")
+            return
+        
+        cached = self.parent.spotify.cache_get(cache_key) if cache_key else None
+        if cached is not None:
+            self.display_tracks(cached)
             return
         
         self.loading_label.show()
-        self.tracks_list.clear()
+        self.empty_label.hide()
         
-        self.worker = TrackLoadWorker(self.parent.spotify, item_type, item_id)
-        self.worker.finished.connect(self.display_tracks)
-        self.worker.start()
+        self.parent.tasks.submit(
+            'detail.tracks', load_tracks_task, self.parent.spotify, item_type, item_id, cache_key,
+            on_result=self.display_tracks,
+            on_error=self.handle_tracks_error,
+        )
         
-    def display_tracks(self, tracks):
+    def handle_tracks_error(self, error):
+        """트랙 로딩 실패 - 빈 목록 대신 오류 표시"""
+        self.loading_label.hide()
+        self.tracks_model.set_table(None)
+        self.play_all_btn.setEnabled(False)
+        self.show_empty("Failed to load tracks. Open it again to retry.")
+        
+    def display_tracks(self, table):
         """트랙 목록 표시"""
         self.loading_label.hide()
-        self.tracks = tracks
-        self.tracks_list.clear()
+        self.table = table
+        self.tracks = table.tracks
         
-        if not tracks:
-            self.tracks_list.addItem("No tracks found")
+        if not len(table):
+            self.tracks_model.set_table(None)
+            self.show_empty("No tracks found")
             self.play_all_btn.setEnabled(False)
             return
         
+        self.empty_label.hide()
         self.play_all_btn.setEnabled(True)
+        self.tracks_model.set_table(table, self.current_order())
+        self.update_stats()
+    
+    def current_order(self):
+        """현재 필터/정렬 상태의 인덱스 순열"""
+        key, descending = self.SORT_MODES[self.sort_index][1:]
+        indices = self.table.filter(self.filter_input.text())
+        if key == 'position' and not descending:
+            return indices
+        return self.table.sort(key, descending, indices)
+    
+    def apply_view(self, *args):
+        """필터/정렬 변경 반영 (인덱스 순열만 교체)"""
+        if self.table is None or not len(self.table):
+            return
         
-        for idx, track in enumerate(tracks, 1):
-            if not track:
-                continue
-            
-            track_name = track.get('name', 'Unknown')
-            
-            # Artist names
-            artists = track.get('artists', [])
-            if artists:
-                artist_names = ', '.join([a.get('name', 'Unknown') for a in artists])
-            else:
-                artist_names = 'Unknown'
-            
-            # Duration
-            duration_ms = track.get('duration_ms', 0)
-            duration_min = duration_ms // 60000
-            duration_sec = (duration_ms % 60000) // 1000
-            
-            # Display format
-            item_text = f"{idx}. {track_name}\n   👤 {artist_names} | ⏱ {duration_min}:{duration_sec:02d}"
-            
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, track)
-            self.tracks_list.addItem(item)
+        order = self.current_order()
+        self.tracks_model.set_order(order)
+        if len(order):
+            self.empty_label.hide()
+        else:
+            self.show_empty("No matching tracks")
+        self.update_stats()
+    
+    def cycle_sort(self):
+        """정렬 기준 순환"""
+        self.sort_index = (self.sort_index + 1) % len(self.SORT_MODES)
+        self.update_sort_button()
+        self.apply_view()
+    
+    def update_sort_button(self):
+        """정렬 버튼 텍스트 갱신"""
+        self.sort_btn.setText(f"⇅ {self.SORT_MODES[self.sort_index][0]}")
     
-    def play_track(self, item):
-        """선택한 트랙 재생"""
-        track = item.data(Qt.ItemDataRole.UserRole)
-        
-        if track and track.get('uri'):
-            uri = track['uri']
-            self.parent.spotify.play_track(uri)
-            # Navigate to player screen
-            self.parent.navigate_to(6)
+    def update_stats(self):
+        """보이는 트랙 수와 총 재생 시간 표시"""
+        order = self.tracks_model.order
+        total_min = self.table.total_duration_ms(order) // 60000
+        if total_min >= 60:
+            duration_text = f"{total_min // 60}h {total_min % 60}m"
         else:
+            duration_text = f"{total_min}m"
+        
+        shown = len(order)
+        count_text = f"{shown}/{len(self.table)}" if shown != len(self.table) else str(shown)
+        self.tracks_label.setText(f"Tracks · {count_text} · ⏱ {duration_text}")
+    
+    def show_empty(self, message):
+        """빈 목록/오류 메시지 표시"""
+        self.empty_label.setText(message)
+        self.empty_label.show()
+    
+    def plays_in_context_order(self):
+        """보이는 순서가 Spotify 컨텍스트 순서와 같은지 (정렬/필터 없음)"""
+        if not self.current_item or not self.current_item.uri:
+            return False
+        if self.tracks_list.model() is self.window_model:
+            return True
+        return self.sort_index == 0 and not self.filter_input.text().strip()
+    
+    def play_track(self, index):
+        """선택한 트랙부터 재생 (목록의 나머지가 이어서 재생됨)"""
+        model = self.tracks_list.model()
+        track = model.data(index, Qt.ItemDataRole.UserRole)
+        
+        if not track or not track.uri:
             print("❌ No valid track URI")
+            return
+        
+        spotify = self.parent.spotify
+        if self.current_type in ('playlist', 'album') and self.plays_in_context_order():
+            # Windowed rows match playlist positions; table rows skip unavailable items
+            if model is self.window_model:
+                offset = {'position': index.row()}
+            else:
+                offset = {'uri': track.uri}
+            self.parent.start_playback(track, spotify.play_context, self.current_item.uri, offset)
+        else:
+            # Artist contexts take no offset, and sorted/filtered views have no context order
+            uris = [t.uri for t in model.visible_tracks()]
+            self.parent.start_playback(track, spotify.play_tracks, uris, start=index.row())
     
     def play_all(self):
-        """모든 트랙 재생"""
-        if not self.tracks or len(self.tracks) == 0:
-            print("❌ No tracks to play")
+        """보이는 트랙을 현재 순서대로 재생"""
+        if self.plays_in_context_order():
+            # Constant-size request however long the playlist is
+            first = self.tracks_list.model().track_at(0) if self.current_type != 'artist' else None
+            self.parent.start_playback(first, self.parent.spotify.play_context, self.current_item.uri)
             return
         
-        # Get all valid URIs
-        uris = []
-        for track in self.tracks:
-            if track and track.get('uri'):
-                uris.append(track['uri'])
-        
+        uris = [track.uri for track in self.tracks_list.model().visible_tracks() if track and track.uri]
         if not uris:
             print("❌ No valid track URIs")
             return
         
-        try:
-            self.parent.spotify.play_tracks(uris)
-            print(f"▶ Playing {len(uris)} tracks")
-            # Navigate to player screen
-            self.parent.navigate_to(6)
-        except Exception as e:
-            print(f"❌ Failed to play all: {e}")
+        self.parent.start_playback(self.tracks_list.model().track_at(0), self.parent.spotify.play_tracks, uris)
     
     def go_back(self):
         """뒤로 가기"""
-        if self.current_type == 'playlist':
+        if self.return_screen is not None:
+            self.parent.navigate_to(self.return_screen)
+        elif self.current_type == 'playlist':
             self.parent.navigate_to(3)
         elif self.current_type == 'album':
             self.parent.navigate_to(4)
@@ -359,33 +699,60 @@ class DetailScreen(QWidget):
                 color: rgba(255, 255, 255, 0.65);
             }}
 
+            QWidget#detailScreen QLabel#descriptionLabel {{
+                color: {config.COLOR_TEXT_SECONDARY};
+                font-style: italic;
+            }}
+
             QWidget#detailScreen QLabel#loadingLabel {{
                 padding: 1.1em;
                 color: {config.COLOR_PRIMARY};
             }}
 
+            QWidget#detailScreen QLineEdit#trackFilter {{
+                background-color: rgba(255, 255, 255, 0.07);
+                border: 1px solid rgba(255, 255, 255, 0.12);
+                border-radius: 12px;
+                padding: 0.6em 0.9em;
+                color: {config.COLOR_TEXT};
+            }}
+
+            QWidget#detailScreen QLineEdit#trackFilter:focus {{
+                border-color: {config.COLOR_ACCENT};
+            }}
+
             QWidget#detailScreen QPushButton[variant="accent"]:disabled {{
                 background: rgba(255, 255, 255, 0.22);
                 color: rgba(14, 17, 23, 0.55);
             }}
 
-            QWidget#detailScreen QListWidget#tracksList {{
+            QWidget#detailScreen QListView#tracksList {{
                 line-height: 1.45em;
             }}
 
-            QWidget#detailScreen QListWidget#tracksList::item {{
+            QWidget#detailScreen QListView#tracksList::item {{
                 padding: 12px 12px;
                 border-radius: 10px;
                 margin: 2px 0;
                 border: 1px solid transparent;
             }}
 
-            QWidget#detailScreen QListWidget#tracksList::item:selected {{
+            QWidget#detailScreen QListView#tracksList::item:selected {{
                 border-color: rgba(102, 255, 224, 0.35);
                 background-color: rgba(102, 255, 224, 0.18);
             }}
 
-            QWidget#detailScreen QListWidget#tracksList::item:hover {{
+            QWidget#detailScreen QListWidget#artistSectionList::item {{
+                padding: 10px 12px;
+                border-radius: 10px;
+                margin: 2px 0;
+            }}
+
+            QWidget#detailScreen QListWidget#artistSectionList::item:hover {{
+                background-color: rgba(255, 255, 255, 0.08);
+            }}
+
+            QWidget#detailScreen QListView#tracksList::item:hover {{
                 background-color: rgba(255, 255, 255, 0.08);
             }}
             """
@@ -435,10 +802,19 @@ class DetailScreen(QWidget):
             btn.setMinimumHeight(button_height)
             btn.setMinimumWidth(max(110, int(round(190 * effective_scale))))
 
+        # Artist pages share the card height with the albums/related sections
+        artist_sections = hasattr(self, "albums_section") and not self.albums_section.isHidden()
+
         if hasattr(self, "tracks_list"):
-            list_height = max(240, int(available_height * 0.55))
+            list_ratio = 0.3 if artist_sections else 0.55
+            list_height = max(160 if artist_sections else 240, int(available_height * list_ratio))
             self.tracks_list.setMinimumHeight(list_height)
 
+        if artist_sections:
+            section_height = max(96, int(available_height * 0.14))
+            self.albums_list.setMinimumHeight(section_height)
+            self.related_list.setMinimumHeight(section_height)
+
         if hasattr(self, "scroll_container"):
             self.scroll_container.setMinimumHeight(available_height)
             self.scroll_container.setMaximumHeight(available_height)
@@ -464,12 +840,19 @@ class DetailScreen(QWidget):
             scaling_config.append(("subtitle", self.subtitle_label, 14, 10))
         if hasattr(self, "stats_label"):
             scaling_config.append(("caption", self.stats_label, 11, 9))
+        if hasattr(self, "description_label"):
+            scaling_config.append(("caption", self.description_label, 11, 9))
         if hasattr(self, "loading_label"):
             scaling_config.append(("caption", self.loading_label, 11, 9))
         if hasattr(self, "tracks_label"):
             scaling_config.append(("section", self.tracks_label, 14, 11))
         if hasattr(self, "tracks_list"):
             scaling_config.append(("list", self.tracks_list, 11, 9))
+        if hasattr(self, "filter_input"):
+            scaling_config.append(("list", self.filter_input, 11, 9))
+        if hasattr(self, "albums_list"):
+            scaling_config.append(("list", self.albums_list, 11, 9))
+            scaling_config.append(("list", self.related_list, 11, 9))
 
         scaling_config.extend(("button", btn, 12, 9) for btn in self.buttons)
 
@@ -531,11 +914,11 @@ class DetailScreen(QWidget):
                 padding: {button_vpad}px {button_hpad}px;
             }}
 
-            QWidget#detailScreen QListWidget#tracksList {{
+            QWidget#detailScreen QListView#tracksList {{
                 font-size: {list_pt}pt;
             }}
 
-            QWidget#detailScreen QListWidget#tracksList::item {{
+            QWidget#detailScreen QListView#tracksList::item {{
                 padding: {item_vpad}px {item_hpad}px;
             }}
         """
@@ -546,6 +929,7 @@ class DetailScreen(QWidget):
         """창 크기 변경 대응"""
         super().resizeEvent(event)
         self.adjust_layout()
+        self.update_window()
 
     def showEvent(self, event):
         """화면 표시시 호출"""
@@ -3,6 +3,8 @@ Player Screen
 음악 재생 화면
 """
 
+import time
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -15,7 +17,10 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
 )
 from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QPixmap
 import config
+from image_cache import pick_image
+from queue_prefetcher import record_display, track_display
 from ui_styles import (
     BASE_STYLESHEET,
     apply_font_scaling,
@@ -32,6 +37,11 @@ class PlayerScreen(QWidget):
         self.parent = parent
         self.current_track = None
         self.is_playing = False
+        self.art_key = None  # (url, size) currently shown in album_art
+        self.shown_uri = None
+        self.pending_uri = None   # optimistically shown track awaiting API confirmation
+        self.pending_from = None  # track that was playing before it
+        self.pending_deadline = 0
         self.buttons = []
         self.setup_ui()
         self.setup_timer()
@@ -112,6 +122,23 @@ class PlayerScreen(QWidget):
 
         self.card_layout.addLayout(info_layout)
 
+        # Warmed in the background on every track change, so these open instantly
+        links_layout = QHBoxLayout()
+        links_layout.setSpacing(10)
+        links_layout.addStretch()
+        self.album_link_btn = QPushButton("💿 Go to album")
+        self.album_link_btn.clicked.connect(self.go_to_album)
+        self.artist_link_btn = QPushButton("🎤 Go to artist")
+        self.artist_link_btn.clicked.connect(self.go_to_artist)
+        for btn in (self.album_link_btn, self.artist_link_btn):
+            btn.setProperty("variant", "ghost")
+            btn.setObjectName("playerLinkButton")
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            btn.setEnabled(False)
+            links_layout.addWidget(btn)
+        links_layout.addStretch()
+        self.card_layout.addLayout(links_layout)
+
         self.progress_slider = QSlider(Qt.Orientation.Horizontal)
         self.progress_slider.setObjectName("progressSlider")
         self.progress_slider.setMinimum(0)
@@ -190,32 +217,58 @@ class PlayerScreen(QWidget):
         self.timer.timeout.connect(self.update_playback)
         self.timer.start(config.PLAYBACK_UPDATE_INTERVAL)
         
+        self.swap_timer = QTimer()
+        self.swap_timer.setSingleShot(True)
+        self.swap_timer.timeout.connect(self.show_next_track)
+        
     def update_playback(self):
         """재생 상태 업데이트"""
-        playback = self.parent.spotify.get_current_playback()
+        try:
+            playback = self.parent.spotify.get_current_playback(raise_errors=True)
+        except Exception:
+            # Failed poll (e.g. offline at boot): keep the shown/restored track until one succeeds
+            return
         
         if not playback or not playback.get('item'):
-            # No track playing
-            if self.current_track is not None:
+            if self.pending_uri and time.monotonic() < self.pending_deadline:
+                # Requested playback may not have reached the API yet
+                return
+            # No track playing (or the restored snapshot track has ended)
+            if self.current_track is not None or self.shown_uri is not None:
+                self.set_pending(None)
                 self.track_name.setText("No track playing")
                 self.artist_name.setText("Start playing music from search or library")
                 self.album_name.setText("")
                 self.play_pause_btn.setText("▶")
                 self.current_track = None
+                self.shown_uri = None
+                self.update_album_art(None)
+                self.update_links()
             return
         
         track = playback['item']
+        # Every poll delivers a fresh dict; only a new URI changes the link targets
+        previous = self.current_track
         self.current_track = track
+        if previous is None or previous.get('uri') != track.get('uri'):
+            self.update_links()
         
-        # Update track info
-        self.track_name.setText(track.get('name', 'Unknown'))
-        
-        artists = track.get('artists', [])
-        artist_text = ', '.join([a.get('name', 'Unknown') for a in artists]) if artists else 'Unknown Artist'
-        self.artist_name.setText(artist_text)
+        uri = track.get('uri')
+        if self.pending_uri:
+            if uri == self.pending_uri:
+                # Confirmed: keep the optimistic view and fill in live progress
+                self.set_pending(None)
+            elif uri == self.pending_from and time.monotonic() < self.pending_deadline:
+                # The API still reports the previous track; keep the optimistic view
+                return
+            else:
+                # Playback did not start what we expected; correct to the actual track
+                self.set_pending(None)
         
-        album = track.get('album', {})
-        self.album_name.setText(album.get('name', ''))
+        # Update track info (prefetched display strings when the queue predicted it)
+        if uri != self.shown_uri:
+            display = self.parent.queue_prefetcher.display_for(uri) or track_display(track)
+            self.show_track(uri, display)
         
         # Update progress
         progress_ms = playback.get('progress_ms', 0)
@@ -233,6 +286,137 @@ class PlayerScreen(QWidget):
         self.is_playing = playback.get('is_playing', False)
         self.play_pause_btn.setText("⏸" if self.is_playing else "▶")
         
+        # Swap to the prefetched next track exactly when this one ends, not at the next poll
+        remaining_ms = duration_ms - progress_ms
+        if self.is_playing and 0 < remaining_ms <= config.PLAYBACK_UPDATE_INTERVAL:
+            self.swap_timer.start(remaining_ms)
+        else:
+            self.swap_timer.stop()
+        
+    def show_track(self, uri, display):
+        """트랙 정보 표시"""
+        self.shown_uri = uri
+        self.track_name.setText(display['name'])
+        self.artist_name.setText(display['artists'])
+        self.album_name.setText(display['album'])
+        self.time_total.setText(self.format_time(display['duration_ms']))
+        self.update_album_art(display['images'])
+        
+    def show_next_track(self):
+        """대기열의 다음 트랙을 미리 표시 (다음 폴링에서 실제 상태로 확정)"""
+        upcoming = self.parent.queue_prefetcher.upcoming
+        if not upcoming:
+            return
+        
+        uri, display = upcoming[0]
+        self.show_optimistic(uri, display, 2 * config.PLAYBACK_UPDATE_INTERVAL)
+        
+    def show_pending(self, track):
+        """
+        재생을 요청한 행의 트랙을 API 응답 전에 바로 표시 (대기 상태)
+        
+        Args:
+            track: Track 레코드 (EntityStore)
+        """
+        if track is None or not track.uri:
+            return
+        self.show_optimistic(track.uri, record_display(track), config.PLAYER_PENDING_TIMEOUT)
+        
+    def show_optimistic(self, uri, display, timeout_ms):
+        """API 확인 전 트랙 표시 (timeout_ms 안에 확인되지 않으면 실제 상태로 교정)"""
+        self.swap_timer.stop()
+        self.pending_from = self.shown_uri
+        self.show_track(uri, display)
+        self.set_pending(uri, timeout_ms)
+        if not self.slider_being_dragged:
+            self.progress_slider.setMaximum(max(1, display['duration_ms']))
+            self.progress_slider.setValue(0)
+            self.time_current.setText(self.format_time(0))
+        
+    def set_pending(self, uri, timeout_ms=0):
+        """대기 상태 설정/해제 (제목을 흐리게 표시)"""
+        self.pending_uri = uri
+        self.pending_deadline = time.monotonic() + timeout_ms / 1000
+        self.track_name.setProperty("pending", bool(uri))
+        self.track_name.style().unpolish(self.track_name)
+        self.track_name.style().polish(self.track_name)
+        
+    def update_album_art(self, images):
+        """앨범 아트 표시 (메모리 캐시에 없으면 비동기 로드)"""
+        size = self.album_art.width()
+        url = pick_image(images, size)
+        key = (url, size)
+        if key == self.art_key:
+            return
+        self.art_key = key
+        
+        if not url:
+            self.album_art.setPixmap(QPixmap())
+            self.album_art.setText("🎧")
+            return
+        
+        pixmap = self.parent.images.request(images, size, lambda p: self.show_album_art(key, p))
+        if pixmap is not None:
+            self.show_album_art(key, pixmap)
+    
+    def show_album_art(self, key, pixmap):
+        """로드된 앨범 아트 적용 (그 사이 트랙이 바뀌었으면 무시)"""
+        if key == self.art_key:
+            self.album_art.setPixmap(pixmap)
+        
+    def snapshot_state(self):
+        """UI 스냅샷용 재생 상태 (마지막으로 표시한 트랙)"""
+        track = self.current_track
+        if not track:
+            return None
+        return {
+            'uri': track.get('uri'),
+            'display': track_display(track),
+            'progress_ms': self.progress_slider.value(),
+        }
+        
+    def restore_state(self, state):
+        """스냅샷의 트랙을 흐리게 표시 (첫 재생 상태 조회에서 확정/교정)"""
+        display = state.get('display')
+        if not display:
+            return
+        self.show_track(state.get('uri'), display)
+        progress_ms = state.get('progress_ms', 0)
+        self.progress_slider.setMaximum(max(1, display['duration_ms']))
+        self.progress_slider.setValue(progress_ms)
+        self.time_current.setText(self.format_time(progress_ms))
+        # Deadline already passed: the first poll either confirms or corrects it
+        self.set_pending(state.get('uri'))
+        
+    def current_record(self):
+        """재생 중인 트랙의 Track 레코드 (에피소드/없음은 None)"""
+        track = self.current_track
+        if not track or track.get('type', 'track') != 'track':
+            return None
+        return self.parent.spotify.entities.track(track)
+        
+    def update_links(self):
+        """앨범/아티스트 이동 버튼 활성화 상태 갱신"""
+        record = self.current_record()
+        self.album_link_btn.setEnabled(bool(record and record.album and record.album.id))
+        self.artist_link_btn.setEnabled(bool(record and record.artists and record.artists[0].id))
+        
+    def go_to_album(self):
+        """재생 중인 트랙의 앨범 상세 열기"""
+        record = self.current_record()
+        if record and record.album:
+            self.parent.detail_screen.load_album(record.album)
+            self.parent.detail_screen.return_screen = 6
+            self.parent.navigate_to(7)
+        
+    def go_to_artist(self):
+        """재생 중인 트랙의 대표 아티스트 상세 열기"""
+        record = self.current_record()
+        if record and record.artists:
+            self.parent.detail_screen.load_artist(record.artists[0])
+            self.parent.detail_screen.return_screen = 6
+            self.parent.navigate_to(7)
+        
     def toggle_playback(self):
         """재생/일시정지 토글"""
         if self.is_playing:
@@ -254,6 +438,7 @@ class PlayerScreen(QWidget):
     def next_track(self):
         """다음 트랙"""
         self.parent.spotify.next_track()
+        self.show_next_track()
         print("⏭ Next track")
         
     def slider_pressed(self):
@@ -302,6 +487,10 @@ class PlayerScreen(QWidget):
                 font-weight: 800;
             }}
 
+            QWidget#playerScreen QLabel#trackTitle[pending="true"] {{
+                color: {config.COLOR_TEXT_SECONDARY};
+            }}
+
             QWidget#playerScreen QLabel#artistLabel {{
                 color: {config.COLOR_TEXT_SECONDARY};
             }}
@@ -407,6 +596,9 @@ class PlayerScreen(QWidget):
             scaling_config.append(("subtitle", self.artist_name, 14, 10))
         if hasattr(self, "album_name"):
             scaling_config.append(("caption", self.album_name, 11, 9))
+        if hasattr(self, "album_link_btn"):
+            scaling_config.append(("link", self.album_link_btn, 11, 9))
+            scaling_config.append(("link", self.artist_link_btn, 11, 9))
         if hasattr(self, "time_current"):
             scaling_config.append(("time", self.time_current, 10, 9))
         if hasattr(self, "time_total"):
@@ -440,6 +632,7 @@ class PlayerScreen(QWidget):
         control_small_pt = applied_map.get("control_small", [15])[0]
         control_primary_pt = applied_map.get("control_primary", [18])[0]
         art_pt = applied_map.get("art", [48])[0]
+        link_pt = applied_map.get("link", [10])[0]
 
         back_vpad, back_hpad = scale_padding(
             base_vertical=12,
@@ -475,6 +668,10 @@ class PlayerScreen(QWidget):
                 font-size: {time_pt}pt;
             }}
 
+            QWidget#playerScreen QPushButton#playerLinkButton {{
+                font-size: {link_pt}pt;
+            }}
+
             QWidget#playerScreen QLabel#albumArt {{
                 font-size: {art_pt}pt;
                 padding: {art_padding}px;
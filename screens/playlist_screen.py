@@ -15,8 +15,10 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt
 import config
+from thumbnail_loader import ThumbnailScheduler
+from ui_snapshot import list_position, restore_list_position
 from ui_styles import (
     BASE_STYLESHEET,
     apply_font_scaling,
@@ -26,18 +28,18 @@ from ui_styles import (
 )
 
 
-class PlaylistLoadWorker(QThread):
-    """플레이리스트 로딩 Worker Thread"""
+def load_playlists_task(token, spotify):
+    """
+    플레이리스트 로딩 작업 (공유 풀에서 실행)
 
-    finished = pyqtSignal(list)
-
-    def __init__(self, spotify_manager):
-        super().__init__()
-        self.spotify = spotify_manager
-
-    def run(self):
-        playlists = self.spotify.get_user_playlists()
-        self.finished.emit(playlists)
+    Returns:
+        tuple: (Playlist 리스트, 변경 여부) - 304이면 캐시된 목록과 False (화면이 다시 그릴지 결정)
+    """
+    # On 304 the cached body is still parsed: the ETag is shared with other callers,
+    # so a screen without rows may be seeing this list for the first time
+    items, modified = spotify.get_library('playlists', raise_errors=True)
+    entities = spotify.entities
+    return entities.parse_many(entities.playlist, items), modified
 
 
 class PlaylistScreen(QWidget):
@@ -47,7 +49,7 @@ class PlaylistScreen(QWidget):
         super().__init__()
         self.parent = parent
         self.playlists = []
-        self.worker = None
+        self.stale = False  # restored from the UI snapshot, not yet revalidated
         self.buttons = []
         self.setup_ui()
 
@@ -117,6 +119,8 @@ class PlaylistScreen(QWidget):
         self.playlists_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.playlists_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.playlists_list.itemClicked.connect(self.open_playlist)
+        self.playlists_list.currentItemChanged.connect(self.prefetch_focused)
+        self.thumbnails = ThumbnailScheduler(self.playlists_list, self.parent.images, self.parent.thumbnail_atlas)
         self.card_layout.addWidget(self.playlists_list)
 
         self.content_layout.addWidget(self.card, alignment=Qt.AlignmentFlag.AlignHCenter)
@@ -131,16 +135,42 @@ class PlaylistScreen(QWidget):
 
     def load_playlists(self):
         """플레이리스트 로드"""
-        self.info_label.setText("Loading playlists…")
+        if self.playlists:
+            # Revalidate in place; rows are only rebuilt if the server reports a change
+            self.info_label.setText("Checking for updates…")
+        else:
+            self.info_label.setText("Loading playlists…")
+            self.playlists_list.clear()
         self.info_label.setStyleSheet(f"color: {config.COLOR_PRIMARY};")
-        self.playlists_list.clear()
 
-        self.worker = PlaylistLoadWorker(self.parent.spotify)
-        self.worker.finished.connect(self.display_playlists)
-        self.worker.start()
+        # A repeated load supersedes the previous one; its result is dropped
+        self.parent.tasks.submit(
+            'library.playlists', load_playlists_task, self.parent.spotify,
+            on_result=lambda result: self.display_playlists(*result),
+            on_error=self.handle_load_error,
+        )
+
+    def handle_load_error(self, error):
+        """로드 실패 - 현재(복원된) 목록과 stale 표시는 유지하고 오류만 안내"""
+        if self.playlists:
+            self.info_label.setText(f"Offline · showing {len(self.playlists)} saved playlists")
+            self.info_label.setStyleSheet(f"color: {config.COLOR_WARNING};")
+            return
+
+        self.playlists_list.clear()
+        self.playlists_list.addItem("Couldn't reach Spotify. Open this screen again to retry.")
+        self.info_label.setText("Failed to load playlists")
+        self.info_label.setStyleSheet(f"color: {config.COLOR_ERROR};")
 
-    def display_playlists(self, playlists):
+    def display_playlists(self, playlists, modified=True):
         """플레이리스트 표시"""
+        self.stale = False
+        if not modified and self.playlists:
+            self.info_label.setText(f"Found {len(self.playlists)} playlists")
+            self.info_label.setStyleSheet(f"color: {config.COLOR_TEXT_SECONDARY};")
+            self.parent.detail_prefetcher.schedule('playlist', self.playlists)
+            return
+
         self.playlists = playlists or []
         self.playlists_list.clear()
 
@@ -153,31 +183,94 @@ class PlaylistScreen(QWidget):
         self.info_label.setText(f"Found {len(self.playlists)} playlists")
         self.info_label.setStyleSheet(f"color: {config.COLOR_TEXT_SECONDARY};")
 
-        current_user = None
-        try:
-            current_user = self.parent.spotify.sp.current_user()
-        except Exception:
-            pass
-
+        # Fetched once at authentication; no request per display
+        current_user = self.parent.spotify.user
         current_user_id = current_user.get("id") if current_user else None
 
         for playlist in self.playlists:
             if not playlist:
                 continue
 
-            name = playlist.get("name", "Unknown Playlist")
-            owner = playlist.get("owner", {}).get("display_name", "Unknown")
-            track_count = playlist.get("tracks", {}).get("total", 0)
-
-            owner_id = playlist.get("owner", {}).get("id")
-            owner_text = "You" if current_user_id and owner_id == current_user_id else owner
-
-            item_text = f"📝 {name}\n   👤 {owner_text}  ·  🎵 {track_count} tracks"
+            item_text = self.playlist_item_text(playlist, current_user_id)
+            store = self.parent.description_store
+            if (not store.get(playlist.id, playlist.snapshot_id)
+                    and store.is_stale(playlist.id, playlist.snapshot_id)):
+                self.parent.playlist_describer.request_refresh()
 
             item = QListWidgetItem(item_text)
             item.setData(Qt.ItemDataRole.UserRole, playlist)
             self.playlists_list.addItem(item)
 
+        # Warm the detail screen for the rows most likely to be opened next
+        self.parent.detail_prefetcher.schedule('playlist', self.playlists)
+
+    def playlist_item_text(self, playlist, current_user_id):
+        """목록 행 텍스트 (AI 설명은 스냅샷 키 캐시에서만 읽음)
+
+        Args:
+            playlist: Playlist 엔티티
+            current_user_id: 현재 사용자 ID (소유자 "You" 표시용)
+
+        Returns:
+            str: 행 텍스트
+        """
+        owner_text = (
+            "You" if current_user_id and playlist.owner_id == current_user_id else playlist.owner_name
+        )
+
+        item_text = f"📝 {playlist.name}\n   👤 {owner_text}  ·  🎵 {playlist.total_tracks} tracks"
+
+        # AI description from the snapshot-keyed cache; never calls the model here
+        description = self.parent.description_store.get(playlist.id, playlist.snapshot_id)
+        if description:
+            if len(description) > 90:
+                description = description[:87].rstrip() + "…"
+            item_text += f"\n   💬 {description}"
+        return item_text
+
+    def snapshot_state(self):
+        """UI 스냅샷용 화면 상태"""
+        entities = self.parent.spotify.entities
+        return {
+            'playlists': [entities.export(playlist) for playlist in self.playlists],
+            'position': list_position(self, self.playlists_list),
+        }
+
+    def restore_state(self, state):
+        """스냅샷 복원 (다음 로드가 교체할 때까지 stale 표시)"""
+        entities = self.parent.spotify.entities
+        playlists = entities.parse_many(entities.playlist, state.get('playlists'))
+        if not playlists:
+            return
+        self.display_playlists(playlists)
+        self.stale = True
+        self.info_label.setText(f"{len(playlists)} saved playlists · updating…")
+        restore_list_position(self, self.playlists_list, state.get('position'))
+
+    def refresh_descriptions(self, playlist_ids):
+        """새 AI 설명이 생긴 행의 텍스트만 갱신 (목록 재구성 없이 스크롤/선택 유지)
+
+        Args:
+            playlist_ids: 설명이 생성된 플레이리스트 ID 목록
+        """
+        playlist_ids = set(playlist_ids)
+        current_user = self.parent.spotify.user
+        current_user_id = current_user.get("id") if current_user else None
+
+        for row in range(self.playlists_list.count()):
+            item = self.playlists_list.item(row)
+            playlist = item.data(Qt.ItemDataRole.UserRole)
+            if not playlist or playlist.id not in playlist_ids:
+                continue
+            item_text = self.playlist_item_text(playlist, current_user_id)
+            if item.text() != item_text:
+                item.setText(item_text)
+
+    def prefetch_focused(self, item, previous=None):
+        """포커스된 플레이리스트의 트랙을 먼저 미리 불러오기"""
+        if item is not None:
+            self.parent.detail_prefetcher.focus('playlist', item.data(Qt.ItemDataRole.UserRole))
+
     def open_playlist(self, item):
         """플레이리스트 열기"""
         playlist = item.data(Qt.ItemDataRole.UserRole)
@@ -363,5 +456,5 @@ class PlaylistScreen(QWidget):
         """화면 표시시 자동 로드"""
         super().showEvent(event)
         self.adjust_layout()
-        if not self.playlists:
+        if not self.playlists or self.stale:
             self.load_playlists()
@@ -18,6 +18,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 import config
+from thumbnail_loader import ThumbnailScheduler
+from ui_snapshot import list_position, restore_list_position
 from ui_styles import (
     BASE_STYLESHEET,
     apply_font_scaling,
@@ -34,6 +36,7 @@ class SearchScreen(QWidget):
         super().__init__()
         self.parent = parent
         self.current_results = []
+        self.last_query = ''
         self.buttons = []
         self.setup_ui()
         
@@ -114,6 +117,7 @@ class SearchScreen(QWidget):
         self.results_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.results_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.results_list.itemDoubleClicked.connect(self.play_selected)
+        self.thumbnails = ThumbnailScheduler(self.results_list, self.parent.images, self.parent.thumbnail_atlas)
         self.card_layout.addWidget(self.results_list)
 
         self.content_layout.addWidget(self.card, alignment=Qt.AlignmentFlag.AlignHCenter)
@@ -153,7 +157,14 @@ class SearchScreen(QWidget):
             self.results_info.setStyleSheet(f"color: {config.COLOR_ERROR};")
             return
         
-        tracks = results['tracks']['items']
+        entities = self.parent.spotify.entities
+        self.show_tracks(entities.parse_many(entities.track, results['tracks']['items']), query)
+        
+    def show_tracks(self, tracks, query):
+        """검색 결과 트랙 목록 표시"""
+        self.results_list.clear()
+        self.current_results = []
+        self.last_query = query
         
         if not tracks:
             self.results_info.setText(f"No results found for '{query}'")
@@ -168,19 +179,15 @@ class SearchScreen(QWidget):
             if not track:
                 continue
             
-            # Track info
-            track_name = track.get('name', 'Unknown')
-            artists = track.get('artists', [])
-            artist_names = ', '.join([a.get('name', 'Unknown') for a in artists]) if artists else 'Unknown'
-            album_name = track.get('album', {}).get('name', 'Unknown')
-            
             # Duration
-            duration_ms = track.get('duration_ms', 0)
-            duration_min = duration_ms // 60000
-            duration_sec = (duration_ms % 60000) // 1000
+            duration_min = track.duration_ms // 60000
+            duration_sec = (track.duration_ms % 60000) // 1000
             
             # Create item
-            item_text = f"🎵 {track_name}\n   👤 {artist_names} | 💿 {album_name} | ⏱ {duration_min}:{duration_sec:02d}"
+            item_text = (
+                f"🎵 {track.name}\n   👤 {track.artist_names} | 💿 {track.album_name} | "
+                f"⏱ {duration_min}:{duration_sec:02d}"
+            )
             
             item = QListWidgetItem(item_text)
             item.setData(Qt.ItemDataRole.UserRole, track)
@@ -188,16 +195,37 @@ class SearchScreen(QWidget):
             
             self.current_results.append(track)
     
+    def snapshot_state(self):
+        """UI 스냅샷용 화면 상태 (마지막 검색어와 결과)"""
+        entities = self.parent.spotify.entities
+        return {
+            'query': self.last_query,
+            'tracks': [entities.export(track) for track in self.current_results],
+            'position': list_position(self, self.results_list),
+        }
+    
+    def restore_state(self, state):
+        """스냅샷 복원 (저장된 결과임을 표시, 다시 검색하면 교체)"""
+        entities = self.parent.spotify.entities
+        query = state.get('query') or ''
+        tracks = entities.parse_many(entities.track, state.get('tracks'))
+        self.search_input.setText(query)
+        if not query or not tracks:
+            return
+        self.show_tracks(tracks, query)
+        self.results_info.setText(f"Saved results for '{query}' · search again to refresh")
+        restore_list_position(self, self.results_list, state.get('position'))
+    
     def play_selected(self, item):
         """선택한 트랙 재생"""
         track = item.data(Qt.ItemDataRole.UserRole)
         
-        if track and track.get('uri'):
-            uri = track['uri']
-            self.parent.spotify.play_track(uri)
-            
-            # Navigate to player screen
-            self.parent.navigate_to(6)
+        if track and track.uri:
+            # Keep playing the rest of the results after the selected one
+            uris = [result.uri for result in self.current_results]
+            self.parent.start_playback(
+                track, self.parent.spotify.play_tracks, uris, start=self.results_list.row(item)
+            )
         else:
             print("❌ No valid track URI")
     
@@ -3,23 +3,49 @@ Spotify API Manager
 Spotify API 관리 및 음악 재생 제어
 """
 
+import threading
+import time
+from collections import OrderedDict
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 from PyQt6.QtCore import QObject, pyqtSignal
 import config
+from entity_store import EntityStore
 
 
 class SpotifyManager(QObject):
     """Spotify API 관리 클래스"""
     
+    # Response projections for playlist_tracks `fields=` (only what screens render)
+    PLAYLIST_TRACK_FIELDS = {
+        # DetailScreen rows, TrackTable columns and the shared EntityStore records
+        'detail': (
+            'items(added_at,track(id,name,uri,duration_ms,popularity,track_number,'
+            'artists(id,name,uri),album(id,name,uri,release_date,images))),total'
+        ),
+        # Playlist description prompts only need "title by artist"
+        'sample': 'items(track(name,artists(name))),total',
+        'full': None,
+    }
+    
     # Signals
     playback_changed = pyqtSignal(dict)
+    track_changed = pyqtSignal(dict)  # playing item JSON, once per new track
+    playback_command = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
     
     def __init__(self):
         super().__init__()
         self.sp = None
+        self.user = None
         self.current_playback = None
+        self.current_track_uri = None
+        self.cache = OrderedDict()  # key -> (expires_at, value), LRU order
+        self.etags = OrderedDict()  # (path, params) -> (etag, parsed body), LRU order
+        self._cache_lock = threading.Lock()  # cache/etags are shared with pool threads
+        self.window_uris = []   # ad-hoc list URIs already handed to Spotify
+        self.pending_uris = []  # rest of the list, queued as playback advances
+        self.entities = EntityStore()
         self.authenticate()
         
     def authenticate(self):
@@ -37,6 +63,7 @@ class SpotifyManager(QObject):
             
             # Test connection
             user = self.sp.current_user()
+            self.user = user
             print(f"✅ Spotify authenticated as: {user['display_name']}")
             
         except Exception as e:
@@ -44,11 +71,119 @@ class SpotifyManager(QObject):
             print(f"❌ {error_msg}")
             self.error_occurred.emit(error_msg)
             
+    # ==============================================
+    # Cache Functions
+    # ==============================================
+    
+    def cache_get(self, key):
+        """캐시 조회 (없거나 만료되면 None)"""
+        if not config.ENABLE_CACHE:
+            return None
+        
+        with self._cache_lock:
+            entry = self.cache.get(key)
+            if not entry:
+                return None
+            
+            expires_at, value = entry
+            if expires_at < time.time():
+                self.cache.pop(key, None)
+                return None
+            self.cache.move_to_end(key)
+            return value
+    
+    def cache_put(self, key, value, ttl=None):
+        """
+        캐시 저장
+        
+        Args:
+            key (tuple): 캐시 키
+            value: 저장할 값
+            ttl (int): 유지 시간 (초, 기본값 CACHE_DURATION)
+        """
+        if not config.ENABLE_CACHE or value is None:
+            return
+        
+        now = time.time()
+        with self._cache_lock:
+            self.cache[key] = (now + (ttl or config.CACHE_DURATION), value)
+            self.cache.move_to_end(key)
+            if len(self.cache) <= config.CACHE_MAX_ENTRIES:
+                return
+            
+            # Over the cap: drop expired entries first, then the least recently used
+            for stale in [k for k, (expires_at, _) in self.cache.items() if expires_at < now]:
+                del self.cache[stale]
+            while len(self.cache) > config.CACHE_MAX_ENTRIES:
+                self.cache.popitem(last=False)
+    
+    def conditional_get(self, path, params, fallback):
+        """
+        ETag 재검증 GET - 304 Not Modified이면 캐시된 본문을 그대로 반환
+        
+        Args:
+            path (str): API 경로 (예: 'me/playlists')
+            params (dict): 쿼리 파라미터
+            fallback (callable): 조건부 요청을 쓸 수 없을 때 본문을 반환하는 일반 spotipy 호출
+            
+        Returns:
+            tuple: (파싱된 본문, 변경 여부)
+        """
+        key = (path, tuple(sorted(params.items())))
+        with self._cache_lock:
+            cached = self.etags.get(key)
+        
+        response = self._etag_request(path, params, cached[0] if cached else None)
+        if response is None:
+            # Unconditional request: always reported as modified
+            return fallback(), True
+        
+        if response.status_code == 304 and cached:
+            with self._cache_lock:
+                if key in self.etags:
+                    self.etags.move_to_end(key)
+            return cached[1], False
+        response.raise_for_status()
+        
+        data = response.json()
+        etag = response.headers.get('ETag')
+        with self._cache_lock:
+            if etag:
+                self.etags[key] = (etag, data)
+                self.etags.move_to_end(key)
+                while len(self.etags) > config.ETAG_MAX_ENTRIES:
+                    self.etags.popitem(last=False)
+            else:
+                self.etags.pop(key, None)
+        return data, True
+    
+    def _etag_request(self, path, params, etag):
+        """
+        If-None-Match 헤더를 붙인 raw GET (spotipy 내부 속성을 쓰는 유일한 곳)
+        
+        spotipy에는 조건부 요청 API가 없어 세션과 토큰을 직접 사용한다.
+        
+        Returns:
+            requests.Response: 응답 (spotipy 내부 구조가 달라 쓸 수 없으면 None)
+        """
+        try:
+            headers = self.sp._auth_headers()
+            session = self.sp._session
+            url = self.sp.prefix + path
+            timeout = self.sp.requests_timeout
+        except AttributeError as e:
+            print(f"⚠️  Conditional requests unavailable, using plain requests: {e}")
+            return None
+        
+        if etag:
+            headers['If-None-Match'] = etag
+        return session.get(url, params=params, headers=headers, timeout=timeout)
+    
     # ==============================================
     # Search Functions
     # ==============================================
     
-    def search(self, query, search_type='track', limit=20):
+    def search(self, query, search_type='track', limit=20, cache_ttl=None):
         """
         검색 수행
         
@@ -56,6 +191,7 @@ class SpotifyManager(QObject):
             query (str): 검색어
             search_type (str): 'track', 'album', 'artist', 'playlist'
             limit (int): 결과 개수
+            cache_ttl (int): 결과 캐시 유지 시간 (초, 기본값 CACHE_DURATION)
             
         Returns:
             dict: 검색 결과
@@ -63,13 +199,19 @@ class SpotifyManager(QObject):
         try:
             if not query or not query.strip():
                 return None
+            
+            cache_key = ('search', query.strip().lower(), search_type, limit)
+            cached = self.cache_get(cache_key)
+            if cached is not None:
+                return cached
                 
             results = self.sp.search(
                 q=query,
                 type=search_type,
                 limit=limit,
-                market='KR'
+                market=config.SPOTIFY_MARKET
             )
+            self.cache_put(cache_key, results, cache_ttl)
             return results
             
         except Exception as e:
@@ -81,65 +223,184 @@ class SpotifyManager(QObject):
     # Library Functions
     # ==============================================
     
-    def get_user_playlists(self, limit=50):
-        """사용자 플레이리스트 가져오기"""
+    def get_library(self, kind, limit=50, raise_errors=False):
+        """
+        라이브러리 목록 재검증 조회 (ETag)
+        
+        Args:
+            kind (str): 'playlists', 'albums', 'artists'
+            limit (int): 개수
+            raise_errors (bool): 실패 시 빈 목록 대신 예외 전달 (실패와 빈 라이브러리 구분용)
+            
+        Returns:
+            tuple: (항목 리스트, 변경 여부) - 304이면 캐시된 리스트와 False
+        """
         try:
-            playlists = self.sp.current_user_playlists(limit=limit)
-            return playlists['items']
+            if kind == 'playlists':
+                data, modified = self.conditional_get(
+                    'me/playlists', {'limit': limit},
+                    fallback=lambda: self.sp.current_user_playlists(limit=limit),
+                )
+                return data['items'], modified
+            if kind == 'albums':
+                data, modified = self.conditional_get(
+                    'me/albums', {'limit': limit, 'market': config.SPOTIFY_MARKET},
+                    fallback=lambda: self.sp.current_user_saved_albums(limit=limit, market=config.SPOTIFY_MARKET),
+                )
+                return data['items'], modified
+            if kind == 'artists':
+                data, modified = self.conditional_get(
+                    'me/following', {'type': 'artist', 'limit': limit},
+                    fallback=lambda: self.sp.current_user_followed_artists(limit=limit),
+                )
+                return data['artists']['items'], modified
+            raise ValueError(f"Unknown library kind: {kind}")
         except Exception as e:
-            print(f"❌ Failed to get playlists: {e}")
-            self.error_occurred.emit(f"Failed to get playlists: {e}")
-            return []
+            print(f"❌ Failed to get {kind}: {e}")
+            self.error_occurred.emit(f"Failed to get {kind}: {e}")
+            if raise_errors:
+                raise
+            return [], True
+    
+    def get_user_playlists(self, limit=50):
+        """사용자 플레이리스트 가져오기"""
+        return self.get_library('playlists', limit)[0]
     
-    def get_playlist_tracks(self, playlist_id):
-        """플레이리스트의 트랙 가져오기"""
+    def get_playlist_tracks(self, playlist_id, limit=100, offset=0, projection='detail', raise_errors=False):
+        """
+        플레이리스트의 트랙 가져오기 (offset부터 limit개)
+        
+        Args:
+            playlist_id (str): 플레이리스트 ID
+            limit (int): 개수 (최대 100)
+            offset (int): 시작 위치
+            projection (str): PLAYLIST_TRACK_FIELDS 키 (응답 필드 제한)
+            raise_errors (bool): 실패 시 빈 목록 대신 예외 전달 (마지막 페이지와 구분용)
+            
+        Returns:
+            list: 플레이리스트 항목 리스트
+        """
         try:
-            results = self.sp.playlist_tracks(playlist_id)
+            results = self.sp.playlist_tracks(
+                playlist_id,
+                fields=self.PLAYLIST_TRACK_FIELDS.get(projection),
+                limit=limit,
+                offset=offset,
+                market=config.SPOTIFY_MARKET,
+            )
             return results['items']
         except Exception as e:
             print(f"❌ Failed to get playlist tracks: {e}")
             self.error_occurred.emit(f"Failed to get playlist tracks: {e}")
+            if raise_errors:
+                raise
             return []
     
     def get_saved_albums(self, limit=50):
         """저장된 앨범 가져오기"""
+        return self.get_library('albums', limit)[0]
+    
+    def get_saved_tracks(self, limit=50, offset=0):
+        """저장된(좋아요) 트랙 가져오기 (실패 시 None - 빈 페이지와 구분)"""
         try:
-            albums = self.sp.current_user_saved_albums(limit=limit)
-            return albums['items']
+            results = self.sp.current_user_saved_tracks(limit=limit, offset=offset, market=config.SPOTIFY_MARKET)
+            return [item['track'] for item in results['items'] if item.get('track')]
         except Exception as e:
-            print(f"❌ Failed to get albums: {e}")
-            self.error_occurred.emit(f"Failed to get albums: {e}")
-            return []
+            print(f"❌ Failed to get saved tracks: {e}")
+            self.error_occurred.emit(f"Failed to get saved tracks: {e}")
+            return None
     
-    def get_album_tracks(self, album_id):
-        """앨범의 트랙 가져오기"""
+    def get_album_tracks(self, album_id, limit=50, offset=0, raise_errors=False):
+        """앨범의 트랙 가져오기 (offset부터 limit개, raise_errors면 실패 시 예외 전달)"""
         try:
-            results = self.sp.album_tracks(album_id)
+            results = self.sp.album_tracks(album_id, limit=limit, offset=offset, market=config.SPOTIFY_MARKET)
             return results['items']
         except Exception as e:
             print(f"❌ Failed to get album tracks: {e}")
             self.error_occurred.emit(f"Failed to get album tracks: {e}")
+            if raise_errors:
+                raise
             return []
     
+    def iter_followed_artists(self, page_size=50, raise_errors=False):
+        """
+        팔로우한 아티스트를 커서(after) 페이지 단위로 스트리밍
+        
+        Args:
+            page_size (int): 페이지당 개수 (최대 50)
+            raise_errors (bool): 실패 시 조용히 끝내지 않고 예외 전달
+            
+        Yields:
+            tuple: (아티스트 항목 리스트, 변경 여부) - 페이지마다 ETag 재검증
+        """
+        after = None
+        while True:
+            params = {'type': 'artist', 'limit': page_size}
+            if after:
+                params['after'] = after
+            try:
+                data, modified = self.conditional_get(
+                    'me/following', params,
+                    fallback=lambda: self.sp.current_user_followed_artists(limit=page_size, after=after),
+                )
+            except Exception as e:
+                print(f"❌ Failed to get artists: {e}")
+                self.error_occurred.emit(f"Failed to get artists: {e}")
+                if raise_errors:
+                    raise
+                return
+            
+            page = data['artists']
+            yield page['items'], modified
+            
+            after = (page.get('cursors') or {}).get('after')
+            if not after or not page.get('next'):
+                return
+    
     def get_followed_artists(self, limit=50):
         """팔로우한 아티스트 가져오기"""
+        return self.get_library('artists', limit)[0]
+    
+    def get_artist_albums(self, artist_id, limit=config.ARTIST_ALBUMS_LIMIT):
+        """아티스트의 앨범/싱글 가져오기 (페이지 단위로 limit개까지, 실패 시 None)"""
+        albums = []
         try:
-            artists = self.sp.current_user_followed_artists(limit=limit)
-            return artists['artists']['items']
+            while len(albums) < limit:
+                results = self.sp.artist_albums(
+                    artist_id,
+                    include_groups='album,single',
+                    country=config.SPOTIFY_MARKET,
+                    limit=min(50, limit - len(albums)),
+                    offset=len(albums),
+                )
+                albums.extend(results['items'])
+                if not results.get('next'):
+                    break
+            return albums
         except Exception as e:
-            print(f"❌ Failed to get artists: {e}")
-            self.error_occurred.emit(f"Failed to get artists: {e}")
-            return []
+            print(f"❌ Failed to get artist albums: {e}")
+            self.error_occurred.emit(f"Failed to get artist albums: {e}")
+            return None
+    
+    def get_related_artists(self, artist_id):
+        """비슷한 아티스트 가져오기 (실패 시 None)"""
+        try:
+            results = self.sp.artist_related_artists(artist_id)
+            return results['artists']
+        except Exception as e:
+            print(f"❌ Failed to get related artists: {e}")
+            self.error_occurred.emit(f"Failed to get related artists: {e}")
+            return None
     
     def get_artist_top_tracks(self, artist_id):
-        """아티스트의 인기 트랙 가져오기"""
+        """아티스트의 인기 트랙 가져오기 (실패 시 None)"""
         try:
-            results = self.sp.artist_top_tracks(artist_id, country='KR')
+            results = self.sp.artist_top_tracks(artist_id, country=config.SPOTIFY_MARKET)
             return results['tracks']
         except Exception as e:
             print(f"❌ Failed to get artist top tracks: {e}")
             self.error_occurred.emit(f"Failed to get artist top tracks: {e}")
-            return []
+            return None
     
     # ==============================================
     # Playback Control Functions
@@ -159,6 +420,8 @@ class SpotifyManager(QObject):
                 return
             
             self.sp.start_playback(uris=[uri])
+            self.clear_pending_uris()
+            self.playback_command.emit('play')
             print(f"▶️  Playing: {uri}")
             
         except Exception as e:
@@ -166,29 +429,101 @@ class SpotifyManager(QObject):
             print(f"❌ {error_msg}")
             self.error_occurred.emit(error_msg)
     
-    def play_tracks(self, uris):
+    def play_tracks(self, uris, start=0):
         """
-        여러 트랙 재생
+        여러 트랙 재생 (컨텍스트가 없는 목록용)
+        
+        요청 크기를 일정하게 유지하기 위해 PLAYBACK_URI_WINDOW개만 보내고,
+        나머지는 재생이 창 끝에 가까워질 때 큐에 조금씩 추가한다.
         
         Args:
             uris (list): Spotify URI 리스트
+            start (int): 처음 재생할 위치
         """
         try:
-            if not uris or len(uris) == 0:
+            uris = list(uris or ())
+            end = start + config.PLAYBACK_URI_WINDOW
+            # Slice before filtering so start stays a row index of the caller's list
+            window = [uri for uri in uris[start:end] if uri and uri.startswith('spotify:')]
+            if not window:
                 return
             
-            self.sp.start_playback(uris=uris)
-            print(f"▶️  Playing {len(uris)} tracks")
+            self.sp.start_playback(uris=window)
+            self.window_uris = window
+            self.pending_uris = [uri for uri in uris[end:] if uri and uri.startswith('spotify:')]
+            self.playback_command.emit('play')
+            print(f"▶️  Playing {len(window) + len(self.pending_uris)} tracks")
             
         except Exception as e:
             error_msg = f"Playback failed: {e}"
             print(f"❌ {error_msg}")
             self.error_occurred.emit(error_msg)
     
+    def play_context(self, context_uri, offset=None):
+        """
+        컨텍스트(플레이리스트/앨범/아티스트) 재생
+        
+        Args:
+            context_uri (str): 'spotify:playlist:...', 'spotify:album:...', 'spotify:artist:...'
+            offset (dict): 시작 위치 {'position': n} 또는 {'uri': ...} (아티스트는 미지원)
+        """
+        try:
+            if not context_uri or not context_uri.startswith('spotify:'):
+                print(f"❌ Invalid context URI: {context_uri}")
+                return
+            
+            if context_uri.startswith('spotify:artist:'):
+                offset = None
+            self.sp.start_playback(context_uri=context_uri, offset=offset)
+            self.clear_pending_uris()
+            self.playback_command.emit('play')
+            print(f"▶️  Playing context: {context_uri}")
+            
+        except Exception as e:
+            error_msg = f"Playback failed: {e}"
+            print(f"❌ {error_msg}")
+            self.error_occurred.emit(error_msg)
+    
+    def clear_pending_uris(self):
+        """대기 중인 목록 추가 취소 (다른 재생 시작 시)"""
+        self.window_uris = []
+        self.pending_uris = []
+    
+    def top_up_queue(self, playback):
+        """
+        재생이 보낸 URI 창의 끝에 가까워지면 남은 목록 일부를 큐에 추가
+        
+        Args:
+            playback (dict): current_playback 결과
+        """
+        if not self.pending_uris or not playback or not playback.get('item'):
+            return
+        
+        current_uri = playback['item'].get('uri')
+        if current_uri not in self.window_uris:
+            return
+        
+        # Last occurrence, in case the list repeats a track
+        position = len(self.window_uris) - 1 - self.window_uris[::-1].index(current_uri)
+        if len(self.window_uris) - position > config.PLAYBACK_TOPUP_THRESHOLD:
+            return
+        
+        batch = self.pending_uris[:config.PLAYBACK_TOPUP_SIZE]
+        self.pending_uris = self.pending_uris[len(batch):]
+        for uri in batch:
+            try:
+                self.sp.add_to_queue(uri)
+                self.window_uris.append(uri)
+            except Exception as e:
+                print(f"❌ Failed to queue track: {e}")
+                break
+        del self.window_uris[:-config.PLAYBACK_URI_WINDOW]
+    
     def pause(self):
         """재생 일시정지"""
         try:
             self.sp.pause_playback()
+            self.playback_command.emit('pause')
             print("⏸️  Paused")
         except Exception as e:
             print(f"❌ Pause failed: {e}")
@@ -198,6 +533,7 @@ class SpotifyManager(QObject):
         """재생 재개"""
         try:
             self.sp.start_playback()
+            self.playback_command.emit('resume')
             print("▶️  Resumed")
         except Exception as e:
             print(f"❌ Resume failed: {e}")
@@ -207,6 +543,7 @@ class SpotifyManager(QObject):
         """다음 트랙"""
         try:
             self.sp.next_track()
+            self.playback_command.emit('next')
             print("⏭️  Next track")
         except Exception as e:
             print(f"❌ Next track failed: {e}")
@@ -216,6 +553,7 @@ class SpotifyManager(QObject):
         """이전 트랙"""
         try:
             self.sp.previous_track()
+            self.playback_command.emit('previous')
             print("⏮️  Previous track")
         except Exception as e:
             print(f"❌ Previous track failed: {e}")
@@ -230,6 +568,7 @@ class SpotifyManager(QObject):
         """
         try:
             self.sp.seek_track(position_ms)
+            self.playback_command.emit('seek')
             print(f"⏩ Seek to {position_ms}ms")
         except Exception as e:
             print(f"❌ Seek failed: {e}")
@@ -245,6 +584,7 @@ class SpotifyManager(QObject):
         try:
             volume_percent = max(0, min(100, volume_percent))
             self.sp.volume(volume_percent)
+            self.playback_command.emit('volume')
             print(f"🔊 Volume set to {volume_percent}%")
         except Exception as e:
             print(f"❌ Volume change failed: {e}")
@@ -254,12 +594,15 @@ class SpotifyManager(QObject):
     # Playback State Functions
     # ==============================================
     
-    def get_current_playback(self):
+    def get_current_playback(self, raise_errors=False):
         """
         현재 재생 상태 가져오기
         
+        Args:
+            raise_errors (bool): 실패 시 None 대신 예외 전달 ("재생 중 아님"과 구분용)
+        
         Returns:
-            dict: 재생 상태 정보
+            dict: 재생 상태 정보 (재생 중인 항목이 없으면 None)
         """
         try:
             playback = self.sp.current_playback()
@@ -267,14 +610,35 @@ class SpotifyManager(QObject):
             if playback:
                 self.current_playback = playback
                 self.playback_changed.emit(playback)
+                item = playback.get('item') or {}
+                if item.get('uri') and item['uri'] != self.current_track_uri:
+                    self.current_track_uri = item['uri']
+                    self.track_changed.emit(item)
+                self.top_up_queue(playback)
             
             return playback
             
         except Exception as e:
             if config.DEBUG_MODE:
                 print(f"❌ Failed to get playback: {e}")
+            if raise_errors:
+                raise
             return None
     
+    def get_queue(self):
+        """
+        재생 대기열 가져오기
+        
+        Returns:
+            list: 다음에 재생될 트랙 리스트
+        """
+        try:
+            return self.sp.queue().get('queue') or []
+        except Exception as e:
+            if config.DEBUG_MODE:
+                print(f"❌ Failed to get queue: {e}")
+            return []
+    
     def is_playing(self):
         """현재 재생 중인지 확인"""
         playback = self.get_current_playback()
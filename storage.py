@@ -0,0 +1,117 @@
+"""
+Local Storage Helpers
+로컬 캐시 파일 읽기/쓰기
+"""
+
+import json
+import os
+import tempfile
+import zlib
+
+import config
+
+
+def cache_path(filename):
+    """캐시 디렉터리 내 파일 경로 반환 (디렉터리가 없으면 생성)"""
+    os.makedirs(config.CACHE_DIR, exist_ok=True)
+    return os.path.join(config.CACHE_DIR, filename)
+
+
+def load_json(filename, default=None):
+    """
+    캐시 디렉터리의 JSON 파일 읽기
+
+    Args:
+        filename (str): 파일 이름
+        default: 파일이 없거나 손상되었을 때 반환할 값
+
+    Returns:
+        파싱된 JSON 데이터 또는 default
+    """
+    path = cache_path(filename)
+    if not os.path.exists(path):
+        return default
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Failed to read {filename}: {e}")
+        return default
+
+
+def save_json(filename, data):
+    """
+    캐시 디렉터리에 JSON 파일 저장 (임시 파일 + rename으로 원자적 쓰기)
+
+    Args:
+        filename (str): 파일 이름
+        data: JSON 직렬화 가능한 데이터
+    """
+    path = cache_path(filename)
+    fd, tmp_path = tempfile.mkstemp(dir=config.CACHE_DIR, prefix='.tmp-', suffix='.json')
+
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"❌ Failed to save {filename}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_blob(filename, default=None):
+    """
+    캐시 디렉터리의 zlib 압축 JSON 파일 읽기 (한 번의 read로 전체 로드)
+
+    pickle과 달리 파일 내용이 코드를 실행할 수 없어, 캐시 디렉터리에 쓸 수 있는
+    누구든 앱에서 코드를 실행하는 경로가 되지 않는다.
+
+    Args:
+        filename (str): 파일 이름
+        default: 파일이 없거나 손상되었을 때 반환할 값
+
+    Returns:
+        파싱된 JSON 데이터 또는 default
+    """
+    path = cache_path(filename)
+    if not os.path.exists(path):
+        return default
+
+    try:
+        with open(path, 'rb') as f:
+            return json.loads(zlib.decompress(f.read()).decode('utf-8'))
+    except (OSError, zlib.error, ValueError) as e:
+        print(f"⚠️  Failed to read {filename}: {e}")
+        return default
+
+
+def save_blob(filename, data):
+    """
+    캐시 디렉터리에 zlib 압축 JSON 파일 저장 (임시 파일 + rename으로 원자적 쓰기)
+
+    Args:
+        filename (str): 파일 이름
+        data: JSON 직렬화 가능한 데이터
+    """
+    path = cache_path(filename)
+    try:
+        payload = zlib.compress(json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 6)
+    except (TypeError, ValueError) as e:
+        print(f"❌ Failed to save {filename}: {e}")
+        return
+
+    fd, tmp_path = tempfile.mkstemp(dir=config.CACHE_DIR, prefix='.tmp-', suffix='.json.z')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"❌ Failed to save {filename}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
@@ -0,0 +1,179 @@
+"""
+Suggestion Engine
+규칙 기반 오프라인 음악 검색 제안 (AI 응답 전 즉시 응답 및 실패 시 대체)
+"""
+
+import re
+from datetime import datetime
+
+
+# Each entry: (keyword, trigger words in Korean/English, search queries)
+MOOD_LEXICON = {
+    'rain': ('rainy day', ('rain', 'rainy', '비오는', '비 오는', '비가', '장마', '빗소리'),
+             ('rainy day jazz', 'rainy day acoustic', 'lo-fi rain', 'melancholic indie')),
+    'sleep': ('sleep', ('sleep', 'bedtime', 'insomnia', '잠들기', '잠잘', '수면', '자기 전', '숙면'),
+              ('sleep meditation music', 'calm piano', 'relaxing ambient', 'bedtime classical')),
+    'workout': ('workout', ('workout', 'gym', 'running', 'exercise', 'run', '운동', '헬스', '러닝', '달리기'),
+                ('workout motivation', 'high energy edm', 'gym pump up', 'running beats')),
+    'focus': ('focus', ('study', 'focus', 'work', 'coding', 'reading', '공부', '집중', '작업', '코딩', '독서'),
+              ('deep focus', 'lo-fi study beats', 'instrumental concentration', 'ambient work music')),
+    'drive': ('driving', ('drive', 'driving', 'commute', 'road trip', '드라이브', '출근', '퇴근', '운전', '출퇴근'),
+              ('driving songs', 'road trip hits', 'commute chill pop', 'night drive synthwave')),
+    'party': ('party', ('party', 'club', 'dance', '파티', '클럽', '신나는', '댄스'),
+              ('party hits', 'dance pop anthems', 'club bangers', 'feel good dance')),
+    'sad': ('sad', ('sad', 'breakup', 'lonely', 'cry', '슬픈', '이별', '우울', '외로운', '눈물'),
+            ('sad songs', 'breakup ballads', 'melancholic piano', 'emotional indie')),
+    'happy': ('happy', ('happy', 'good mood', 'cheerful', '행복', '기분 좋은', '즐거운', '밝은'),
+              ('happy hits', 'feel good pop', 'good vibes', 'sunny day songs')),
+    'love': ('love', ('love', 'romantic', 'date', '사랑', '연애', '설렘', '데이트', '고백'),
+             ('love songs', 'romantic r&b', 'date night jazz', 'sweet acoustic love')),
+    'chill': ('chill', ('chill', 'relax', 'calm', 'healing', '편안', '휴식', '힐링', '잔잔', '여유'),
+              ('chill vibes', 'relaxing acoustic', 'calm indie', 'soft chill pop')),
+    'morning': ('morning', ('morning', 'wake up', 'sunrise', '아침', '모닝', '기상'),
+                ('morning coffee', 'wake up happy', 'morning acoustic', 'sunrise chill')),
+    'night': ('late night', ('night', 'midnight', 'late night', '밤', '새벽', '심야'),
+              ('late night vibes', 'midnight r&b', 'night jazz', 'dreamy night pop')),
+    'cafe': ('cafe', ('cafe', 'coffee', 'brunch', '카페', '커피', '브런치'),
+             ('coffee shop jazz', 'cafe acoustic', 'bossa nova cafe', 'brunch chill')),
+    'summer': ('summer', ('summer', 'beach', 'vacation', '여름', '바다', '휴가', '해변'),
+               ('summer hits', 'beach vibes', 'tropical house', 'summer road trip')),
+    'winter': ('winter', ('winter', 'snow', 'christmas', '겨울', '눈오는', '크리스마스', '연말'),
+               ('winter acoustic', 'christmas songs', 'cozy winter jazz', 'snowy day ballads')),
+}
+
+GENRE_LEXICON = {
+    'kpop': ('k-pop', ('kpop', 'k-pop', '케이팝', '아이돌', '걸그룹', '보이그룹'),
+             ('k-pop hits', 'k-pop dance', 'k-pop ballads', 'latest k-pop')),
+    'hiphop': ('hip hop', ('hip hop', 'hiphop', 'rap', '힙합', '랩', '래퍼'),
+               ('hip hop hits', 'korean hip hop', 'chill rap', 'old school hip hop')),
+    'jazz': ('jazz', ('jazz', '재즈'),
+             ('jazz classics', 'smooth jazz', 'jazz piano', 'modern jazz')),
+    'classical': ('classical', ('classical', 'orchestra', 'piano', '클래식', '오케스트라', '피아노'),
+                  ('classical essentials', 'peaceful piano', 'orchestral masterpieces', 'classical focus')),
+    'rock': ('rock', ('rock', 'band', '락', '록', '밴드'),
+             ('rock classics', 'indie rock', 'korean band music', 'alternative rock')),
+    'edm': ('edm', ('edm', 'electronic', 'house', 'techno', '일렉', '일렉트로닉', '하우스'),
+            ('edm hits', 'deep house', 'electronic chill', 'festival edm')),
+    'rnb': ('r&b', ('r&b', 'rnb', 'soul', '알앤비', '소울'),
+            ('r&b hits', 'korean r&b', 'neo soul', 'chill r&b')),
+    'indie': ('indie', ('indie', '인디'),
+              ('indie pop', 'korean indie', 'indie folk', 'bedroom pop')),
+    'ballad': ('ballad', ('ballad', '발라드'),
+               ('korean ballads', 'emotional ballads', 'piano ballads', 'classic ballads')),
+    'lofi': ('lo-fi', ('lofi', 'lo-fi', '로파이'),
+             ('lo-fi beats', 'lo-fi hip hop', 'lo-fi jazz', 'lo-fi sleep')),
+    'acoustic': ('acoustic', ('acoustic', 'guitar', '어쿠스틱', '통기타'),
+                 ('acoustic covers', 'acoustic chill', 'acoustic love songs', 'unplugged hits')),
+    'citypop': ('city pop', ('city pop', 'citypop', '시티팝'),
+                ('city pop classics', 'japanese city pop', 'korean city pop', 'retro city pop')),
+}
+
+# (start hour, end hour, mood key) — used when the prompt alone gives too little to go on
+TIME_OF_DAY_RULES = (
+    (5, 9, 'morning'),
+    (9, 12, 'focus'),
+    (12, 14, 'cafe'),
+    (14, 17, 'focus'),
+    (17, 20, 'drive'),
+    (20, 24, 'night'),
+    (0, 5, 'sleep'),
+)
+
+GENERIC_QUERIES = ('popular tracks', 'new releases', 'top hits', 'trending now')
+
+# Filler words dropped when building the keyword variant of a prompt
+FILLER_WORDS = {
+    'music', 'songs', 'song', 'tracks', 'playlist', 'some', 'for', 'to', 'the', 'a',
+    'with', 'when', 'while', 'listen', 'play', 'good', 'i', 'me', 'want', 'like',
+    '음악', '노래', '곡', '듣기', '좋은', '들을', '때', '할', '추천', '해줘', '듣고', '싶어',
+}
+
+
+def extract_keywords(prompt):
+    """자연어 프롬프트에서 검색용 키워드만 추출"""
+    words = [w.strip(".,!?'\"") for w in prompt.split()]
+    keywords = [w for w in words if w and w.lower() not in FILLER_WORDS]
+    return ' '.join(keywords)
+
+
+def _compile_triggers(triggers):
+    """트리거 단어 정규식 생성 (영문은 단어 경계, 한글은 부분 일치)"""
+    parts = []
+    for trigger in triggers:
+        escaped = re.escape(trigger)
+        parts.append(rf'\b{escaped}\b' if trigger.isascii() else escaped)
+    return re.compile('|'.join(parts), re.IGNORECASE)
+
+
+class SuggestionEngine:
+    """규칙 기반 검색 제안 생성기 (네트워크 없이 1ms 내외로 동작)"""
+
+    def __init__(self):
+        self.moods = [
+            (key, keyword, _compile_triggers(triggers), queries)
+            for key, (keyword, triggers, queries) in MOOD_LEXICON.items()
+        ]
+        self.genres = [
+            (key, keyword, _compile_triggers(triggers), queries)
+            for key, (keyword, triggers, queries) in GENRE_LEXICON.items()
+        ]
+
+    def _match(self, entries, text):
+        """프롬프트에 등장하는 항목을 등장 순서대로 반환"""
+        matches = []
+        for entry in entries:
+            found = entry[2].search(text)
+            if found:
+                matches.append((found.start(), entry))
+        return [entry for _, entry in sorted(matches, key=lambda m: m[0])]
+
+    def suggest(self, user_input, now=None, count=4):
+        """
+        사용자 입력에 대한 검색 제안 생성
+
+        Args:
+            user_input (str): 사용자 입력
+            now (datetime): 기준 시각 (시간대 규칙용, 기본값 현재 시각)
+            count (int): 제안 개수
+
+        Returns:
+            list: 검색어 리스트
+        """
+        text = (user_input or '').strip()
+        moods = self._match(self.moods, text)
+        genres = self._match(self.genres, text)
+
+        suggestions = []
+
+        def add(query):
+            if query and query.lower() not in (s.lower() for s in suggestions):
+                suggestions.append(query)
+
+        # Mood × genre combinations are the most specific answer
+        for mood in moods[:2]:
+            for genre in genres[:2]:
+                add(f"{mood[1]} {genre[1]}")
+
+        # Round-robin through the matched entries' curated queries
+        matched = moods + genres
+        for i in range(4):
+            for entry in matched:
+                if i < len(entry[3]):
+                    add(entry[3][i])
+
+        # Unmatched prompts are often artist or song names; search them directly
+        if not matched:
+            add(extract_keywords(text))
+
+        if len(suggestions) < count:
+            hour = (now or datetime.now()).hour
+            for start, end, key in TIME_OF_DAY_RULES:
+                if start <= hour < end:
+                    for query in MOOD_LEXICON[key][2]:
+                        add(query)
+                    break
+
+        for query in GENERIC_QUERIES:
+            add(query)
+
+        return suggestions[:count]
@@ -0,0 +1,182 @@
+"""
+Task Pool
+화면 로딩 작업용 공유 스레드 풀 (취소 토큰, 채널별 세대 추적)
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+import config
+
+
+class TaskToken:
+    """작업 취소 토큰 (작업 함수의 첫 번째 인자)
+
+    작업 함수는 페이지/요청 사이에서 cancelled()를 확인해 일찍 끝내고,
+    report()로 중간 결과를 GUI 스레드에 보낼 수 있다.
+    """
+
+    def __init__(self, report):
+        self._event = threading.Event()
+        self._report = report
+
+    def cancel(self):
+        """취소 요청"""
+        self._event.set()
+
+    def cancelled(self):
+        """취소 여부"""
+        return self._event.is_set()
+
+    def report(self, value):
+        """중간 결과 전달 (취소된 작업이면 무시)"""
+        if not self.cancelled():
+            self._report(value)
+
+
+class TaskPool(QObject):
+    """공유 작업 풀
+
+    로드마다 QThread를 만들지 않고 CPU 수 크기의 풀 하나에 작업을 제출한다.
+    같은 채널에 새 작업이 들어오면 이전 작업은 토큰으로 취소되고(시작 전이면
+    풀에서 제거), 채널 세대가 바뀌어 늦게 도착한 결과는 버려진다.
+    콜백은 항상 GUI 스레드에서 호출된다.
+
+    백그라운드 작업(프리페치, 워밍업, 유휴 작업)은 낮은 우선순위 레인으로 제출되어
+    동시에 background_workers개까지만 풀 스레드를 쓰고, 나머지는 차례를 기다린다.
+    화면 로드용 스레드가 항상 남아 있도록 하기 위함이다.
+    """
+
+    _task_event = pyqtSignal(str, int, str, object)  # worker thread -> GUI thread: channel, generation, kind, payload
+
+    def __init__(self, max_workers=config.TASK_POOL_WORKERS,
+                 background_workers=config.TASK_POOL_BACKGROUND_WORKERS):
+        super().__init__()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task")
+        self.generations = {}  # channel -> latest generation
+        self.active = {}       # channel -> (future, token, on_result, on_progress, on_error); future None for background jobs
+        self.background_workers = max(1, min(background_workers, max_workers - 1))
+        self.background_running = 0
+        self.background_queue = deque()  # (channel, generation, token, fn, args) waiting for a background slot
+        self._background_lock = threading.Lock()
+        self.completed = 0
+        self.superseded = 0
+        self.failed = 0
+        self._task_event.connect(self._deliver)
+
+    def submit(self, channel, fn, *args, on_result=None, on_progress=None, on_error=None, background=False):
+        """
+        작업 제출 (같은 채널의 이전 작업은 대체됨)
+
+        Args:
+            channel (str): 작업 채널 (예: 'detail.tracks') - 채널마다 최신 작업의 결과만 전달
+            fn (callable): fn(token, *args) - 풀 스레드에서 실행
+            on_result (callable): 반환값으로 호출
+            on_progress (callable): token.report() 값으로 호출
+            on_error (callable): 예외로 호출
+            background (bool): 낮은 우선순위 레인으로 실행 (동시 실행 수 제한)
+
+        Returns:
+            int: 채널 세대 번호
+        """
+        self.cancel(channel)
+        generation = self.generations.get(channel, 0) + 1
+        self.generations[channel] = generation
+
+        token = TaskToken(lambda value: self._task_event.emit(channel, generation, 'progress', value))
+        future = None
+        if background:
+            with self._background_lock:
+                if self.background_running >= self.background_workers:
+                    self.background_queue.append((channel, generation, token, fn, args))
+                else:
+                    self.background_running += 1
+                    # Future not kept: a background job is cancelled by token only, so the
+                    # slot it holds is always released by _run_background
+                    self.executor.submit(self._run_background, channel, generation, token, fn, args)
+        else:
+            future = self.executor.submit(self._run, channel, generation, token, fn, args)
+        self.active[channel] = (future, token, on_result, on_progress, on_error)
+        return generation
+
+    def busy(self, channel):
+        """채널에 대기/진행 중인 작업이 있는지 확인"""
+        return channel in self.active
+
+    def cancel(self, channel):
+        """채널의 진행 중인 작업 취소 (결과는 버려짐)"""
+        entry = self.active.pop(channel, None)
+        if entry is None:
+            return
+        future, token = entry[:2]
+        token.cancel()
+        if future is not None:
+            future.cancel()
+        self.superseded += 1
+
+    def _run(self, channel, generation, token, fn, args):
+        """풀 스레드에서 작업 실행"""
+        try:
+            result = fn(token, *args)
+        except Exception as e:
+            self._task_event.emit(channel, generation, 'error', e)
+            return
+        if not token.cancelled():
+            self._task_event.emit(channel, generation, 'result', result)
+
+    def _run_background(self, channel, generation, token, fn, args):
+        """백그라운드 레인 작업 실행 후 대기 중인 다음 작업에 슬롯 넘기기"""
+        while True:
+            if not token.cancelled():
+                self._run(channel, generation, token, fn, args)
+            with self._background_lock:
+                # Keep the slot on this thread for the next queued job; cancelled ones are skipped
+                if not self.background_queue:
+                    self.background_running -= 1
+                    return
+                channel, generation, token, fn, args = self.background_queue.popleft()
+
+    def _deliver(self, channel, generation, kind, payload):
+        """결과 전달 (GUI 스레드, 대체된 세대는 무시)"""
+        entry = self.active.get(channel)
+        if entry is None or generation != self.generations.get(channel) or entry[1].cancelled():
+            return
+
+        _, _, on_result, on_progress, on_error = entry
+        if kind == 'progress':
+            if on_progress:
+                on_progress(payload)
+            return
+
+        del self.active[channel]
+        if kind == 'error':
+            self.failed += 1
+            print(f"❌ Task {channel} failed: {payload}")
+            if on_error:
+                on_error(payload)
+            return
+
+        self.completed += 1
+        if on_result:
+            on_result(payload)
+
+    def stats(self):
+        """풀 통계"""
+        return {
+            'active': len(self.active),
+            'background_queued': len(self.background_queue),
+            'completed': self.completed,
+            'superseded': self.superseded,
+            'failed': self.failed,
+        }
+
+    def shutdown(self):
+        """모든 작업 취소 후 실행 중인 작업 종료 대기"""
+        for channel in list(self.active):
+            self.cancel(channel)
+        with self._background_lock:
+            self.background_queue.clear()
+        self.executor.shutdown(wait=True, cancel_futures=True)
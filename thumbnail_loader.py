@@ -0,0 +1,234 @@
+"""
+Thumbnail Loader
+리스트 행 썸네일 - 보이는 범위 기준 요청 스케줄링과 공유 아틀라스
+"""
+
+from collections import OrderedDict
+from functools import partial
+
+from PyQt6.QtCore import QObject, QPoint, QRect, Qt, QTimer
+from PyQt6.QtGui import QColor, QPainter, QPixmap
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+
+import config
+from image_cache import pick_image
+
+
+def entity_images(entity):
+    """행 데이터(Track/Album/Artist/Playlist 레코드)의 이미지 배열"""
+    if entity is None:
+        return ()
+    album = getattr(entity, 'album', None)
+    if album is not None:
+        return album.images
+    return getattr(entity, 'images', ())
+
+
+class ThumbnailAtlas:
+    """썸네일 공유 아틀라스
+
+    썸네일마다 QPixmap을 두지 않고, 큰 픽스맵(페이지)의 격자 칸에 그려 넣는다.
+    모든 칸이 차면 가장 오래 쓰이지 않은 칸을 재사용한다.
+    """
+
+    def __init__(self, cell_size=config.THUMBNAIL_SIZE, grid=config.THUMBNAIL_ATLAS_GRID,
+                 max_pages=config.THUMBNAIL_ATLAS_PAGES):
+        self.cell_size = cell_size
+        self.grid = grid
+        self.max_pages = max_pages
+        self.pages = []
+        self.cells = OrderedDict()  # url -> (page, column, row, width, height), LRU order
+        self.free = []              # (page, column, row) not yet used
+
+    def __contains__(self, url):
+        return url in self.cells
+
+    def lookup(self, url):
+        """
+        썸네일 위치 조회
+
+        Returns:
+            tuple: (페이지 QPixmap, 원본 QRect) - 없으면 None
+        """
+        cell = self.cells.get(url)
+        if cell is None:
+            return None
+        self.cells.move_to_end(url)
+        page, column, row, width, height = cell
+        x = column * self.cell_size
+        y = row * self.cell_size
+        return self.pages[page], QRect(x, y, width, height)
+
+    def add(self, url, pixmap):
+        """썸네일을 빈 칸(또는 LRU 칸)에 그려 넣기"""
+        if url in self.cells or pixmap.isNull():
+            return
+
+        slot = self._allocate()
+        page, column, row = slot
+        width = min(pixmap.width(), self.cell_size)
+        height = min(pixmap.height(), self.cell_size)
+        target = QRect(column * self.cell_size, row * self.cell_size, self.cell_size, self.cell_size)
+
+        painter = QPainter(self.pages[page])
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(target, Qt.GlobalColor.transparent)
+        painter.drawPixmap(target.topLeft(), pixmap, QRect(0, 0, width, height))
+        painter.end()
+
+        self.cells[url] = (page, column, row, width, height)
+
+    def _allocate(self):
+        """빈 칸 할당 (페이지 추가 또는 LRU 재사용)"""
+        if not self.free and len(self.pages) < self.max_pages:
+            side = self.cell_size * self.grid
+            page = QPixmap(side, side)
+            page.fill(Qt.GlobalColor.transparent)
+            self.pages.append(page)
+            index = len(self.pages) - 1
+            self.free = [(index, c, r) for r in range(self.grid) for c in range(self.grid)]
+
+        if self.free:
+            return self.free.pop(0)
+
+        _, (page, column, row, _, _) = self.cells.popitem(last=False)
+        return page, column, row
+
+
+class ThumbnailDelegate(QStyledItemDelegate):
+    """행 왼쪽에 아틀라스의 썸네일을 그리는 델리게이트"""
+
+    PLACEHOLDER = QColor(255, 255, 255, 20)
+
+    def __init__(self, atlas, parent=None):
+        super().__init__(parent)
+        self.atlas = atlas
+
+    def paint(self, painter, option, index):
+        images = entity_images(index.data(Qt.ItemDataRole.UserRole))
+        if not images:
+            super().paint(painter, option, index)
+            return
+
+        side = min(self.atlas.cell_size, option.rect.height() - 8)
+        text_option = QStyleOptionViewItem(option)
+        text_option.rect = option.rect.adjusted(side + 16, 0, 0, 0)
+        super().paint(painter, text_option, index)
+
+        target = QRect(option.rect.left() + 8, option.rect.top() + (option.rect.height() - side) // 2, side, side)
+        found = self.atlas.lookup(pick_image(images, self.atlas.cell_size))
+        if found:
+            page, source = found
+            painter.drawPixmap(target, page, source)
+        else:
+            painter.fillRect(target, self.PLACEHOLDER)
+
+
+class ThumbnailScheduler(QObject):
+    """리스트 보이는 범위 기준 썸네일 요청 스케줄러
+
+    보이는 행을 먼저, 그다음 스크롤 방향으로 THUMBNAIL_LOOKAHEAD행을 요청하고,
+    범위를 벗어난 행의 요청은 취소한다.
+    """
+
+    def __init__(self, view, images, atlas):
+        """
+        Args:
+            view: QListView/QListWidget (UserRole에 레코드 저장)
+            images: ImageCache
+            atlas: ThumbnailAtlas (화면 간 공유)
+        """
+        super().__init__(view)
+        self.view = view
+        self.images = images
+        self.atlas = atlas
+        self.size = atlas.cell_size
+        self.requested = {}  # url -> callback
+        self.last_scroll = 0
+        self.scrolling_down = True
+
+        view.setItemDelegate(ThumbnailDelegate(atlas, view))
+
+        # Coalesce bursts of scroll/model events into one scheduling pass
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(40)
+        self.timer.timeout.connect(self.schedule)
+
+        view.verticalScrollBar().valueChanged.connect(self._handle_scroll)
+        self.watch_model(view.model())
+
+    def watch_model(self, model):
+        """모델 변경 시 다시 스케줄링 (모델을 교체하는 화면은 각 모델을 등록)"""
+        model.modelReset.connect(self.refresh)
+        model.rowsInserted.connect(self.refresh)
+        model.dataChanged.connect(self.refresh)
+
+    def refresh(self, *args):
+        """다음 이벤트 루프에서 스케줄링"""
+        self.timer.start()
+
+    def _handle_scroll(self, value):
+        """스크롤 방향 기록"""
+        self.scrolling_down = value >= self.last_scroll
+        self.last_scroll = value
+        self.timer.start()
+
+    def visible_rows(self):
+        """보이는 행 범위 (first, last) - 행이 없으면 None"""
+        model = self.view.model()
+        count = model.rowCount() if model is not None else 0
+        if not count:
+            return None
+
+        viewport = self.view.viewport()
+        first = self.view.indexAt(QPoint(0, 0)).row()
+        last = self.view.indexAt(QPoint(0, viewport.height() - 1)).row()
+        first = max(0, first)
+        if last < 0:
+            # List ends above the viewport bottom, or is not laid out yet
+            last = first + 50
+        return first, min(last, count - 1)
+
+    def schedule(self):
+        """보이는 행 → 스크롤 방향 미리 보기 순으로 요청, 벗어난 요청 취소"""
+        rows = self.visible_rows()
+        wanted = []
+        if rows:
+            first, last = rows
+            count = self.view.model().rowCount()
+            lookahead = config.THUMBNAIL_LOOKAHEAD
+            ahead = (
+                range(last + 1, min(count, last + 1 + lookahead))
+                if self.scrolling_down
+                else range(first - 1, max(-1, first - 1 - lookahead), -1)
+            )
+            model = self.view.model()
+            seen = set()
+            for row in list(range(first, last + 1)) + list(ahead):
+                images = entity_images(model.index(row, 0).data(Qt.ItemDataRole.UserRole))
+                url = pick_image(images, self.size)
+                if url and url not in self.atlas and url not in seen:
+                    seen.add(url)
+                    wanted.append((url, images))
+
+        wanted_urls = {url for url, _ in wanted}
+        for url in list(self.requested):
+            if url not in wanted_urls:
+                self.images.cancel(url, self.size, self.requested.pop(url))
+
+        for url, images in wanted:
+            if url in self.requested:
+                continue
+            callback = partial(self._handle_loaded, url)
+            self.requested[url] = callback
+            # The atlas keeps the thumbnail, so skip the pixmap LRU
+            pixmap = self.images.request(images, self.size, callback, store=False)
+            if pixmap is not None:
+                self._handle_loaded(url, pixmap)
+
+    def _handle_loaded(self, url, pixmap):
+        """썸네일 도착 - 아틀라스에 넣고 다시 그리기"""
+        self.requested.pop(url, None)
+        self.atlas.add(url, pixmap)
+        self.view.viewport().update()
@@ -0,0 +1,77 @@
+"""
+Track List Model
+TrackTable을 인덱스 순열로 보여주는 Qt 리스트 모델
+"""
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class TrackListModel(QAbstractListModel):
+    """트랙 리스트 모델
+
+    행 데이터를 복사하지 않고, 현재 정렬/필터 순열로 TrackTable 행을 참조한다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.table = None
+        self.order = []
+        self._text_cache = {}
+
+    def set_table(self, table, order=None):
+        """테이블 교체"""
+        self.beginResetModel()
+        self.table = table
+        if order is None:
+            order = table.identity() if table is not None else []
+        self.order = order
+        self._text_cache = {}
+        self.endResetModel()
+
+    def set_order(self, order):
+        """정렬/필터 순열 적용"""
+        self.beginResetModel()
+        self.order = order
+        self.endResetModel()
+
+    def track_at(self, row):
+        """보이는 행의 Track 레코드"""
+        if self.table is None or not 0 <= row < len(self.order):
+            return None
+        return self.table.tracks[int(self.order[row])]
+
+    def visible_tracks(self):
+        """현재 순서대로 보이는 Track 레코드 리스트"""
+        if self.table is None:
+            return []
+        return self.table.tracks_for(self.order)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.order)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or self.table is None:
+            return None
+
+        source_row = int(self.order[index.row()])
+        track = self.table.tracks[source_row]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            text = self._text_cache.get(source_row)
+            if text is None:
+                duration_min = track.duration_ms // 60000
+                duration_sec = (track.duration_ms % 60000) // 1000
+                # Numbering follows the original position so sorted views still show track order
+                text = (
+                    f"{source_row + 1}. {track.name}\n"
+                    f"   👤 {track.artist_names} | ⏱ {duration_min}:{duration_sec:02d}"
+                )
+                self._text_cache[source_row] = text
+            return text
+
+        if role == Qt.ItemDataRole.UserRole:
+            return track
+
+        return None
@@ -0,0 +1,130 @@
+"""
+Track Table
+트랙 목록의 열 기반(columnar) 테이블 - 정렬/필터/집계를 벡터 연산으로 처리
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+
+def _parse_timestamp(value):
+    """ISO 8601 added_at 문자열 → epoch 초 (없으면 0)"""
+    if not value:
+        return 0
+    try:
+        return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+    except ValueError:
+        return 0
+
+
+def _rank(keys):
+    """문자열 키를 정렬 순위(int32)로 변환 - 이후 정렬은 정수 argsort로 처리"""
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    ranks = np.empty(len(keys), dtype=np.int32)
+    rank = -1
+    previous = None
+    for position, row in enumerate(order):
+        if position == 0 or keys[row] != previous:
+            rank += 1
+            previous = keys[row]
+        ranks[row] = rank
+    return ranks
+
+
+class TrackTable:
+    """트랙 목록 열 저장소
+
+    숫자 열(재생 시간, 인기도, 추가 시각)은 NumPy 배열로, 문자열 열은
+    대소문자 무시 정렬 순위와 검색용 casefold 문자열로 미리 계산해 둔다.
+    정렬/필터 결과는 행 복사 없이 인덱스 순열(np.ndarray)로 반환한다.
+    """
+
+    SORT_KEYS = ('position', 'title', 'artist', 'duration', 'added_at')
+
+    def __init__(self, tracks, added_at=None):
+        """
+        Args:
+            tracks (list): Track 레코드 리스트 (원래 순서)
+            added_at (list): 트랙별 added_at ISO 문자열 (플레이리스트만, 선택)
+        """
+        self.tracks = tracks
+        count = len(tracks)
+
+        self.durations = np.fromiter((t.duration_ms for t in tracks), dtype=np.int64, count=count)
+        self.popularity = np.fromiter((t.popularity or 0 for t in tracks), dtype=np.int16, count=count)
+        if added_at:
+            self.added_at = np.fromiter((_parse_timestamp(v) for v in added_at), dtype=np.int64, count=count)
+        else:
+            self.added_at = np.zeros(count, dtype=np.int64)
+
+        titles = [t.name.casefold() for t in tracks]
+        artists = [t.artist_names.casefold() for t in tracks]
+        self.title_rank = _rank(titles)
+        self.artist_rank = _rank(artists)
+
+        # Fixed-width unicode column so substring filtering runs in NumPy's C loop
+        haystack = [f"{title}\t{artist}\t{t.album_name.casefold()}" for title, artist, t in zip(titles, artists, tracks)]
+        self.search_text = np.array(haystack, dtype=str) if haystack else np.array([], dtype='<U1')
+
+    def __len__(self):
+        return len(self.tracks)
+
+    def identity(self):
+        """원래 순서의 인덱스 순열"""
+        return np.arange(len(self.tracks), dtype=np.int64)
+
+    def sort(self, key='position', descending=False, indices=None):
+        """
+        정렬된 인덱스 순열 반환
+
+        Args:
+            key (str): SORT_KEYS 중 하나
+            descending (bool): 내림차순 여부
+            indices (np.ndarray): 정렬할 행 (기본값 전체, 필터 결과 등)
+
+        Returns:
+            np.ndarray: 행 인덱스 순열
+        """
+        indices = self.identity() if indices is None else indices
+        if key == 'position':
+            column = indices
+        else:
+            column = {
+                'title': self.title_rank,
+                'artist': self.artist_rank,
+                'duration': self.durations,
+                'added_at': self.added_at,
+            }[key][indices]
+
+        order = np.argsort(-column if descending else column, kind='stable')
+        return indices[order]
+
+    def filter(self, text, indices=None):
+        """
+        제목/아티스트/앨범에 text가 포함된 행만 남긴 순열 반환 (대소문자 무시)
+
+        Args:
+            text (str): 검색어
+            indices (np.ndarray): 대상 행 순열 (순서 유지)
+
+        Returns:
+            np.ndarray: 행 인덱스 순열
+        """
+        indices = self.identity() if indices is None else indices
+        needle = (text or '').strip().casefold()
+        if not needle or not len(indices):
+            return indices
+
+        mask = np.char.find(self.search_text[indices], needle) >= 0
+        return indices[mask]
+
+    def total_duration_ms(self, indices=None):
+        """총 재생 시간 (밀리초)"""
+        if indices is None:
+            return int(self.durations.sum())
+        return int(self.durations[indices].sum())
+
+    def tracks_for(self, indices):
+        """순열 순서대로 Track 레코드 리스트"""
+        return [self.tracks[i] for i in indices]
@@ -0,0 +1,223 @@
+"""
+Track Window
+매우 큰 플레이리스트를 화면 주변 페이지만 불러오는 윈도우 방식 리스트 모델
+"""
+
+from collections import OrderedDict
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+import config
+
+
+def fetch_page_task(token, spotify, playlist_id, page, page_size):
+    """
+    플레이리스트 한 페이지를 offset으로 불러오는 작업 (공유 풀에서 실행)
+
+    Returns:
+        tuple: (페이지 번호, Track 리스트)
+
+    Raises:
+        RuntimeError: 요청한 페이지가 비어 있음 (모델은 범위 안의 페이지만 요청하므로 실패로 처리)
+    """
+    entities = spotify.entities
+    items = spotify.get_playlist_tracks(playlist_id, limit=page_size, offset=page * page_size)
+    if not items:
+        # get_playlist_tracks reports errors as []; an in-range page is never empty
+        raise RuntimeError(f"playlist page {page} came back empty")
+    # Keep unavailable items as None so rows stay aligned with playlist offsets
+    return page, [entities.track(item) if item else None for item in items]
+
+
+class WindowedTrackModel(QAbstractListModel):
+    """윈도우 방식 트랙 리스트 모델
+
+    rowCount는 플레이리스트 전체 길이를 반환해 스크롤 위치/점프가 전체 목록처럼
+    동작하고, 실제 데이터는 보이는 페이지와 스크롤 방향의 이웃 페이지만 유지한다.
+    멀리 떨어진 페이지는 LRU 순서로 해제한다.
+    """
+
+    CHANNEL = 'detail.window'
+
+    def __init__(self, spotify_manager, task_pool, parent=None):
+        super().__init__(parent)
+        self.spotify = spotify_manager
+        self.tasks = task_pool
+        self.page_size = config.PLAYLIST_PAGE_SIZE
+        self.max_pages = config.PLAYLIST_WINDOW_MAX_PAGES
+        self.playlist_id = None
+        self.total = 0
+        self.pages = OrderedDict()  # page -> list of Track (LRU order)
+        self.pending = []           # pages waiting to be fetched, most urgent first
+        self.visible_pages = set()
+        self.last_first_row = 0
+        self.fetching = False
+        self.fetching_page = None
+        self.failed = set()         # pages that failed since the last viewport update
+
+    def set_playlist(self, playlist_id, total):
+        """새 플레이리스트로 교체 (진행 중인 페이지 결과는 폐기)"""
+        self.beginResetModel()
+        self.tasks.cancel(self.CHANNEL)
+        self.fetching = False
+        self.fetching_page = None
+        self.playlist_id = playlist_id
+        self.total = max(0, total)
+        self.pages.clear()
+        self.pending = []
+        self.failed = set()
+        self.visible_pages = set()
+        self.last_first_row = 0
+        self.endResetModel()
+
+    def clear(self):
+        """모델 비우기"""
+        self.set_playlist(None, 0)
+
+    def page_of(self, row):
+        """행이 속한 페이지 번호"""
+        return row // self.page_size
+
+    def page_count(self):
+        """전체 페이지 수"""
+        return (self.total + self.page_size - 1) // self.page_size
+
+    def track_at(self, row):
+        """행의 Track 레코드 (페이지가 아직 없으면 None)"""
+        page = self.pages.get(self.page_of(row))
+        if page is None:
+            return None
+        offset = row % self.page_size
+        return page[offset] if offset < len(page) else None
+
+    def visible_tracks(self):
+        """현재 메모리에 있는 트랙 (행 순서)"""
+        tracks = []
+        for page in sorted(self.pages):
+            tracks.extend(t for t in self.pages[page] if t is not None)
+        return tracks
+
+    def update_viewport(self, first_row, last_row):
+        """
+        보이는 행 범위 갱신 - 보이는 페이지와 스크롤 방향 이웃 페이지를 요청
+
+        Args:
+            first_row (int): 첫 번째로 보이는 행
+            last_row (int): 마지막으로 보이는 행
+        """
+        if not self.playlist_id or not self.total:
+            return
+
+        first_row = max(0, min(first_row, self.total - 1))
+        last_row = max(first_row, min(last_row, self.total - 1))
+        first_page = self.page_of(first_row)
+        last_page = self.page_of(last_row)
+        self.visible_pages = set(range(first_page, last_page + 1))
+
+        wanted = list(range(first_page, last_page + 1))
+        prefetch = config.PLAYLIST_WINDOW_PREFETCH
+        if first_row >= self.last_first_row:
+            wanted += [last_page + i for i in range(1, prefetch + 1)]
+        else:
+            wanted += [first_page - i for i in range(1, prefetch + 1)]
+        self.last_first_row = first_row
+
+        wanted = [p for p in wanted if 0 <= p < self.page_count()]
+        for page in wanted:
+            if page in self.pages:
+                self.pages.move_to_end(page)
+
+        # Replace the queue: pages the user has scrolled past are no longer worth fetching.
+        # Failed pages stay queued and are retried from the next viewport update.
+        self.pending = [p for p in wanted if p not in self.pages]
+        self.failed = set()
+        self._fetch_next()
+
+    def _fetch_next(self):
+        """대기 중인 다음 페이지 요청 (한 번에 하나씩)"""
+        if self.fetching:
+            return
+        self.pending = [p for p in self.pending if p not in self.pages]
+        page = next((p for p in self.pending if p not in self.failed), None)
+        if page is None:
+            return
+
+        self.pending.remove(page)
+        self.fetching = True
+        self.fetching_page = page
+        # Switching playlists cancels the channel, so a late page never lands in the new one
+        self.tasks.submit(
+            self.CHANNEL, fetch_page_task, self.spotify, self.playlist_id, page, self.page_size,
+            on_result=self._handle_page, on_error=self._handle_error,
+        )
+
+    def _handle_page(self, result):
+        """페이지 도착 처리"""
+        page, tracks = result
+        self.fetching = False
+        self.fetching_page = None
+        self.pages[page] = tracks
+        self.pages.move_to_end(page)
+        self._evict()
+
+        first = page * self.page_size
+        last = min(first + self.page_size, self.total) - 1
+        if last >= first:
+            self.dataChanged.emit(self.index(first), self.index(last))
+
+        self._fetch_next()
+
+    def _handle_error(self, error):
+        """페이지 요청 실패 - 페이지를 저장하지 않고 대기열에 남긴 채 다음 페이지로 진행"""
+        page = self.fetching_page
+        self.fetching = False
+        self.fetching_page = None
+        if page is not None:
+            self.failed.add(page)
+            if page not in self.pending:
+                self.pending.append(page)
+        self._fetch_next()
+
+    def _evict(self):
+        """보이지 않는 오래된 페이지부터 해제"""
+        for page in list(self.pages):
+            if len(self.pages) <= self.max_pages:
+                break
+            if page not in self.visible_pages:
+                del self.pages[page]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.total
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        track = self.track_at(row)
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if track is None:
+                # Same two-line shape as a loaded row so uniform item sizes hold
+                loading = self.page_of(row) not in self.pages
+                return f"{row + 1}. {'⏳ Loading…' if loading else 'Unavailable'}\n   "
+            duration_min = track.duration_ms // 60000
+            duration_sec = (track.duration_ms % 60000) // 1000
+            return (
+                f"{row + 1}. {track.name}\n"
+                f"   👤 {track.artist_names} | ⏱ {duration_min}:{duration_sec:02d}"
+            )
+
+        if role == Qt.ItemDataRole.UserRole:
+            return track
+
+        return None
+
+    def stop(self):
+        """대기/진행 중인 페이지 요청 취소"""
+        self.pending = []
+        self.tasks.cancel(self.CHANNEL)
+        self.fetching = False
+        self.fetching_page = None
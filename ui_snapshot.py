@@ -0,0 +1,115 @@
+"""
+UI Snapshot
+화면 상태를 종료 시/주기적으로 저장하고 부팅 직후 네트워크 전에 복원
+"""
+
+import time
+
+from PyQt6.QtCore import QObject, QTimer
+
+import config
+from storage import load_blob, save_blob
+
+SNAPSHOT_VERSION = 2  # 2: zlib-compressed JSON (records exported as Spotify-shaped dicts)
+
+
+def list_position(screen, list_widget):
+    """화면 스크롤 위치와 리스트 선택 행"""
+    return {
+        'row': list_widget.currentRow(),
+        'scroll': screen.scroll_area.verticalScrollBar().value(),
+    }
+
+
+def restore_list_position(screen, list_widget, position):
+    """저장된 선택 행/스크롤 위치 복원 (레이아웃이 끝난 뒤 스크롤 적용)"""
+    if not position:
+        return
+    row = position.get('row', -1)
+    if 0 <= row < list_widget.count():
+        list_widget.setCurrentRow(row)
+    scroll = position.get('scroll', 0)
+    QTimer.singleShot(0, lambda: screen.scroll_area.verticalScrollBar().setValue(scroll))
+
+
+class UISnapshot(QObject):
+    """화면 상태 스냅샷
+
+    각 화면의 snapshot_state()를 모아 zlib 압축 JSON 한 파일로 저장하고, 부팅 시 한 번의
+    read로 읽어 restore_state()로 돌려준다. 레코드는 EntityStore.export()로 dict가 되어
+    저장되고 복원 시 같은 파서로 다시 만들어진다. 복원된 화면은 stale로 표시되고, 다음
+    로드/워밍업이 최신 데이터로 교체한다.
+    """
+
+    def __init__(self, app, filename=config.UI_SNAPSHOT_FILE):
+        super().__init__()
+        self.app = app
+        self.filename = filename
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.save)
+
+    def screens(self):
+        """스냅샷 대상 화면 (키 → 화면)"""
+        app = self.app
+        return {
+            'playlists': app.playlist_screen,
+            'albums': app.album_screen,
+            'artists': app.artist_screen,
+            'search': app.search_screen,
+            'player': app.player_screen,
+        }
+
+    def capture(self):
+        """현재 화면 상태 수집"""
+        screen = self.app.stacked_widget.currentIndex()
+        if screen == 7:
+            # The detail screen reloads from the network; come back to where it was opened from
+            detail = self.app.detail_screen
+            screen = detail.return_screen if detail.return_screen is not None else {
+                'playlist': 3, 'album': 4, 'artist': 5,
+            }.get(detail.current_type, 0)
+
+        return {
+            'version': SNAPSHOT_VERSION,
+            'saved_at': time.time(),
+            'screen': screen,
+            'states': {key: widget.snapshot_state() for key, widget in self.screens().items()},
+        }
+
+    def save(self):
+        """스냅샷 저장"""
+        save_blob(self.filename, self.capture())
+
+    def restore(self):
+        """
+        저장된 스냅샷 복원 (첫 프레임 전에 호출)
+
+        Returns:
+            bool: 복원 여부
+        """
+        snapshot = load_blob(self.filename)
+        if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+            return False
+        if time.time() - snapshot.get('saved_at', 0) > config.UI_SNAPSHOT_MAX_AGE:
+            return False
+
+        states = snapshot.get('states') or {}
+        for key, widget in self.screens().items():
+            if states.get(key):
+                try:
+                    widget.restore_state(states[key])
+                except Exception as e:
+                    print(f"⚠️  Failed to restore {key} screen: {e}")
+
+        self.app.navigate_to(snapshot.get('screen', 0))
+        print("📦 Restored UI snapshot (stale until revalidated)")
+        return True
+
+    def start(self):
+        """주기적 저장 시작"""
+        self.timer.start(config.UI_SNAPSHOT_INTERVAL)
+
+    def stop(self):
+        """주기적 저장 중단 후 마지막 상태 저장"""
+        self.timer.stop()
+        self.save()